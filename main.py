@@ -10,6 +10,7 @@ from PyQt6.QtCore import Qt
 from src.gui_components.header import HeaderComponent
 from src.gui_components.search import SearchControls
 from src.gui_components.result import ResultsSection
+from src.gui_components.general_config import gui_config
 from src.database.models import SessionLocal, ApplicationDetail
 from src.service.searchservice import SearchService
 from src.service.threadservice import PreprocessThread, SearchThread
@@ -21,6 +22,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Applicant Tracking System")
         self.setGeometry(100, 100, 1280, 720)
+        self._cancelled_searches = []
         self.setup_ui()
         self.db = SessionLocal()
         self.cv_count = self.db.query(ApplicationDetail).count()
@@ -30,7 +32,8 @@ class MainWindow(QMainWindow):
         self.encryptor = EncryptService()
         set_encrypt_service(self.encryptor)
         self.encryptor.encrypt()
-        self.service = SearchService()
+        self.service = SearchService(use_jit=gui_config.search.use_jit_kernels,
+                                     warm_up_jit=gui_config.search.warm_up_jit_kernels)
         set_search_service(self.service)
         
         self.preprocess_cvs()
@@ -86,6 +89,8 @@ class MainWindow(QMainWindow):
         
         # Initialize search service and connect signals
         self.search_section.search_requested.connect(self.on_search)
+        # Editing the query abandons the search that is still running for the old one
+        self.search_section.keywords_input.textChanged.connect(self.cancel_search)
 
         # Apply application-wide styling
         self.setStyleSheet("""
@@ -181,6 +186,14 @@ class MainWindow(QMainWindow):
         algorithm = search_params['algorithm']
         top_k = search_params['top_matches']
         case_sensitive = search_params['case_sensitive']
+        scoring = search_params.get('scoring', 'count')
+        time_budget = search_params.get('time_budget')
+        whole_words = search_params.get('whole_words', False)
+
+        # A new query preempts the running one instead of queueing behind it
+        self.cancel_search()
+        if hasattr(self, 'search_progress'):
+            self.search_progress.close()
         
         # Update UI with visual feedback
         self.search_section.set_search_enabled(False)
@@ -204,7 +217,8 @@ class MainWindow(QMainWindow):
         self.search_progress = QProgressDialog("Searching CVs...", "Cancel", 0, 100, self)
         self.search_progress.setWindowTitle(f"Searching for: {keywords}")
         self.search_progress.setMinimumDuration(0)
-        self.search_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        # Non-modal so the user can keep editing the query, which preempts this search
+        self.search_progress.setWindowModality(Qt.WindowModality.NonModal)
         self.search_progress.setStyleSheet("""
             QProgressDialog {
                 background-color: white;
@@ -226,15 +240,32 @@ class MainWindow(QMainWindow):
         
         # Create and start search thread using the imported class
         self.search_thread = SearchThread(
-            self.service, keywords, algorithm, top_k, case_sensitive
+            self.service, keywords, algorithm, top_k, case_sensitive, scoring, time_budget, whole_words
         )
         self.search_thread.progress.connect(self.search_progress.setValue)
         self.search_thread.results_ready.connect(self.on_search_completed)
+        self.search_progress.canceled.connect(self.search_thread.cancel)
         self.search_thread.start()
 
+    def cancel_search(self):
+        """Cancel the running search, if any"""
+        search_thread = getattr(self, 'search_thread', None)
+        if search_thread is not None and search_thread.isRunning():
+            search_thread.cancel()
+            # Keep a reference until it winds down, a QThread must not be destroyed while running
+            self._cancelled_searches.append(search_thread)
+            search_thread.finished.connect(lambda: self._cancelled_searches.remove(search_thread))
+
     def on_search_completed(self, total, elapsed, results):
         """Handle completion of search"""
+        # Results from a search that was preempted by a newer query are stale
+        if self.sender() is not self.search_thread:
+            return
+
         self.search_section.set_search_enabled(True)
+        # Read before closing the dialog, closing it emits canceled()
+        cancelled = self.search_thread.is_cancelled()
+        timed_out = self.search_thread.timed_out()
         
         # Close the progress dialog
         if hasattr(self, 'search_progress'):
@@ -247,7 +278,17 @@ class MainWindow(QMainWindow):
         )
         
         # Update status
-        if results:
+        if timed_out:
+            self.update_status(
+                f"Search stopped at its {elapsed:.2f} second time limit. Showing {len(results)} partial matches.",
+                "warning"
+            )
+        elif cancelled:
+            self.update_status(
+                f"Search cancelled after {elapsed:.2f} seconds. Showing {len(results)} partial matches.",
+                "warning"
+            )
+        elif results:
             self.update_status(
                 f"Found {len(results)} matches among {total} CVs in {elapsed:.2f} seconds.", 
                 "success"
@@ -291,14 +332,20 @@ class MainWindow(QMainWindow):
         self.preprocess_thread = PreprocessThread(self.service)
         self.preprocess_thread.progress.connect(self.preprocess_progress.setValue)
         self.preprocess_thread.finished.connect(self.on_preprocessing_finished)
+        self.preprocess_progress.canceled.connect(self.preprocess_thread.cancel)
         self.preprocess_thread.start()
         
     def on_preprocessing_finished(self, count, elapsed):
+        cancelled = self.preprocess_thread.is_cancelled()
+
         # Close the progress dialog
         if hasattr(self, 'preprocess_progress'):
             self.preprocess_progress.close()
         
-        self.update_status(f"Ready to search", "info")
+        if cancelled:
+            self.update_status(f"Preprocessing cancelled, remaining CVs are parsed on demand", "warning")
+        else:
+            self.update_status(f"Ready to search", "info")
         self.update_cv_count(count, True)
 
 if __name__ == "__main__":
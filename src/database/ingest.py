@@ -115,6 +115,10 @@ def seed_from_csv():
             
             db.commit()
             print(f"Created {application_count} application details.")
+
+            # Imported lazily, the service layer depends on this package
+            from ..service.service_provider import notify_corpus_changed
+            notify_corpus_changed()
             
             return True
             
@@ -40,7 +40,8 @@ def prepare_texts_from_pdf(pdf_path: str) -> tuple[str, str] | None:
     
     regex_text = extregex_text(pdf_path)
 
-    text_for_pattern = raw_text.replace('\n', ' ').replace('\r', ' ').strip().lower()
+    # Case is kept so case-sensitive search works; the search engine keeps its own lowercase view
+    text_for_pattern = raw_text.replace('\n', ' ').replace('\r', ' ').strip()
 
     return regex_text, text_for_pattern
 
@@ -131,13 +131,30 @@ class SearchConfig:
         "Boyer-Moore Simple",
         "Boyer-Moore Complex",
         "Aho-Corasick",
-        "Fuzzy Search"
+        "Native (bytes.find)",
+        "Suffix Array",
+        "Shift-Or (bit-parallel)",
+        "Wu-Manber (keyword lists)",
+        "Rabin-Karp (NumPy hashes)",
+        "Regex (C re module)",
+        "Auto (fastest for the query)",
+        "Fuzzy Search",
+        "Hybrid (Exact + Fuzzy)"
     )
     
     # Search parameters
     default_top_matches: int = 10
     max_top_matches: int = 1000
     default_case_sensitive: bool = False
+    default_whole_words: bool = False
+    default_scoring: str = "Occurrences"
+    available_scoring_modes: tuple = (
+        "Occurrences",
+        "Relevance (BM25)"
+    )
+    search_time_budget: float = 10.0  # seconds before a search returns partial results, 0 = no limit
+    use_jit_kernels: bool = False  # numba kernels for KMP, Boyer-Moore and fuzzy search, if numba is installed
+    warm_up_jit_kernels: bool = True  # compile them at startup rather than during the first search
     
     # Button configurations
     search_button_text: str = "🔍 Start Search"
@@ -77,7 +77,9 @@ class ConfigurableResultCard(QFrame):
         name_label.setFont(name_font)
         
         # Matches count
-        matches_label = QLabel(f"Matches: {self.score}")
+        # Relevance ranking produces fractional scores, occurrence ranking plain counts
+        score_text = f"Relevance: {self.score:.2f}" if isinstance(self.score, float) else f"Matches: {self.score}"
+        matches_label = QLabel(score_text)
         matches_label.setObjectName("matchesLabel")
         matches_font = QFont(self.gui_config.fonts.family_primary)
         matches_font.setPointSize(self.gui_config.fonts.size_small)
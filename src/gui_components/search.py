@@ -6,6 +6,12 @@ from PyQt6.QtGui import QFont # type: ignore
 from typing import Optional, List, Dict, Any
 from .general_config import gui_config, SearchConfig
 
+# Ranking combo labels -> SearchService scoring modes
+SCORING_MODES = {
+    "Occurrences": "count",
+    "Relevance (BM25)": "bm25",
+}
+
 
 class ConfigurableSearchControls(QWidget):
     """Highly configurable search controls section for keywords, algorithm selection, and search parameters."""
@@ -34,6 +40,8 @@ class ConfigurableSearchControls(QWidget):
         self.algorithm_info: Optional[QLabel] = None
         self.top_matches_spin: Optional[QSpinBox] = None
         self.case_sensitive_combo: Optional[QComboBox] = None
+        self.whole_words_combo: Optional[QComboBox] = None
+        self.scoring_combo: Optional[QComboBox] = None
         self.search_btn: Optional[QPushButton] = None
         
         self.setup_ui()
@@ -193,6 +201,26 @@ class ConfigurableSearchControls(QWidget):
         if self.config.default_case_sensitive:
             self.case_sensitive_combo.setCurrentText("Yes")
 
+        # Whole word option
+        whole_words_label = QLabel("Whole Words:")
+        whole_words_label.setObjectName("wholeWordsLabel")
+
+        self.whole_words_combo = QComboBox()
+        self.whole_words_combo.setObjectName("wholeWordsCombo")
+        self.whole_words_combo.addItems(["No", "Yes"])
+
+        if self.config.default_whole_words:
+            self.whole_words_combo.setCurrentText("Yes")
+
+        # Ranking mode
+        scoring_label = QLabel("Ranking:")
+        scoring_label.setObjectName("scoringLabel")
+
+        self.scoring_combo = QComboBox()
+        self.scoring_combo.setObjectName("scoringCombo")
+        self.scoring_combo.addItems(list(self.config.available_scoring_modes))
+        self.scoring_combo.setCurrentText(self.config.default_scoring)
+
         # Add search button to algorithm frame
         button_layout = QHBoxLayout()
         self.search_btn = QPushButton(self.config.search_button_text)
@@ -207,6 +235,10 @@ class ConfigurableSearchControls(QWidget):
         params_row.addWidget(self.top_matches_spin)
         params_row.addWidget(case_label)
         params_row.addWidget(self.case_sensitive_combo)
+        params_row.addWidget(whole_words_label)
+        params_row.addWidget(self.whole_words_combo)
+        params_row.addWidget(scoring_label)
+        params_row.addWidget(self.scoring_combo)
         params_row.addStretch(1)
         params_row.addLayout(button_layout)
         
@@ -295,7 +327,7 @@ class ConfigurableSearchControls(QWidget):
         
         # ComboBox and SpinBox styles
         control_style = f"""
-        QComboBox#algorithmCombo, QComboBox#caseSensitiveCombo, QSpinBox#topMatchesSpin  {{
+        QComboBox#algorithmCombo, QComboBox#caseSensitiveCombo, QComboBox#wholeWordsCombo, QComboBox#scoringCombo, QSpinBox#topMatchesSpin  {{
             border: {self.gui_config.spacing.border_width_thin}px solid {self.gui_config.colors.border_medium};
             border-radius: {self.gui_config.spacing.border_radius_medium}px;
             padding: {self.gui_config.spacing.padding_medium}px;
@@ -306,13 +338,13 @@ class ConfigurableSearchControls(QWidget):
             min-width: 120px;
         }}
 
-        QComboBox#algorithmCombo QAbstractItemView, QComboBox#caseSensitiveCombo QAbstractItemView {{
+        QComboBox#algorithmCombo QAbstractItemView, QComboBox#caseSensitiveCombo QAbstractItemView, QComboBox#wholeWordsCombo QAbstractItemView, QComboBox#scoringCombo QAbstractItemView {{
             background-color: {self.gui_config.colors.bg_primary};
             selection-background-color: {self.gui_config.colors.bg_primary};
             selection-color: {self.gui_config.colors.text_primary};
         }}
 
-        QComboBox#algorithmCombo:focus, QComboBox#caseSensitiveCombo:focus, QSpinBox#topMatchesSpin:focus  {{
+        QComboBox#algorithmCombo:focus, QComboBox#caseSensitiveCombo:focus, QComboBox#wholeWordsCombo:focus, QComboBox#scoringCombo:focus, QSpinBox#topMatchesSpin:focus  {{
             border: {self.gui_config.spacing.border_width_medium}px solid {self.gui_config.colors.secondary};
         }}
         
@@ -368,6 +400,11 @@ class ConfigurableSearchControls(QWidget):
             return ""
         return self.keywords_input.text().strip()
     
+    def get_scoring_mode(self) -> str:
+        """Get the selected ranking mode as a SearchService scoring name."""
+        label = self.scoring_combo.currentText() if self.scoring_combo else self.config.default_scoring
+        return SCORING_MODES.get(label, "count")
+    
     def update_algorithm_info(self, algorithm: str) -> None:
         """Update algorithm information display."""
         if not self.algorithm_info:
@@ -378,7 +415,15 @@ class ConfigurableSearchControls(QWidget):
             "Boyer-Moore Simple": "ℹ️ Boyer-Moore Simple: Uses bad character heuristic for fast pattern matching",
             "Boyer-Moore Complex": "ℹ️ Boyer-Moore Complex: Uses both bad character and good suffix heuristics for optimal performance",
             "Aho-Corasick": "ℹ️ Aho-Corasick: Optimal for multiple pattern matching, finds all patterns simultaneously",
-            "Fuzzy Search": "ℹ️ Fuzzy Search: Finds approximate matches using edit distance, great for typos and variations"
+            "Suffix Array": "ℹ️ Suffix Array: Counts any substring with a binary search over an index built during preprocessing, no text scan",
+            "Native (bytes.find)": "ℹ️ Native: Python's built-in C substring search on an ASCII bytes copy of each CV, the fastest exact option",
+            "Shift-Or (bit-parallel)": "ℹ️ Shift-Or: Tracks every partial match as one bit of an integer, several short keywords in a single pass",
+            "Wu-Manber (keyword lists)": "ℹ️ Wu-Manber: Skips ahead by blocks of characters no keyword contains, fast for long lists of 4+ letter keywords",
+            "Rabin-Karp (NumPy hashes)": "ℹ️ Rabin-Karp: Hashes every window of each keyword length with NumPy and checks all keywords of that length at once",
+            "Regex (C re module)": "ℹ️ Regex: All keywords as one compiled alternation, scanned by Python's C regex engine",
+            "Auto (fastest for the query)": "ℹ️ Auto: Picks the exact algorithm with the lowest estimated cost for the keywords and each CV's length",
+            "Fuzzy Search": "ℹ️ Fuzzy Search: Finds approximate matches using edit distance, great for typos and variations",
+            "Hybrid (Exact + Fuzzy)": "ℹ️ Hybrid: Exact search first, then fuzzy search only for keywords no CV contains exactly"
         }
         
         self.algorithm_info.setText(info_map.get(algorithm, "ℹ️ Select an algorithm to see information"))
@@ -401,7 +446,10 @@ class ConfigurableSearchControls(QWidget):
             'keywords': keywords,
             'algorithm': self.algorithm_combo.currentText() if self.algorithm_combo else self.config.default_algorithm,
             'top_matches': self.top_matches_spin.value() if self.top_matches_spin else self.config.default_top_matches,
-            'case_sensitive': (self.case_sensitive_combo.currentText() == "Yes") if self.case_sensitive_combo else self.config.default_case_sensitive
+            'case_sensitive': (self.case_sensitive_combo.currentText() == "Yes") if self.case_sensitive_combo else self.config.default_case_sensitive,
+            'whole_words': (self.whole_words_combo.currentText() == "Yes") if self.whole_words_combo else self.config.default_whole_words,
+            'scoring': self.get_scoring_mode(),
+            'time_budget': self.config.search_time_budget or None
         }
         
         self.search_requested.emit(search_params)
@@ -423,7 +471,10 @@ class ConfigurableSearchControls(QWidget):
             'keywords': self.get_keywords(),
             'algorithm': self.algorithm_combo.currentText() if self.algorithm_combo else self.config.default_algorithm,
             'top_matches': self.top_matches_spin.value() if self.top_matches_spin else self.config.default_top_matches,
-            'case_sensitive': (self.case_sensitive_combo.currentText() == "Yes") if self.case_sensitive_combo else self.config.default_case_sensitive
+            'case_sensitive': (self.case_sensitive_combo.currentText() == "Yes") if self.case_sensitive_combo else self.config.default_case_sensitive,
+            'whole_words': (self.whole_words_combo.currentText() == "Yes") if self.whole_words_combo else self.config.default_whole_words,
+            'scoring': self.get_scoring_mode(),
+            'time_budget': self.config.search_time_budget or None
         }
     
     def set_keywords(self, keywords: str) -> None:
@@ -27,9 +27,17 @@ The package includes two categories of algorithms:
 - Boyer-Moore Simple: Uses bad character heuristic only
 - Boyer-Moore Complex: Uses both bad character and good suffix heuristics
 - Aho-Corasick: Optimal for multiple pattern matching
+- Native: Built-in C substring search (str.find / bytes.find), fastest in practice
+- Suffix Array: Counts and locates any substring in O(m log n) from a per-document index
+- Shift-Or: Bit-parallel, packs several short patterns into one integer state per pass
+- Wu-Manber: Multi-pattern block-shift skipping, for large keyword lists
+- Rabin-Karp: NumPy rolling hashes, all keywords of one length per array pass
+- Regex: One escaped alternation run by the C `re` engine, the baseline to benchmark against
 
 **Fuzzy Search Algorithm** (approximate matching):
 - Edit Distance Based: Finds similar patterns using Levenshtein distance
+- SymSpellIndex: Resolves a word to similar vocabulary terms via symmetric deletes,
+  so they can be counted with an exact multi-pattern search
 
 Core Classes and Functions
 --------------------------
@@ -95,7 +103,8 @@ SearchConfig allows fine-tuning of search behavior:
     ...     max_results=100,               # Limit number of results
     ...     exact_algorithm=AlgorithmType.KMP,  # Choose exact algorithm
     ...     fuzzy_min_similarity=0.8,     # Minimum similarity for fuzzy matches
-    ...     use_fuzzy_fallback=True       # Enable automatic fallback to fuzzy search
+    ...     use_fuzzy_fallback=True,      # Enable automatic fallback to fuzzy search
+    ...     per_pattern_fallback=True     # Fuzzy only for patterns without exact hits
     ... )
 
 Available exact algorithms:
@@ -103,6 +112,13 @@ Available exact algorithms:
 - AlgorithmType.BOYER_MOORE_SIMPLE
 - AlgorithmType.BOYER_MOORE_COMPLEX
 - AlgorithmType.AHO_CORASICK
+- AlgorithmType.NATIVE
+- AlgorithmType.SUFFIX_ARRAY
+- AlgorithmType.SHIFT_OR
+- AlgorithmType.WU_MANBER
+- AlgorithmType.RABIN_KARP
+- AlgorithmType.REGEX
+- AlgorithmType.AUTO (picks one of the above per query and document)
 
 Performance Guidelines
 ----------------------
@@ -112,8 +128,14 @@ Performance Guidelines
 - **Single pattern, small text**: KMP or Boyer-Moore
 - **Single pattern, large text**: Boyer-Moore Complex
 - **Multiple patterns**: Aho-Corasick (optimal choice)
+- **Hundreds of keywords, all 4+ characters**: Wu-Manber
+- **Many keywords of a few lengths, long documents**: Rabin-Karp
+- **Production baseline, up to a few dozen keywords**: Regex (one pass of the C `re` engine)
 - **Approximate matching needed**: Fuzzy Search
 - **Mixed requirements**: SearchEngine with fallback
+- **Not sure**: AlgorithmType.AUTO, ideally calibrated once on your own data:
+    >>> engine.calibrate_planner([(sample_text, ["python", "sql"])], "planner.json")
+    >>> engine = SearchEngine(planner=QueryPlanner.load("planner.json"))
 
 **Performance comparison** (run benchmark to get actual numbers):
     >>> from search_algorithms import SearchEngine
@@ -130,12 +152,43 @@ Advanced Usage Examples
     >>> engine = SearchEngine(config)
     >>> matches, stats = engine.search("Hello WORLD", ["world"])
 
+**Indexing a document once, then counting any substring without scanning it:**
+    >>> from search_algorithms import SuffixArrayIndex
+    >>> index = SuffixArrayIndex(long_text)
+    >>> index.count("python"), index.locate("python")[:5]
+    >>> index.save("cv.sa.npy")  # reload later with SuffixArrayIndex.load(path, long_text)
+
+**Searching the same document many times:**
+    >>> from search_algorithms import TextView
+    >>> document = TextView(long_text)  # lowercase view computed once
+    >>> matches, stats = engine.search(document, ["python"])  # no per-call text.lower()
+
+**Same patterns over many documents (tables built once, shareable across threads):**
+    >>> matcher = engine.compile_exact(["python", "sql"], AlgorithmType.KMP)
+    >>> for document in documents:
+    ...     matches = engine.search_compiled(document, matcher)
+    ...     counts = engine.count_compiled(document, matcher)  # {"python": 3, "sql": 0}, no SearchMatch objects
+
+**Many matches, columnar results (no SearchMatch per hit unless iterated):**
+    >>> batch = engine.search_batch(long_text, ["the", "and"], AlgorithmType.NATIVE)
+    >>> len(batch), batch.counts()  # starts/ends are array('l'), similarities array('f')
+    >>> first = batch[0]  # a SearchMatch, built on demand
+
 **Exact matching only (no fuzzy fallback):**
     >>> matches, stats = engine.search_exact_only("text", ["pattern"], AlgorithmType.AHO_CORASICK)
 
 **Fuzzy matching only:**
     >>> matches, stats = engine.search_fuzzy_only("text", ["patern"], min_similarity=0.6)
 
+**Bounded latency (stops fuzzy work once the budget is spent):**
+    >>> matches, stats = engine.search(text, ["patern"], time_budget=0.5)
+    >>> if stats.partial:
+    ...     print("Time budget ran out, showing matches found so far")
+
+**Native-speed KMP, Boyer-Moore and fuzzy matching loops (optional, needs numba):**
+    >>> config = SearchConfig(use_jit=True, warm_up_jit=True)  # pure Python without numba
+    >>> engine = SearchEngine(config)
+
 **Multiple search strategies:**
     >>> # Try exact first, then fuzzy if no results
     >>> exact_matches, _ = engine.search_exact_only(text, patterns)
@@ -198,7 +251,18 @@ algorithms/
 ├── kmp_searcher.py         # KMP algorithm implementation
 ├── boyer_moore.py          # Boyer-Moore algorithms
 ├── aho_corasick.py         # Aho-Corasick algorithm
-└── fuzzy_searcher.py       # Fuzzy search implementation
+├── native_searcher.py      # Built-in C substring search
+├── suffix_array.py         # Suffix array index and searcher
+├── shift_or.py             # Bit-parallel Shift-Or searcher
+├── wu_manber.py            # Wu-Manber multi-pattern searcher
+├── rabin_karp.py           # Vectorized Rabin-Karp searcher
+├── regex_searcher.py       # Alternation regex searcher (C re module)
+├── fuzzy_searcher.py       # Fuzzy search implementation
+├── jit_kernels.py          # Optional numba kernels (use_jit)
+├── symspell.py             # Symmetric-delete vocabulary index
+├── match_batch.py          # Columnar match results
+├── planner.py              # Cost-based algorithm choice for AlgorithmType.AUTO
+└── text_view.py            # Original-case text with a precomputed lowercase view
 
 Troubleshooting
 ---------------
@@ -224,7 +288,7 @@ Version Information
 -------------------
 Package version: 1.0.0
 Compatible with Python 3.8+
-Requires: typing, dataclasses, enum (all standard library)
+Requires: typing, dataclasses, enum (standard library) and numpy (fuzzy search kernel)
 
 For more detailed algorithm implementations, see individual module files.
 """
@@ -235,9 +299,24 @@ from .fuzzy_searcher import FuzzySearcher
 
 # Import individual searcher implementations
 from .kmp_searcher import KMPSearcher
+from .match_batch import MatchBatch
+from .native_searcher import NativeSearcher
+from .planner import QueryPlanner
 
 # Import all public interfaces
-from .pattern_searcher import PatternSearcher, SearchMatch, SearchStrategy
+from .pattern_searcher import (
+    CompiledMatcher,
+    PatternSearcher,
+    SearchMatch,
+    SearchStrategy,
+)
+from .rabin_karp import RabinKarpSearcher
+from .regex_searcher import RegexSearcher
+from .shift_or import ShiftOrSearcher
+from .suffix_array import SuffixArrayIndex, SuffixArraySearcher
+from .symspell import SymSpellIndex
+from .text_view import TextView
+from .wu_manber import WuManberSearcher
 from .search_engine import (
     AlgorithmType,
     SearchConfig,
@@ -257,6 +336,12 @@ def create_searcher(algorithm: str) -> PatternSearcher:
             - 'boyer_moore_simple': Boyer-Moore with bad character heuristic only
             - 'boyer_moore_complex': Boyer-Moore with both heuristics
             - 'aho_corasick': Aho-Corasick multi-pattern algorithm
+            - 'native': Built-in C substring search
+            - 'suffix_array': Suffix array lookups
+            - 'shift_or': Bit-parallel Shift-Or
+            - 'wu_manber': Wu-Manber multi-pattern skipping
+            - 'rabin_karp': Vectorized Rabin-Karp
+            - 'regex': Compiled alternation regex
             - 'fuzzy': Fuzzy search with edit distance
 
     Returns:
@@ -277,6 +362,12 @@ def create_searcher(algorithm: str) -> PatternSearcher:
         "boyer_moore_simple": lambda: BoyerMooreSearcher(use_complex=False),
         "boyer_moore_complex": lambda: BoyerMooreSearcher(use_complex=True),
         "aho_corasick": lambda: AhoCorasickSearcher(),
+        "native": lambda: NativeSearcher(),
+        "suffix_array": lambda: SuffixArraySearcher(),
+        "shift_or": lambda: ShiftOrSearcher(),
+        "wu_manber": lambda: WuManberSearcher(),
+        "rabin_karp": lambda: RabinKarpSearcher(),
+        "regex": lambda: RegexSearcher(),
         "fuzzy": lambda: FuzzySearcher(),
     }
 
@@ -313,6 +404,12 @@ def search_text(
             - "boyer_moore_simple": Fast for single patterns
             - "boyer_moore_complex": Fastest for single patterns
             - "aho_corasick": Best for multiple patterns (default)
+            - "native": Built-in C substring search, fastest in practice
+            - "suffix_array": Index lookups, best when one text is searched many times
+            - "shift_or": Bit-parallel, several short keywords per pass
+            - "wu_manber": Skips text, best for hundreds of keywords of 4+ characters
+            - "rabin_karp": Array passes per keyword length, best for many same-length keywords
+            - "regex": One C regex pass for all keywords
         case_sensitive (bool): Whether search should be case sensitive
         use_fuzzy_fallback (bool): Whether to try fuzzy search if no exact matches
         max_results (int): Maximum number of results to return
@@ -429,17 +526,29 @@ __all__ = [
     # Core interfaces and data structures
     "PatternSearcher",  # Abstract base class for all searchers
     "SearchMatch",  # Result data structure
+    "MatchBatch",  # Columnar match results
     "SearchStrategy",  # Enum: EXACT or FUZZY
+    "CompiledMatcher",  # Patterns preprocessed once by a searcher
     # Main search engine and configuration
     "SearchEngine",  # Main search engine class
     "SearchConfig",  # Configuration options
     "SearchStats",  # Search execution statistics
+    "TextView",  # Document with a precomputed lowercase view
     "AlgorithmType",  # Enum of exact matching algorithms
+    "QueryPlanner",  # Cost model behind AlgorithmType.AUTO
     # Individual algorithm implementations
     "KMPSearcher",  # Knuth-Morris-Pratt
     "BoyerMooreSearcher",  # Boyer-Moore (simple/complex)
     "AhoCorasickSearcher",  # Aho-Corasick multi-pattern
+    "NativeSearcher",  # Built-in str.find / bytes.find
+    "SuffixArraySearcher",  # Suffix array lookups
+    "SuffixArrayIndex",  # Serializable per-document suffix array
+    "ShiftOrSearcher",  # Bit-parallel Shift-Or
+    "WuManberSearcher",  # Wu-Manber multi-pattern
+    "RabinKarpSearcher",  # NumPy rolling-hash Rabin-Karp
+    "RegexSearcher",  # Compiled alternation regex
     "FuzzySearcher",  # Fuzzy/approximate search
+    "SymSpellIndex",  # Vocabulary index for fuzzy keyword expansion
     # Factory and convenience functions
     "create_searcher",  # Factory for individual algorithms
     "search_text",  # Main high-level search function
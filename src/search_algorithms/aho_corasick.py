@@ -1,7 +1,9 @@
 from collections import deque
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from .pattern_searcher import PatternSearcher, SearchMatch
+from .pattern_searcher import CompiledMatcher, PatternSearcher, SearchMatch
+from .match_batch import MatchBatch
+from .text_view import TextView
 
 
 class TrieNode:
@@ -96,6 +98,15 @@ class AhoCorasick:
 
         self._failure_links_built = True
 
+    def build(self) -> None:
+        """
+        Finish the automaton eagerly.
+
+        search() builds it lazily on first use; building up front lets several threads
+        share one automaton without racing on that first build.
+        """
+        self._build_failure_links()
+
     def search(self, text: str) -> List[tuple[int, int, str]]:
         """
         Search for all patterns in the given text.
@@ -136,32 +147,112 @@ class AhoCorasick:
 
         return matches
 
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Count occurrences of every pattern without recording where they are.
+
+        Args:
+            text (str): The text to search in
+
+        Returns:
+            Dict[str, int]: Pattern -> occurrence count, 0 for patterns that don't occur
+        """
+        counts: Dict[str, int] = dict.fromkeys(self.patterns, 0)
+        if not text or not self.patterns:
+            return counts
+
+        self._build_failure_links()
+
+        current_node: Optional[TrieNode] = self.root
+        for char in text:
+            while current_node is not None and char not in current_node.children:
+                current_node = current_node.failure
+
+            if current_node is None:
+                current_node = self.root
+                continue
+
+            current_node = current_node.children[char]
+            for pattern in current_node.output:
+                counts[pattern] += 1
+
+        return counts
+
+
+class CompiledAhoCorasick(CompiledMatcher):
+    """Patterns with their Aho-Corasick automaton built once."""
+
+    __slots__ = ("automaton",)
+
+    def __init__(self, searcher: "AhoCorasickSearcher", patterns: List[str]):
+        super().__init__(searcher, patterns)
+        self.automaton = AhoCorasick()
+        for pattern in self.patterns:
+            self.automaton.add_pattern(pattern)
+        # Built here so searches only ever read it
+        self.automaton.build()
+
+    def search(self, text: str) -> List[SearchMatch]:
+        if not text or not self.patterns:
+            return []
+        matches = [
+            SearchMatch(
+                pattern=pattern, start_pos=start_pos, end_pos=end_pos, similarity=1.0
+            )
+            for start_pos, end_pos, pattern in self.automaton.search(text)
+        ]
+        matches.sort(key=lambda x: (x.start_pos, x.pattern))
+        return matches
+
+    def search_view(self, text: TextView, case_sensitive: bool) -> List[SearchMatch]:
+        return self.search(text.view(case_sensitive))
+
+    def search_batch(self, text: str) -> MatchBatch:
+        batch = MatchBatch(self.patterns)
+        if not text or not self.patterns:
+            return batch
+        pattern_ids = {pattern: i for i, pattern in enumerate(self.patterns)}
+        for start_pos, end_pos, pattern in self.automaton.search(text):
+            batch.append(pattern_ids[pattern], start_pos, end_pos)
+        batch.sort()
+        return batch
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> MatchBatch:
+        return self.search_batch(text.view(case_sensitive))
+
+    def count(self, text: str) -> Dict[str, int]:
+        return self.automaton.count(text)
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        return self.count(text.view(case_sensitive))
+
 
 class AhoCorasickSearcher(PatternSearcher):
     """Aho-Corasick algorithm with caching for repeated pattern sets."""
 
     def __init__(self):
-        self._ac_instance: Optional[AhoCorasick] = None
-        self._cached_patterns: List[str] = []
+        # (patterns, finished automaton) of the last query, replaced in one assignment so
+        # threads sharing the searcher never see a half-built automaton or a stale pairing
+        self._cached: Optional[Tuple[List[str], AhoCorasick]] = None
 
     def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
         """Search for multiple patterns using Aho-Corasick algorithm."""
         if not text or not patterns:
             return []
 
-        # Filter out empty patterns
-        valid_patterns = [p for p in patterns if p and len(p.strip()) > 0]
+        # Filter out empty and repeated patterns, a repeat would be reported twice
+        valid_patterns = list(dict.fromkeys(p for p in patterns if p and len(p.strip()) > 0))
         if not valid_patterns:
             return []
 
         # Check if we need to rebuild the automaton
-        if self._ac_instance is None or set(self._cached_patterns) != set(
-            valid_patterns
-        ):
-            self._build_automaton(valid_patterns)
+        cached = self._cached
+        if cached is None or set(cached[0]) != set(valid_patterns):
+            cached = (valid_patterns, self._build_automaton(valid_patterns))
+            self._cached = cached
 
         # Perform search
-        raw_matches = self._ac_instance.search(text)  # type: ignore
+        raw_matches = cached[1].search(text)
         matches: List[SearchMatch] = []
 
         for start_pos, end_pos, pattern in raw_matches:
@@ -174,17 +265,24 @@ class AhoCorasickSearcher(PatternSearcher):
         matches.sort(key=lambda x: (x.start_pos, x.pattern))
         return matches
 
-    def _build_automaton(self, patterns: List[str]) -> None:
-        """Build or rebuild the Aho-Corasick automaton."""
-        self._ac_instance = AhoCorasick()
+    def compile(self, patterns: List[str]) -> CompiledAhoCorasick:
+        """
+        Build an automaton for patterns that is independent of this searcher's cache,
+        so it can be shared between threads.
+        """
+        return CompiledAhoCorasick(self, patterns)
+
+    def _build_automaton(self, patterns: List[str]) -> AhoCorasick:
+        """Build a finished Aho-Corasick automaton for patterns."""
+        automaton = AhoCorasick()
         for pattern in patterns:
-            self._ac_instance.add_pattern(pattern)
-        self._cached_patterns = patterns.copy()
+            automaton.add_pattern(pattern)
+        automaton.build()
+        return automaton
 
     def clear_cache(self) -> None:
         """Clear the cached automaton."""
-        self._ac_instance = None
-        self._cached_patterns = []
+        self._cached = None
 
     @property
     def algorithm_name(self) -> str:
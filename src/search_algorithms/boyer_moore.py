@@ -1,18 +1,88 @@
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Sequence
 
-from .pattern_searcher import PatternSearcher, SearchMatch
+from . import jit_kernels
+from .pattern_searcher import (
+    CompiledMatcher,
+    PatternSearcher,
+    SearchMatch,
+    matches_from_positions,
+)
+from .match_batch import MatchBatch
+from .text_view import TextView
+
+
+class CompiledBoyerMoore(CompiledMatcher):
+    """Boyer-Moore patterns with their shift tables built once."""
+
+    __slots__ = ("bad_char_tables", "good_suffix_tables")
+
+    def __init__(self, searcher: "BoyerMooreSearcher", patterns: List[str]):
+        super().__init__(searcher, patterns)
+        self.bad_char_tables = tuple(
+            searcher._build_bad_character_table(p) for p in self.patterns
+        )
+        # The simple variant only uses the bad character heuristic
+        self.good_suffix_tables = tuple(
+            tuple(searcher._build_good_suffix_table(p)) if searcher.use_complex else None
+            for p in self.patterns
+        )
+
+    def _positions(self, text: str) -> Iterator[List[int]]:
+        """Start positions of each pattern in text, in pattern order."""
+        searcher = self.searcher
+        if searcher.use_complex:
+            for pattern, bad_char, good_suffix in zip(
+                self.patterns, self.bad_char_tables, self.good_suffix_tables
+            ):
+                yield searcher._boyer_moore_complex(text, pattern, bad_char, good_suffix)
+        else:
+            for pattern, bad_char in zip(self.patterns, self.bad_char_tables):
+                yield searcher._boyer_moore_simple(text, pattern, bad_char)
+
+    def search(self, text: str) -> List[SearchMatch]:
+        if not text or not self.patterns:
+            return []
+        return matches_from_positions(zip(self.patterns, self._positions(text)))
+
+    def search_view(self, text: TextView, case_sensitive: bool) -> List[SearchMatch]:
+        return self.search(text.view(case_sensitive))
+
+    def search_batch(self, text: str) -> MatchBatch:
+        if not text:
+            return MatchBatch(self.patterns)
+        return MatchBatch.from_positions(self.patterns, self._positions(text))
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> MatchBatch:
+        return self.search_batch(text.view(case_sensitive))
+
+    def count(self, text: str) -> Dict[str, int]:
+        if not text:
+            return dict.fromkeys(self.patterns, 0)
+        boyer_moore_count = self.searcher._boyer_moore_count
+        return {
+            pattern: boyer_moore_count(text, pattern, bad_char, good_suffix)
+            for pattern, bad_char, good_suffix in zip(
+                self.patterns, self.bad_char_tables, self.good_suffix_tables
+            )
+        }
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        return self.count(text.view(case_sensitive))
 
 
 class BoyerMooreSearcher(PatternSearcher):
     """Boyer-Moore algorithm with unified multi-pattern interface."""
 
-    def __init__(self, use_complex: bool = True):
+    def __init__(self, use_complex: bool = True, use_jit: bool = False):
         """
         Args:
             use_complex (bool): True if using good suffix heuristic.
+            use_jit (bool): Run the search loop as a numba kernel (see jit_kernels);
+                ignored when numba isn't installed.
         """
 
         self.use_complex = use_complex
+        self.use_jit = use_jit and jit_kernels.JIT_AVAILABLE
 
     def _build_bad_character_table(self, pattern: str) -> Dict[str, int]:
         """
@@ -70,13 +140,16 @@ class BoyerMooreSearcher(PatternSearcher):
 
         return good_suffix
 
-    def _boyer_moore_simple(self, text: str, pattern: str) -> List[int]:
+    def _boyer_moore_simple(
+        self, text: str, pattern: str, bad_char: Optional[Dict[str, int]] = None
+    ) -> List[int]:
         """
         Boyer-Moore algorithm using only bad character heuristic.
 
         Args:
             text (str): The text to search in
             pattern (str): The pattern to search for
+            bad_char (Optional[Dict[str, int]]): Bad character table of pattern, built if not given
 
         Returns:
             List[int]: List of starting indices where pattern is found in text
@@ -92,7 +165,10 @@ class BoyerMooreSearcher(PatternSearcher):
             return matches
 
         # Build bad character table
-        bad_char: Dict[str, int] = self._build_bad_character_table(pattern)
+        if bad_char is None:
+            bad_char = self._build_bad_character_table(pattern)
+        if self.use_jit:
+            return jit_kernels.boyer_moore_search(text, pattern, bad_char)
 
         shift: int = 0
         while shift <= text_length - pattern_length:
@@ -123,13 +199,21 @@ class BoyerMooreSearcher(PatternSearcher):
 
         return matches
 
-    def _boyer_moore_complex(self, text: str, pattern: str) -> List[int]:
+    def _boyer_moore_complex(
+        self,
+        text: str,
+        pattern: str,
+        bad_char: Optional[Dict[str, int]] = None,
+        good_suffix: Optional[Sequence[int]] = None,
+    ) -> List[int]:
         """
         Boyer-Moore algorithm using both bad character and good suffix heuristics.
 
         Args:
             text (str): The text to search in
             pattern (str): The pattern to search for
+            bad_char (Optional[Dict[str, int]]): Bad character table of pattern, built if not given
+            good_suffix (Optional[Sequence[int]]): Good suffix table of pattern, built if not given
 
         Returns:
             List[int]: List of starting indices where pattern is found in text
@@ -145,8 +229,12 @@ class BoyerMooreSearcher(PatternSearcher):
             return matches
 
         # Build bad character and good suffix tables
-        bad_char: Dict[str, int] = self._build_bad_character_table(pattern)
-        good_suffix: List[int] = self._build_good_suffix_table(pattern)
+        if bad_char is None:
+            bad_char = self._build_bad_character_table(pattern)
+        if good_suffix is None:
+            good_suffix = self._build_good_suffix_table(pattern)
+        if self.use_jit:
+            return jit_kernels.boyer_moore_search(text, pattern, bad_char, good_suffix)
 
         shift: int = 0
         while shift <= text_length - pattern_length:
@@ -173,37 +261,71 @@ class BoyerMooreSearcher(PatternSearcher):
 
         return matches
 
-    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
-        """Search for multiple patterns using Boyer-Moore algorithm."""
-        if not text or not patterns:
-            return []
+    def _boyer_moore_count(
+        self,
+        text: str,
+        pattern: str,
+        bad_char: Dict[str, int],
+        good_suffix: Optional[Sequence[int]] = None,
+    ) -> int:
+        """
+        Number of occurrences of pattern in text, the search loops without the match list.
+        Shifts like _boyer_moore_complex when good_suffix is given, else like _boyer_moore_simple.
 
-        # Filter out empty patterns
-        valid_patterns = [p for p in patterns if p and len(p.strip()) > 0]
-        if not valid_patterns:
-            return []
+        Args:
+            text (str): The text to search in
+            pattern (str): The pattern to search for
+            bad_char (Dict[str, int]): Bad character table of pattern
+            good_suffix (Optional[Sequence[int]]): Good suffix table of pattern
 
-        matches: List[SearchMatch] = []
-        search_func = (
-            self._boyer_moore_complex if self.use_complex else self._boyer_moore_simple
-        )
+        Returns:
+            int: Number of (possibly overlapping) occurrences
+        """
+        text_length: int = len(text)
+        pattern_length: int = len(pattern)
 
-        # Use Boyer-Moore for each pattern
-        for pattern in valid_patterns:
-            positions = search_func(text, pattern)
-            for start_pos in positions:
-                end_pos = start_pos + len(pattern) - 1
-                match = SearchMatch(
-                    pattern=pattern,
-                    start_pos=start_pos,
-                    end_pos=end_pos,
-                    similarity=1.0,
-                )
-                matches.append(match)
+        if not pattern or pattern_length > text_length:
+            return 0
+        if self.use_jit:
+            return jit_kernels.boyer_moore_count(text, pattern, bad_char, good_suffix or ())
 
-        # Sort by position, then by pattern for deterministic results
-        matches.sort(key=lambda x: (x.start_pos, x.pattern))
-        return matches
+        count: int = 0
+        shift: int = 0
+        bad_char_get = bad_char.get
+        while shift <= text_length - pattern_length:
+            pattern_index: int = pattern_length - 1
+
+            # Match pattern from right to left
+            while (
+                pattern_index >= 0
+                and pattern[pattern_index] == text[shift + pattern_index]
+            ):
+                pattern_index -= 1
+
+            if pattern_index < 0:
+                count += 1
+                if good_suffix is not None:
+                    shift += good_suffix[0]
+                elif shift + pattern_length < text_length:
+                    shift += pattern_length - bad_char_get(text[shift + pattern_length], -1)
+                else:
+                    shift += 1
+            else:
+                bad_char_shift = pattern_index - bad_char_get(text[shift + pattern_index], -1)
+                if good_suffix is not None:
+                    shift += max(bad_char_shift, good_suffix[pattern_index + 1])
+                else:
+                    shift += max(1, bad_char_shift)
+
+        return count
+
+    def compile(self, patterns: List[str]) -> CompiledBoyerMoore:
+        """Build the shift tables of every pattern once."""
+        return CompiledBoyerMoore(self, patterns)
+
+    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
+        """Search for multiple patterns using Boyer-Moore algorithm."""
+        return self.compile(patterns).search(text)
 
     @property
     def algorithm_name(self) -> str:
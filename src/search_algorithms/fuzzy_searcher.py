@@ -1,14 +1,152 @@
-from typing import List, Tuple
+import heapq
+import time
+from typing import List, Optional, Sequence, Tuple
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from . import jit_kernels
 from .pattern_searcher import PatternSearcher, SearchMatch
 
+# Code used to pad windows past the end of the text; not a valid code point, so it never matches
+_PAD_CODE = 0xFFFFFFFF
+
+
+def _encode(text: str) -> np.ndarray:
+    """Code points of text as a uint32 array."""
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+def prefix_distances(query_codes: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """
+    Levenshtein distances from a query to every prefix of a batch of windows.
+
+    Runs the usual row-by-row DP (one row per query character) on all windows at once.
+    Within a row the insertion step row[j] = min(tmp[j], row[j - 1] + 1) is a running
+    minimum of tmp[k] + (j - k), computed as j + cummin(tmp[k] - k).
+
+    Args:
+        query_codes (np.ndarray): Query code points, shape (m,)
+        windows (np.ndarray): Padded window code points, shape (batch, width)
+
+    Returns:
+        np.ndarray: Distances of shape (batch, width + 1); column L holds the distance
+                    between the query and the first L characters of each window
+    """
+    batch, width = windows.shape
+    columns = np.arange(width + 1, dtype=np.int32)
+    row = np.broadcast_to(columns, (batch, width + 1)).copy()
+    tmp = np.empty_like(row)
+
+    for i, code in enumerate(query_codes, start=1):
+        substitution = row[:, :-1] + (windows != code)
+        np.minimum(row[:, 1:] + 1, substitution, out=tmp[:, 1:])
+        tmp[:, 0] = i
+        tmp -= columns
+        np.minimum.accumulate(tmp, axis=1, out=row)
+        row += columns
+
+    return row
+
+
+def batch_levenshtein(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """
+    Levenshtein distance between a query and many candidate strings in one call.
+
+    Args:
+        query (str): The search query
+        candidates (Sequence[str]): Strings to compare against the query
+
+    Returns:
+        np.ndarray: Distance for each candidate, in input order
+    """
+    if not candidates:
+        return np.zeros(0, dtype=np.int32)
+
+    lengths = np.fromiter((len(c) for c in candidates), dtype=np.intp, count=len(candidates))
+    windows = np.full((len(candidates), max(int(lengths.max()), 1)), _PAD_CODE, dtype=np.uint32)
+    for row, candidate in enumerate(candidates):
+        windows[row, : len(candidate)] = _encode(candidate)
+
+    distances = prefix_distances(_encode(query), windows)
+    return distances[np.arange(len(candidates)), lengths]
+
+
+class _SuppressingCollector:
+    """
+    Streaming top-N collector with non-maximum suppression over overlapping windows.
+
+    Windows must arrive in start order. Windows whose spans chain together form one
+    cluster; once a window starts past the cluster's end, the cluster is final and
+    greedy suppression keeps its most similar window and drops everything overlapping
+    it. Survivors go into a min-heap bounded by max_results, so memory stays
+    proportional to max_results instead of the number of windows above threshold.
+    """
+
+    def __init__(self, max_results: int):
+        self.max_results = max_results
+        # Entries are (similarity, -start, -end): the heap top is the worst kept match
+        self._heap: List[Tuple[float, int, int]] = []
+        self._cluster: List[Tuple[int, int, float]] = []
+        self._cluster_end: int = -1
+
+    def add(self, starts: np.ndarray, ends: np.ndarray, similarities: np.ndarray) -> None:
+        """Add windows (inclusive spans), ordered by start position."""
+        for start, end, similarity in zip(
+            starts.tolist(), ends.tolist(), similarities.tolist()
+        ):
+            if start > self._cluster_end:
+                self._flush()
+            self._cluster.append((start, end, similarity))
+            self._cluster_end = max(self._cluster_end, end)
+
+    def _flush(self) -> None:
+        """Suppress overlaps in the finished cluster and offer the survivors."""
+        if not self._cluster:
+            return
+
+        self._cluster.sort(key=lambda m: (-m[2], m[0], m[1]))
+        kept: List[Tuple[int, int]] = []
+        for start, end, similarity in self._cluster:
+            if all(end < kept_start or start > kept_end for kept_start, kept_end in kept):
+                kept.append((start, end))
+                self._offer(start, end, similarity)
+
+        self._cluster = []
+        self._cluster_end = -1
+
+    def _offer(self, start: int, end: int, similarity: float) -> None:
+        if self.max_results <= 0:
+            return
+        entry = (similarity, -start, -end)
+        if len(self._heap) < self.max_results:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def results(self) -> List[Tuple[int, int, float]]:
+        """(start, end, similarity) of kept matches, most similar first, then by position."""
+        self._flush()
+        ranked = sorted(self._heap, key=lambda e: (-e[0], -e[1], -e[2]))
+        return [(-neg_start, -neg_end, similarity) for similarity, neg_start, neg_end in ranked]
+
 
 class FuzzySearcher(PatternSearcher):
     """Fuzzy search algorithm with configurable similarity threshold."""
 
-    def __init__(self, min_similarity: float = 0.6, max_results_per_pattern: int = 100):
+    def __init__(
+        self,
+        min_similarity: float = 0.6,
+        max_results_per_pattern: int = 100,
+        batch_size: int = 4096,
+        use_jit: bool = False,
+    ):
         self.min_similarity = min_similarity
         self.max_results_per_pattern = max_results_per_pattern
+        # Window start positions scored per NumPy call
+        self.batch_size = batch_size
+        # Levenshtein distance and the window DP as numba kernels (see jit_kernels), when numba is installed
+        self.use_jit = use_jit and jit_kernels.JIT_AVAILABLE
 
     def _levenshtein_distance(self, str1: str, str2: str) -> int:
         """
@@ -29,6 +167,8 @@ class FuzzySearcher(PatternSearcher):
             return len(str2)
         if not str2:
             return len(str1)
+        if self.use_jit:
+            return jit_kernels.levenshtein_distance(str1, str2)
 
         # Ensure str1 is the shorter string for space optimization
         if len(str1) > len(str2):
@@ -79,27 +219,36 @@ class FuzzySearcher(PatternSearcher):
         return 1.0 - (distance / max_len)
 
     def _fuzzy_search_text(
-        self, query: str, text: str, min_similarity: float, max_results: int
-    ) -> List[Tuple[int, int, str, float]]:
+        self,
+        query: str,
+        text: str,
+        min_similarity: float,
+        max_results: int,
+        deadline: Optional[float] = None,
+    ) -> Tuple[List[Tuple[int, int, str, float]], bool]:
         """
         Fuzzy search in text using similarity ratio threshold.
 
+        Each occurrence yields one match: of the overlapping windows above the threshold,
+        only the most similar is kept (then the earliest, then the shortest).
+
         Args:
             query (str): The search query
             text (str): The text to search in
             min_similarity (float): Minimum similarity ratio (0.0 to 1.0)
             max_results (int): Maximum number of results to return
+            deadline (Optional[float]): time.perf_counter() value after which the scan stops early
 
         Returns:
-            List[Tuple[int, int, str, float]]: List of tuples (start_index, end_index, substring, similarity)
-                                            sorted by similarity (highest to lowest)
+            Tuple[List[Tuple[int, int, str, float]], bool]:
+                List of tuples (start_index, end_index, substring, similarity) sorted by
+                similarity (highest to lowest), and whether the whole text was scanned
         """
         if not query or not text:
-            return []
+            return [], True
 
         query_len: int = len(query)
         text_len: int = len(text)
-        matches: List[Tuple[int, int, str, float]] = []
 
         # Calculate reasonable window size based on similarity threshold
         # Lower similarity means need to check longer substrings
@@ -109,41 +258,88 @@ class FuzzySearcher(PatternSearcher):
         # Also set a minimum window size
         min_window: int = max(1, int(query_len * min_similarity))
 
-        for start in range(text_len):
-            for length in range(min_window, min(max_window + 1, text_len - start + 1)):
-                end: int = start + length
-                substring: str = text[start:end]
+        if min_window > max_window:
+            return [], True
+
+        # Every window starting at the same position is a prefix of the longest one,
+        # so one DP per start scores all window lengths; starts are processed in batches
+        query_codes = _encode(query)
+        padded = np.concatenate(
+            (_encode(text), np.full(max_window, _PAD_CODE, dtype=np.uint32))
+        )
+        all_windows = sliding_window_view(padded, max_window)[:text_len]
+        lengths = np.arange(min_window, max_window + 1)
+        max_lens = np.maximum(lengths, query_len)
+
+        collector = _SuppressingCollector(max_results)
+        complete = True
+        distance_kernel = jit_kernels.prefix_distances if self.use_jit else prefix_distances
+
+        for batch_start in range(0, text_len, self.batch_size):
+            if deadline is not None and time.perf_counter() >= deadline:
+                complete = False
+                break
+            windows = all_windows[batch_start : batch_start + self.batch_size]
+            distances = distance_kernel(query_codes, windows)[:, min_window:]
+            similarities = 1.0 - distances / max_lens
+
+            starts = np.arange(batch_start, batch_start + len(windows))
+            # Windows must not run past the end of the text
+            fits = lengths[None, :] <= (text_len - starts)[:, None]
+            start_index, length_index = np.nonzero((similarities >= min_similarity) & fits)
+
+            # Row-major order: by start, then by length
+            match_starts = starts[start_index]
+            collector.add(
+                match_starts,
+                match_starts + lengths[length_index] - 1,
+                similarities[start_index, length_index],
+            )
 
-                similarity: float = self._similarity_ratio(query, substring)
+        matches = [
+            (start, end, text[start : end + 1], similarity)
+            for start, end, similarity in collector.results()
+        ]
+        return matches, complete
 
-                if similarity >= min_similarity:
-                    matches.append((start, end - 1, substring, similarity))
+    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
+        """Search for multiple patterns using fuzzy matching."""
+        matches, _ = self.search_multiple_until(text, patterns)
+        return matches
 
-        # Sort by similarity (highest to lowest), then by start position for ties
-        matches.sort(key=lambda x: (-x[3], x[0]))
+    def search_multiple_until(
+        self, text: str, patterns: List[str], deadline: Optional[float] = None
+    ) -> Tuple[List[SearchMatch], bool]:
+        """
+        Search for multiple patterns using fuzzy matching, stopping at a deadline.
 
-        # Return only the requested number of results
-        return matches[:max_results]
+        Args:
+            text (str): Text to search in
+            patterns (List[str]): Patterns to search for
+            deadline (Optional[float]): time.perf_counter() value after which searching stops
 
-    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
-        """Search for multiple patterns using fuzzy matching."""
+        Returns:
+            Tuple[List[SearchMatch], bool]: Matches found so far, and whether the search completed
+        """
         if not text or not patterns:
-            return []
+            return [], True
 
         # Filter out empty patterns
         valid_patterns = [p for p in patterns if p and len(p.strip()) > 0]
         if not valid_patterns:
-            return []
+            return [], True
 
         matches: List[SearchMatch] = []
+        complete = True
 
         # Use fuzzy search for each pattern
         for pattern in valid_patterns:
-            fuzzy_matches = self._fuzzy_search_text(
+            fuzzy_matches, complete = self._fuzzy_search_text(
                 query=pattern,
                 text=text,
                 min_similarity=self.min_similarity,
                 max_results=self.max_results_per_pattern,
+                deadline=deadline,
             )
 
             for start_pos, end_pos, snippet, similarity in fuzzy_matches:
@@ -155,9 +351,12 @@ class FuzzySearcher(PatternSearcher):
                 )
                 matches.append(match)
 
+            if not complete:
+                break
+
         # Sort by similarity (highest first), then by position
         matches.sort(key=lambda x: (-x.similarity, x.start_pos))
-        return matches
+        return matches, complete
 
     def set_similarity_threshold(self, min_similarity: float) -> None:
         """Update the minimum similarity threshold."""
@@ -0,0 +1,242 @@
+"""
+Numba-compiled inner loops for KMP, Boyer-Moore and Levenshtein distance, including
+the batched prefix-distance DP that the fuzzy search runs over its text windows.
+
+The kernels work on uint32 code point arrays and are plain Python functions; when
+numba is installed they are JIT compiled (nopython, GIL released) so the educational
+algorithms run at native speed. Without numba, JIT_AVAILABLE is False and searchers
+keep their pure-Python (or NumPy) loops.
+
+Install with `pip install numba`.
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    import numba
+except ImportError:  # optional dependency
+    numba = None
+
+JIT_AVAILABLE = numba is not None
+
+
+def _jit(function):
+    """Compile function with numba if available, otherwise return it unchanged."""
+    if numba is None:
+        return function
+    # No on-disk cache: it breaks when this file is imported under another package name
+    return numba.njit(nogil=True)(function)
+
+
+def codes(text: str) -> np.ndarray:
+    """Code points of text as a uint32 array."""
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+@_jit
+def _kmp_kernel(text: np.ndarray, pattern: np.ndarray, lps: np.ndarray) -> np.ndarray:
+    text_length = text.shape[0]
+    pattern_length = pattern.shape[0]
+    matches = np.empty(text_length, dtype=np.int64)
+    count = 0
+    text_index = 0
+    pattern_index = 0
+
+    while text_index < text_length:
+        if text[text_index] == pattern[pattern_index]:
+            text_index += 1
+            pattern_index += 1
+            if pattern_index == pattern_length:
+                matches[count] = text_index - pattern_index
+                count += 1
+                pattern_index = lps[pattern_index - 1]
+        elif pattern_index != 0:
+            pattern_index = lps[pattern_index - 1]
+        else:
+            text_index += 1
+
+    return matches[:count]
+
+
+@_jit
+def _boyer_moore_kernel(
+    text: np.ndarray,
+    pattern: np.ndarray,
+    bad_char: np.ndarray,
+    good_suffix: np.ndarray,
+    use_good_suffix: bool,
+) -> np.ndarray:
+    text_length = text.shape[0]
+    pattern_length = pattern.shape[0]
+    table_size = bad_char.shape[0]
+    matches = np.empty(max(text_length - pattern_length + 1, 0), dtype=np.int64)
+    count = 0
+    shift = 0
+
+    while shift <= text_length - pattern_length:
+        pattern_index = pattern_length - 1
+        while pattern_index >= 0 and pattern[pattern_index] == text[shift + pattern_index]:
+            pattern_index -= 1
+
+        if pattern_index < 0:
+            matches[count] = shift
+            count += 1
+            if use_good_suffix:
+                shift += good_suffix[0]
+            elif shift + pattern_length < text_length:
+                code = text[shift + pattern_length]
+                last = bad_char[code] if code < table_size else -1
+                shift += pattern_length - last
+            else:
+                shift += 1
+        else:
+            code = text[shift + pattern_index]
+            last = bad_char[code] if code < table_size else -1
+            bad_char_shift = pattern_index - last
+            if use_good_suffix:
+                shift += max(bad_char_shift, good_suffix[pattern_index + 1])
+            else:
+                shift += max(1, bad_char_shift)
+
+    return matches[:count]
+
+
+@_jit
+def _levenshtein_kernel(shorter: np.ndarray, longer: np.ndarray) -> int:
+    len1 = shorter.shape[0]
+    len2 = longer.shape[0]
+    prev_row = np.arange(len1 + 1)
+    curr_row = np.zeros(len1 + 1, dtype=prev_row.dtype)
+
+    for j in range(1, len2 + 1):
+        curr_row[0] = j
+        for i in range(1, len1 + 1):
+            if shorter[i - 1] == longer[j - 1]:
+                curr_row[i] = prev_row[i - 1]
+            else:
+                curr_row[i] = min(prev_row[i], curr_row[i - 1], prev_row[i - 1]) + 1
+        prev_row, curr_row = curr_row, prev_row
+
+    return prev_row[len1]
+
+
+@_jit
+def _prefix_distances_kernel(query: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    batch, width = windows.shape
+    query_length = query.shape[0]
+    distances = np.empty((batch, width + 1), dtype=np.int32)
+    row = np.empty(width + 1, dtype=np.int32)
+
+    for window in range(batch):
+        for j in range(width + 1):
+            row[j] = j
+        for i in range(1, query_length + 1):
+            code = query[i - 1]
+            diagonal = row[0]
+            row[0] = i
+            for j in range(1, width + 1):
+                above = row[j]
+                best = above + 1
+                if row[j - 1] + 1 < best:
+                    best = row[j - 1] + 1
+                substitution = diagonal if windows[window, j - 1] == code else diagonal + 1
+                if substitution < best:
+                    best = substitution
+                row[j] = best
+                diagonal = above
+        distances[window, :] = row
+
+    return distances
+
+
+def _bad_char_array(pattern: str, bad_char: Dict[str, int]) -> np.ndarray:
+    """Bad character table as an array indexed by code point, -1 for absent characters."""
+    table = np.full(max(map(ord, pattern)) + 1, -1, dtype=np.int64)
+    for char, position in bad_char.items():
+        table[ord(char)] = position
+    return table
+
+
+def kmp_search(text: str, pattern: str, lps: Sequence[int]) -> List[int]:
+    """Start positions of pattern in text (both non-empty), see KMPSearcher._kmp_search."""
+    return _kmp_kernel(codes(text), codes(pattern), np.asarray(lps, dtype=np.int64)).tolist()
+
+
+def kmp_count(text: str, pattern: str, lps: Sequence[int]) -> int:
+    """Number of occurrences of pattern in text, without converting the positions to a list."""
+    return int(_kmp_kernel(codes(text), codes(pattern), np.asarray(lps, dtype=np.int64)).shape[0])
+
+
+def boyer_moore_search(
+    text: str,
+    pattern: str,
+    bad_char: Dict[str, int],
+    good_suffix: Sequence[int] = (),
+) -> List[int]:
+    """
+    Start positions of pattern in text (both non-empty), see
+    BoyerMooreSearcher._boyer_moore_simple / _boyer_moore_complex.
+    The good suffix heuristic is used when good_suffix is given.
+    """
+    return _boyer_moore_kernel(
+        codes(text),
+        codes(pattern),
+        _bad_char_array(pattern, bad_char),
+        np.asarray(good_suffix or (0,), dtype=np.int64),
+        bool(good_suffix),
+    ).tolist()
+
+
+def boyer_moore_count(
+    text: str,
+    pattern: str,
+    bad_char: Dict[str, int],
+    good_suffix: Sequence[int] = (),
+) -> int:
+    """Number of occurrences of pattern in text, without converting the positions to a list."""
+    return int(
+        _boyer_moore_kernel(
+            codes(text),
+            codes(pattern),
+            _bad_char_array(pattern, bad_char),
+            np.asarray(good_suffix or (0,), dtype=np.int64),
+            bool(good_suffix),
+        ).shape[0]
+    )
+
+
+def levenshtein_distance(str1: str, str2: str) -> int:
+    """Levenshtein distance of two non-empty strings, see FuzzySearcher._levenshtein_distance."""
+    if len(str1) > len(str2):
+        str1, str2 = str2, str1
+    return int(_levenshtein_kernel(codes(str1), codes(str2)))
+
+
+def prefix_distances(query_codes: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """
+    Levenshtein distances from a query to every prefix of a batch of windows, one
+    window at a time instead of NumPy's row-at-a-time; see fuzzy_searcher.prefix_distances.
+    """
+    return _prefix_distances_kernel(query_codes, windows)
+
+
+def warm_up() -> bool:
+    """
+    Compile every kernel now instead of on the first search (numba compiles lazily,
+    which takes a moment per kernel and process).
+
+    Returns:
+        bool: Whether the kernels are JIT compiled
+    """
+    if not JIT_AVAILABLE:
+        return False
+    kmp_search("abab", "ab", [0, 0])
+    boyer_moore_search("abab", "ab", {"a": 0, "b": 1})
+    boyer_moore_search("abab", "ab", {"a": 0, "b": 1}, [2, 2, 1])
+    levenshtein_distance("ab", "abc")
+    # Same array layout as the fuzzy search's windows, numba compiles one version per layout
+    prefix_distances(codes("ab"), sliding_window_view(codes("abcd"), 2))
+    return True
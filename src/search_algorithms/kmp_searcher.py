@@ -1,11 +1,74 @@
-from typing import List
+from typing import Dict, List, Optional, Sequence
 
-from .pattern_searcher import PatternSearcher, SearchMatch
+from . import jit_kernels
+from .pattern_searcher import (
+    CompiledMatcher,
+    PatternSearcher,
+    SearchMatch,
+    matches_from_positions,
+)
+from .match_batch import MatchBatch
+from .text_view import TextView
+
+
+class CompiledKMP(CompiledMatcher):
+    """KMP patterns with their LPS arrays built once."""
+
+    __slots__ = ("lps_tables",)
+
+    def __init__(self, searcher: "KMPSearcher", patterns: List[str]):
+        super().__init__(searcher, patterns)
+        self.lps_tables = tuple(
+            tuple(searcher._generate_lps_list(p)) for p in self.patterns
+        )
+
+    def search(self, text: str) -> List[SearchMatch]:
+        if not text or not self.patterns:
+            return []
+        kmp_search = self.searcher._kmp_search
+        return matches_from_positions(
+            (pattern, kmp_search(text, pattern, lps))
+            for pattern, lps in zip(self.patterns, self.lps_tables)
+        )
+
+    def search_view(self, text: TextView, case_sensitive: bool) -> List[SearchMatch]:
+        return self.search(text.view(case_sensitive))
+
+    def search_batch(self, text: str) -> MatchBatch:
+        kmp_search = self.searcher._kmp_search
+        return MatchBatch.from_positions(
+            self.patterns,
+            (
+                kmp_search(text, pattern, lps) if text else []
+                for pattern, lps in zip(self.patterns, self.lps_tables)
+            ),
+        )
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> MatchBatch:
+        return self.search_batch(text.view(case_sensitive))
+
+    def count(self, text: str) -> Dict[str, int]:
+        kmp_count = self.searcher._kmp_count
+        return {
+            pattern: kmp_count(text, pattern, lps) if text else 0
+            for pattern, lps in zip(self.patterns, self.lps_tables)
+        }
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        return self.count(text.view(case_sensitive))
 
 
 class KMPSearcher(PatternSearcher):
     """KMP algorithm with unified multi-pattern interface."""
 
+    def __init__(self, use_jit: bool = False):
+        """
+        Args:
+            use_jit (bool): Run the search loop as a numba kernel (see jit_kernels);
+                ignored when numba isn't installed.
+        """
+        self.use_jit = use_jit and jit_kernels.JIT_AVAILABLE
+
     def _generate_lps_list(self, pattern: str) -> List[int]:
         """
         Generate the Longest Proper Prefix which is also Suffix (LPS) array.
@@ -39,19 +102,21 @@ class KMPSearcher(PatternSearcher):
 
         return lps
 
-    def _kmp_search(self, text: str, pattern: str) -> List[int]:
+    def _kmp_search(
+        self, text: str, pattern: str, lps: Optional[Sequence[int]] = None
+    ) -> List[int]:
         """
         Knuth-Morris-Pratt string searching algorithm.
 
         Args:
             text (str): The text to search in
             pattern (str): The pattern to search for
+            lps (Optional[Sequence[int]]): LPS array of pattern, generated if not given
 
         Returns:
             List[int]: List of starting indices where pattern is found in text
         """
         matches: List[int] = []
-        lps: List[int] = self._generate_lps_list(pattern)
         text_length: int = len(text)
         pattern_length: int = len(pattern)
 
@@ -60,6 +125,10 @@ class KMPSearcher(PatternSearcher):
             return matches
         if pattern_length > text_length:
             return matches
+        if lps is None:
+            lps = self._generate_lps_list(pattern)
+        if self.use_jit:
+            return jit_kernels.kmp_search(text, pattern, lps)
 
         text_index: int = 0
         pattern_index: int = 0
@@ -80,33 +149,53 @@ class KMPSearcher(PatternSearcher):
 
         return matches
 
-    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
-        """Search for multiple patterns using KMP algorithm."""
+    def _kmp_count(self, text: str, pattern: str, lps: Sequence[int]) -> int:
+        """
+        Number of occurrences of pattern in text, the _kmp_search loop without the match list.
 
-        if not text or not patterns:
-            return []
+        Args:
+            text (str): The text to search in
+            pattern (str): The pattern to search for
+            lps (Sequence[int]): LPS array of pattern
 
-        valid_patterns = [p for p in patterns if p and len(p.strip()) > 0]
-        if not valid_patterns:
-            return []
+        Returns:
+            int: Number of (possibly overlapping) occurrences
+        """
+        text_length: int = len(text)
+        pattern_length: int = len(pattern)
 
-        matches: List[SearchMatch] = []
+        if not pattern or pattern_length > text_length:
+            return 0
+        if self.use_jit:
+            return jit_kernels.kmp_count(text, pattern, lps)
 
-        for pattern in valid_patterns:
-            positions: List[int] = self._kmp_search(text, pattern)
-            for start_pos in positions:
-                end_pos: int = start_pos + len(pattern) - 1
-                match: SearchMatch = SearchMatch(
-                    pattern=pattern,
-                    start_pos=start_pos,
-                    end_pos=end_pos,
-                    similarity=1.0,
-                )
-                matches.append(match)
+        count: int = 0
+        text_index: int = 0
+        pattern_index: int = 0
 
-        matches.sort(key=lambda x: (x.start_pos, x.pattern))
+        while text_index < text_length:
+            if text[text_index] == pattern[pattern_index]:
+                text_index += 1
+                pattern_index += 1
 
-        return matches
+                if pattern_index == pattern_length:
+                    count += 1
+                    pattern_index = lps[pattern_index - 1]
+            else:
+                if pattern_index != 0:
+                    pattern_index = lps[pattern_index - 1]
+                else:
+                    text_index += 1
+
+        return count
+
+    def compile(self, patterns: List[str]) -> CompiledKMP:
+        """Build the LPS array of every pattern once."""
+        return CompiledKMP(self, patterns)
+
+    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
+        """Search for multiple patterns using KMP algorithm."""
+        return self.compile(patterns).search(text)
 
     @property
     def algorithm_name(self) -> str:
@@ -0,0 +1,172 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .pattern_searcher import SearchMatch
+
+
+def _column(values: array) -> np.ndarray:
+    """NumPy view of an array.array, same element type."""
+    return np.frombuffer(values, dtype=np.dtype(values.typecode))
+
+
+class MatchBatch:
+    """
+    Columnar (struct-of-arrays) match results.
+
+    Instead of one frozen SearchMatch per hit, a batch keeps four flat arrays: a pattern id
+    into `patterns`, start and end positions (inclusive, like SearchMatch) and similarity.
+    That is about 24 bytes per hit, sorting is a NumPy argsort, and a batch
+    pickles as a few raw buffers, which makes it cheap to send between processes.
+
+    Iterating (or indexing) yields SearchMatch objects, built on demand. Similarities are
+    stored as 32-bit floats.
+    """
+
+    __slots__ = ("patterns", "pattern_ids", "starts", "ends", "similarities")
+
+    def __init__(self, patterns: Sequence[str] = ()):
+        self.patterns: List[str] = list(patterns)
+        self.pattern_ids = array("I")
+        self.starts = array("l")
+        self.ends = array("l")
+        self.similarities = array("f")
+
+    @classmethod
+    def from_positions(
+        cls, patterns: Sequence[str], positions: Iterable[Iterable[int]]
+    ) -> "MatchBatch":
+        """
+        Build a batch of exact matches, sorted by position, then pattern.
+
+        Args:
+            patterns: The patterns, in the order positions are given
+            positions: Start positions of each pattern
+
+        Returns:
+            MatchBatch: The matches
+        """
+        batch = cls(patterns)
+        for pattern_id, starts in zip(range(len(batch.patterns)), positions):
+            if isinstance(starts, np.ndarray):
+                starts = starts.tolist()
+            count = len(batch.starts)
+            batch.starts.extend(starts)
+            batch.pattern_ids.extend([pattern_id] * (len(batch.starts) - count))
+
+        pattern_ids, starts = _column(batch.pattern_ids), _column(batch.starts)
+        last_offsets = np.array([len(p) - 1 for p in batch.patterns], dtype=starts.dtype)
+        batch.ends.frombytes((starts + last_offsets[pattern_ids]).tobytes())
+        batch.similarities.frombytes(np.ones(len(starts), dtype=np.float32).tobytes())
+        batch.sort()
+        return batch
+
+    @classmethod
+    def from_matches(
+        cls, matches: Iterable[SearchMatch], patterns: Optional[Sequence[str]] = None
+    ) -> "MatchBatch":
+        """
+        Convert SearchMatch objects, keeping their order.
+
+        Args:
+            matches: Matches to convert
+            patterns: Known patterns, so their ids are stable; others are added as they appear
+
+        Returns:
+            MatchBatch: The matches
+        """
+        batch = cls(patterns or ())
+        pattern_ids = {pattern: i for i, pattern in enumerate(batch.patterns)}
+        for match in matches:
+            pattern_id = pattern_ids.get(match.pattern)
+            if pattern_id is None:
+                pattern_id = pattern_ids[match.pattern] = len(batch.patterns)
+                batch.patterns.append(match.pattern)
+            batch.append(pattern_id, match.start_pos, match.end_pos, match.similarity)
+        return batch
+
+    def append(
+        self, pattern_id: int, start_pos: int, end_pos: int, similarity: float = 1.0
+    ) -> None:
+        """Add one match of patterns[pattern_id]."""
+        self.pattern_ids.append(pattern_id)
+        self.starts.append(start_pos)
+        self.ends.append(end_pos)
+        self.similarities.append(similarity)
+
+    def _columns(self):
+        """The four columns as NumPy views (no copies; the arrays can't grow while these live)."""
+        return tuple(_column(getattr(self, name)) for name in self.__slots__[1:])
+
+    def _take(self, order: np.ndarray) -> "MatchBatch":
+        """New batch with the rows in the given order."""
+        batch = MatchBatch(self.patterns)
+        if len(order):
+            for name, column in zip(self.__slots__[1:], self._columns()):
+                getattr(batch, name).frombytes(column[order].tobytes())
+        return batch
+
+    def sort(self) -> None:
+        """Sort in place by position, then pattern, the order searchers return matches in."""
+        if len(self) < 2:
+            return
+        pattern_ids, starts, _, _ = self._columns()
+        # Rank of each pattern id in alphabetical order, so ties break like SearchMatch lists
+        alphabetical = sorted(range(len(self.patterns)), key=self.patterns.__getitem__)
+        pattern_rank = np.empty(len(self.patterns), dtype=np.intp)
+        pattern_rank[alphabetical] = np.arange(len(self.patterns))
+        order = np.lexsort((pattern_rank[pattern_ids], starts))
+        sorted_batch = self._take(order)
+        for name in self.__slots__[1:]:
+            setattr(self, name, getattr(sorted_batch, name))
+
+    def map_positions(self, offsets: Sequence[int]) -> "MatchBatch":
+        """
+        New batch with every position translated through an offset table
+        (e.g. lowercase view -> original text, see TextView.offsets).
+        """
+        mapping = np.asarray(offsets)
+        batch = self._take(np.arange(len(self)))
+        if len(batch):
+            _, starts, ends, _ = batch._columns()
+            starts[:] = mapping[starts]
+            ends[:] = mapping[ends]
+        return batch
+
+    def counts(self) -> Dict[str, int]:
+        """Pattern -> number of matches in the batch."""
+        per_id = np.bincount(self._columns()[0], minlength=len(self.patterns))
+        return dict(zip(self.patterns, per_id.tolist()))
+
+    def to_matches(self) -> List[SearchMatch]:
+        """All matches as SearchMatch objects."""
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[SearchMatch]:
+        patterns = self.patterns
+        for pattern_id, start_pos, end_pos, similarity in zip(
+            self.pattern_ids, self.starts, self.ends, self.similarities
+        ):
+            yield SearchMatch(
+                pattern=patterns[pattern_id],
+                start_pos=start_pos,
+                end_pos=end_pos,
+                similarity=similarity,
+            )
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[SearchMatch, "MatchBatch"]:
+        if isinstance(index, slice):
+            return self._take(np.arange(len(self))[index])
+        return SearchMatch(
+            pattern=self.patterns[self.pattern_ids[index]],
+            start_pos=self.starts[index],
+            end_pos=self.ends[index],
+            similarity=self.similarities[index],
+        )
+
+    def __repr__(self) -> str:
+        return f"MatchBatch({len(self)} matches, {len(self.patterns)} patterns)"
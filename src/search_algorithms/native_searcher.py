@@ -0,0 +1,188 @@
+from typing import Dict, List, Union
+
+from .pattern_searcher import CompiledMatcher, PatternSearcher, SearchMatch
+from .match_batch import MatchBatch
+from .text_view import TextView
+
+
+class CompiledNative(CompiledMatcher):
+    """Patterns checked once for whether they can be searched in ASCII-folded bytes."""
+
+    __slots__ = ("bytes_searchable",)
+
+    def __init__(self, searcher: "NativeSearcher", patterns: List[str]):
+        super().__init__(searcher, patterns)
+        self.bytes_searchable = searcher.can_search_bytes(list(self.patterns))
+
+    def search_view(self, text: TextView, case_sensitive: bool) -> List[SearchMatch]:
+        if not self.patterns:
+            return []
+        patterns = list(self.patterns)
+        if self.bytes_searchable:
+            return self.searcher.search_bytes(text.ascii_view(case_sensitive), patterns)
+        return self.searcher.search_multiple(text.view(case_sensitive), patterns)
+
+    def search_batch(self, text: Union[str, bytes]) -> MatchBatch:
+        if not text:
+            return MatchBatch(self.patterns)
+        as_bytes = isinstance(text, bytes)
+        find_all = self.searcher._find_all
+        return MatchBatch.from_positions(
+            self.patterns,
+            (
+                find_all(text, pattern.encode("ascii") if as_bytes else pattern)
+                for pattern in self.patterns
+            ),
+        )
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> MatchBatch:
+        if self.bytes_searchable:
+            return self.search_batch(text.ascii_view(case_sensitive))
+        return self.search_batch(text.view(case_sensitive))
+
+    def count(self, text: Union[str, bytes]) -> Dict[str, int]:
+        as_bytes = isinstance(text, bytes)
+        count_all = self.searcher._count_all
+        return {
+            pattern: count_all(text, pattern.encode("ascii") if as_bytes else pattern)
+            for pattern in self.patterns
+        }
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        if self.bytes_searchable:
+            return self.count(text.ascii_view(case_sensitive))
+        return self.count(text.view(case_sensitive))
+
+
+class NativeSearcher(PatternSearcher):
+    """
+    Exact matching on the interpreter's built-in substring search.
+
+    str.find / bytes.find run in C (a two-way / memchr based search), so each
+    occurrence costs one C call instead of a Python loop over every character.
+    On the ASCII-folded bytes view of a TextView every character is one byte,
+    which keeps the search on the fastest path even for documents with a few
+    non-ASCII characters.
+    """
+
+    @staticmethod
+    def can_search_bytes(patterns: List[str]) -> bool:
+        """
+        Check whether patterns can be matched against an ASCII-folded bytes view.
+
+        Non-ASCII characters are folded to NUL in that view, so patterns with
+        non-ASCII characters (or NUL) have to be searched in the str view instead.
+
+        Args:
+            patterns (List[str]): Patterns to check
+
+        Returns:
+            bool: True if every pattern is plain ASCII without NUL
+        """
+        return all(p.isascii() and "\x00" not in p for p in patterns)
+
+    def _find_all(self, text: Union[str, bytes], needle: Union[str, bytes]) -> List[int]:
+        """
+        All start positions of needle in text, overlapping ones included.
+
+        Args:
+            text (Union[str, bytes]): The text to search in
+            needle (Union[str, bytes]): The pattern to search for, same type as text
+
+        Returns:
+            List[int]: Starting indices where needle is found in text
+        """
+        positions: List[int] = []
+        find = text.find
+        position = find(needle)
+        while position != -1:
+            positions.append(position)
+            position = find(needle, position + 1)
+        return positions
+
+    def _count_all(self, text: Union[str, bytes], needle: Union[str, bytes]) -> int:
+        """
+        Number of occurrences of needle in text, overlapping ones included.
+        (str.count / bytes.count skip overlapping occurrences.)
+
+        Args:
+            text (Union[str, bytes]): The text to search in
+            needle (Union[str, bytes]): The pattern to count, same type as text
+
+        Returns:
+            int: Occurrence count
+        """
+        count = 0
+        find = text.find
+        position = find(needle)
+        while position != -1:
+            count += 1
+            position = find(needle, position + 1)
+        return count
+
+    def _search(self, text: Union[str, bytes], patterns: List[str]) -> List[SearchMatch]:
+        if not text or not patterns:
+            return []
+
+        # Filter out empty and repeated patterns, a repeat would be reported twice
+        valid_patterns = list(dict.fromkeys(p for p in patterns if p and len(p.strip()) > 0))
+        if not valid_patterns:
+            return []
+
+        matches: List[SearchMatch] = []
+        as_bytes = isinstance(text, bytes)
+
+        for pattern in valid_patterns:
+            needle = pattern.encode("ascii") if as_bytes else pattern
+            for start_pos in self._find_all(text, needle):
+                matches.append(
+                    SearchMatch(
+                        pattern=pattern,
+                        start_pos=start_pos,
+                        end_pos=start_pos + len(pattern) - 1,
+                        similarity=1.0,
+                    )
+                )
+
+        matches.sort(key=lambda x: (x.start_pos, x.pattern))
+        return matches
+
+    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
+        """Search for multiple patterns using built-in substring search."""
+        return self._search(text, patterns)
+
+    def search_bytes(self, data: bytes, patterns: List[str]) -> List[SearchMatch]:
+        """
+        Search an ASCII-folded bytes view (see TextView.ascii_view).
+
+        Positions are byte offsets, which equal character offsets in the view the
+        bytes were folded from. Patterns must pass can_search_bytes().
+
+        Args:
+            data (bytes): ASCII-folded text
+            patterns (List[str]): ASCII patterns to search for
+
+        Returns:
+            List[SearchMatch]: Matches sorted by position
+        """
+        return self._search(data, patterns)
+
+    def search_view(
+        self, text: TextView, patterns: List[str], case_sensitive: bool
+    ) -> List[SearchMatch]:
+        """Search the ASCII-folded bytes view when the patterns allow it."""
+        if self.can_search_bytes(patterns):
+            return self.search_bytes(text.ascii_view(case_sensitive), patterns)
+        return self.search_multiple(text.view(case_sensitive), patterns)
+
+    def compile(self, patterns: List[str]) -> CompiledNative:
+        """Decide once whether patterns can use the bytes view."""
+        return CompiledNative(self, patterns)
+
+    @property
+    def algorithm_name(self) -> str:
+        return "Native (bytes.find)"
+
+    @property
+    def is_exact_match(self) -> bool:
+        return True
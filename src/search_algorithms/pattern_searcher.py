@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+from .text_view import TextView
+
+if TYPE_CHECKING:
+    from .match_batch import MatchBatch
 
 
 @dataclass(frozen=True)
@@ -23,6 +28,116 @@ class SearchStrategy(Enum):
 
     EXACT = "exact"
     FUZZY = "fuzzy"
+    HYBRID = "hybrid"  # Exact for patterns that matched, fuzzy only for the ones that didn't
+
+
+def matches_from_positions(
+    pattern_positions: Iterable[Tuple[str, Iterable[int]]],
+) -> List[SearchMatch]:
+    """
+    Build exact SearchMatch objects from the start positions found for each pattern.
+
+    Args:
+        pattern_positions: (pattern, start positions) pairs
+
+    Returns:
+        List of SearchMatch objects sorted by position, then pattern
+    """
+    matches: List[SearchMatch] = []
+    for pattern, positions in pattern_positions:
+        for start_pos in positions:
+            matches.append(
+                SearchMatch(
+                    pattern=pattern,
+                    start_pos=start_pos,
+                    end_pos=start_pos + len(pattern) - 1,
+                    similarity=1.0,
+                )
+            )
+    matches.sort(key=lambda x: (x.start_pos, x.pattern))
+    return matches
+
+
+class CompiledMatcher:
+    """
+    Patterns prepared once by a PatternSearcher, reusable for any number of documents.
+
+    Searchers with per-pattern tables (KMP failure function, Boyer-Moore shifts,
+    Aho-Corasick automaton) build them when compiling instead of on every search.
+    A matcher never changes after it is built, so worker threads can share one.
+    This base class keeps no tables and simply delegates to its searcher.
+    """
+
+    __slots__ = ("searcher", "patterns")
+
+    def __init__(self, searcher: "PatternSearcher", patterns: Iterable[str]):
+        self.searcher = searcher
+        # Empty and whitespace-only patterns never match; repeated ones would be reported twice
+        self.patterns: Tuple[str, ...] = tuple(
+            dict.fromkeys(p for p in patterns if p and len(p.strip()) > 0)
+        )
+
+    def search(self, text: str) -> List[SearchMatch]:
+        """
+        Search text for the compiled patterns.
+
+        Args:
+            text: Text to search in
+
+        Returns:
+            List of SearchMatch objects sorted by position
+        """
+        if not text or not self.patterns:
+            return []
+        return self.searcher.search_multiple(text, list(self.patterns))
+
+    def search_view(self, text: TextView, case_sensitive: bool) -> List[SearchMatch]:
+        """
+        Search a TextView in the given case mode (see PatternSearcher.search_view).
+        Positions refer to text.view(case_sensitive).
+        """
+        if not self.patterns:
+            return []
+        return self.searcher.search_view(text, list(self.patterns), case_sensitive)
+
+    def search_batch(self, text: str) -> "MatchBatch":
+        """
+        Search text, returning the matches in columnar form (see MatchBatch).
+        The default converts search() results; matchers that find plain positions
+        build the batch directly.
+        """
+        from .match_batch import MatchBatch
+
+        return MatchBatch.from_matches(self.search(text), self.patterns)
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> "MatchBatch":
+        """search_view() in columnar form, see search_batch()."""
+        from .match_batch import MatchBatch
+
+        return MatchBatch.from_matches(self.search_view(text, case_sensitive), self.patterns)
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Occurrences of each compiled pattern in text, without building SearchMatch objects.
+        The default counts search() results; matchers with a counting scan override it.
+
+        Args:
+            text: Text to search in
+
+        Returns:
+            Pattern -> occurrence count, 0 for patterns that don't occur
+        """
+        counts = dict.fromkeys(self.patterns, 0)
+        for match in self.search(text):
+            counts[match.pattern] += 1
+        return counts
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        """Occurrences of each compiled pattern in text.view(case_sensitive), see count()."""
+        counts = dict.fromkeys(self.patterns, 0)
+        for match in self.search_view(text, case_sensitive):
+            counts[match.pattern] += 1
+        return counts
 
 
 class PatternSearcher(ABC):
@@ -42,6 +157,44 @@ class PatternSearcher(ABC):
         """
         pass
 
+    def search_view(
+        self, text: TextView, patterns: List[str], case_sensitive: bool
+    ) -> List[SearchMatch]:
+        """
+        Search a TextView in the given case mode.
+        Positions refer to text.view(case_sensitive). The default searches that str view;
+        searchers with a faster representation of the document override it.
+        """
+        return self.search_multiple(text.view(case_sensitive), patterns)
+
+    def compile(self, patterns: List[str]) -> CompiledMatcher:
+        """
+        Prepare patterns once for searching many documents.
+        The default matcher does no preprocessing and delegates to this searcher;
+        searchers with per-pattern tables return a matcher holding them.
+
+        Args:
+            patterns: Patterns to search for (already in the case they are matched in)
+
+        Returns:
+            An immutable CompiledMatcher
+        """
+        return CompiledMatcher(self, patterns)
+
+    def count_multiple(self, text: str, patterns: List[str]) -> Dict[str, int]:
+        """
+        Count occurrences of multiple patterns in text.
+        Cheaper than len(search_multiple()) when positions aren't needed.
+
+        Args:
+            text: Text to search in
+            patterns: List of patterns to count
+
+        Returns:
+            Pattern -> occurrence count for every non-empty pattern
+        """
+        return self.compile(patterns).count(text)
+
     def search_single(self, text: str, pattern: str) -> List[SearchMatch]:
         """
         Search for a single pattern in text.
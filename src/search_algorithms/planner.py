@@ -0,0 +1,293 @@
+import json
+import math
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .match_batch import MatchBatch
+from .pattern_searcher import CompiledMatcher, SearchMatch
+from .shift_or import pack_lengths
+from .text_view import TextView
+from .wu_manber import default_block_size
+
+if TYPE_CHECKING:
+    from .search_engine import AlgorithmType, SearchEngine
+
+# Document length assumed when a plan is made without a document (a typical CV)
+DEFAULT_TEXT_LENGTH = 8000
+
+# Seconds per unit of estimated work for each algorithm, measured on CV text
+# (see QueryPlanner.calibrate to refit them on the machine at hand)
+DEFAULT_COEFFICIENTS: Dict[str, float] = {
+    "kmp": 1.3e-7,
+    "boyer_moore_simple": 4.5e-7,
+    "boyer_moore_complex": 4.8e-7,
+    "aho_corasick": 1.7e-7,
+    "native": 2.0e-9,
+    "suffix_array": 1.0e-6,
+    "shift_or": 2.5e-7,
+    "wu_manber": 5.0e-7,
+    "rabin_karp": 1.4e-8,
+    "regex": 1.7e-8,
+}
+
+# Distinct blocks of one character in CV text; a block of B characters has about this to the power B values
+BLOCK_ALPHABET = 30
+
+# Cost of one n log n step of building a suffix array (NumPy) relative to one
+# binary search step of a lookup (Python)
+SUFFIX_ARRAY_BUILD_RATIO = 0.09
+
+
+class QueryPlanner:
+    """
+    Picks the exact matching algorithm expected to be fastest for a query.
+
+    Each algorithm has a work estimate from the shape of the query and the document
+    (pattern count k, pattern lengths m, distinct pattern characters, document length n):
+
+    - KMP: one pass per pattern, k * n + sum(m)
+    - Boyer-Moore: one pass per pattern that skips about min(m, distinct chars) per step
+    - Aho-Corasick: one pass for all patterns, n + sum(m)
+    - Native: k C-speed passes, k * n
+    - Shift-Or: one pass per word of packed patterns, words * n
+    - Wu-Manber: n / average shift + sum(m); the shift is up to min(m) - B + 1 and shrinks
+      as the k * (min(m) - B + 1) blocks of the patterns fill the table
+    - Rabin-Karp: one prefix-hash pass plus one array pass per distinct pattern length,
+      then Python verification of the windows whose hash matched, (1 + lengths + k / 8) * n
+    - Regex: one C pass for all patterns that tries the alternatives in turn, n * (1 + k / 3)
+    - Suffix array: two binary searches per pattern, 2k * log n, plus n log n
+      to build the index when the document doesn't carry one yet
+
+    Estimated time is work times a per-algorithm coefficient. The defaults were measured
+    on CV text; calibrate() refits them from benchmark_algorithms() runs and save() / load()
+    keep the result.
+    """
+
+    def __init__(self, coefficients: Optional[Dict[str, float]] = None):
+        self.coefficients: Dict[str, float] = dict(DEFAULT_COEFFICIENTS)
+        if coefficients:
+            self.coefficients.update(coefficients)
+
+    @staticmethod
+    def estimate_work(
+        algorithm: "AlgorithmType",
+        patterns: Sequence[str],
+        text_length: int,
+        indexed: bool = False,
+    ) -> float:
+        """
+        Work estimate of one algorithm for a query, in arbitrary units.
+
+        Args:
+            algorithm: Exact matching algorithm
+            patterns: Patterns of the query
+            text_length: Length of the document
+            indexed: Whether the document already carries a suffix array
+
+        Returns:
+            float: Estimated work
+        """
+        n = max(text_length, 1)
+        k = len(patterns)
+        total_length = sum(len(p) for p in patterns)
+        name = algorithm.value
+
+        if name == "kmp":
+            return k * n + total_length
+        if name in ("boyer_moore_simple", "boyer_moore_complex"):
+            return sum(n / max(1, min(len(p), len(set(p)))) + len(p) for p in patterns)
+        if name == "aho_corasick":
+            return n + total_length
+        if name == "native":
+            return k * n
+        if name == "shift_or":
+            return len(pack_lengths([len(p) for p in patterns])) * n
+        if name == "wu_manber":
+            if not patterns:
+                return 0.0
+            min_length = min(len(p) for p in patterns)
+            block = min(default_block_size(min_length, k), min_length)
+            max_shift = max(min_length - block + 1, 1)
+            # Share of text blocks that appear in the shift table, capped so the shift stays >= 1
+            filled = min(k * max_shift / BLOCK_ALPHABET ** block, 1.0)
+            shift = max(max_shift * (1.0 - filled), 1.0)
+            return n / shift + total_length
+        if name == "rabin_karp":
+            return (1 + len({len(p) for p in patterns}) + k / 8) * n
+        if name == "regex":
+            return n * (1 + k / 3)
+        if name == "suffix_array":
+            lookups = 2 * k * math.log2(n + 1)
+            if indexed:
+                return lookups
+            return lookups + SUFFIX_ARRAY_BUILD_RATIO * n * math.log2(n + 1)
+        return math.inf
+
+    def estimate(
+        self,
+        algorithm: "AlgorithmType",
+        patterns: Sequence[str],
+        text_length: int,
+        indexed: bool = False,
+    ) -> float:
+        """Estimated seconds for one algorithm (see estimate_work)."""
+        coefficient = self.coefficients.get(algorithm.value)
+        if coefficient is None:
+            return math.inf
+        return coefficient * self.estimate_work(algorithm, patterns, text_length, indexed)
+
+    def choose(
+        self,
+        candidates: Iterable["AlgorithmType"],
+        patterns: Sequence[str],
+        text_length: Optional[int] = None,
+        indexed: bool = False,
+    ) -> "AlgorithmType":
+        """
+        The candidate with the lowest estimated time.
+
+        Args:
+            candidates: Algorithms to choose from
+            patterns: Patterns of the query
+            text_length: Length of the document, DEFAULT_TEXT_LENGTH if unknown
+            indexed: Whether the document already carries a suffix array
+
+        Returns:
+            AlgorithmType: The chosen algorithm
+        """
+        if text_length is None:
+            text_length = DEFAULT_TEXT_LENGTH
+        return min(
+            candidates,
+            key=lambda algorithm: self.estimate(algorithm, patterns, text_length, indexed),
+        )
+
+    def calibrate(
+        self, engine: "SearchEngine", samples: Iterable[Tuple[str, List[str]]]
+    ) -> Dict[str, float]:
+        """
+        Refit the coefficients from benchmark_algorithms() runs.
+
+        Each coefficient is the least-squares fit (through the origin) of measured time
+        against estimated work over all samples.
+
+        Args:
+            engine: Engine whose searchers are benchmarked
+            samples: (text, patterns) pairs, ideally shaped like real queries
+
+        Returns:
+            Dict[str, float]: The new coefficients, keyed by AlgorithmType value
+        """
+        names = {
+            searcher.algorithm_name: algorithm
+            for algorithm, searcher in engine._exact_searchers.items()
+        }
+        sums: Dict[str, List[float]] = {}
+        for text, patterns in samples:
+            for name, seconds in engine.benchmark_algorithms(text, patterns).items():
+                algorithm = names[name]
+                work = self.estimate_work(algorithm, patterns, len(text))
+                totals = sums.setdefault(algorithm.value, [0.0, 0.0])
+                totals[0] += seconds * work
+                totals[1] += work * work
+
+        for name, (time_work, work_work) in sums.items():
+            if work_work > 0 and time_work > 0:
+                self.coefficients[name] = time_work / work_work
+        return dict(self.coefficients)
+
+    def save(self, path: str) -> None:
+        """
+        Write the coefficients to a JSON file.
+
+        Args:
+            path (str): Destination file
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.coefficients, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "QueryPlanner":
+        """
+        Planner with coefficients saved by save(); algorithms missing from the file keep the defaults.
+
+        Args:
+            path (str): File written by save()
+
+        Returns:
+            QueryPlanner: The planner
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+
+class AutoMatcher(CompiledMatcher):
+    """
+    Patterns compiled for every candidate algorithm, dispatching each document to the one
+    the planner expects to be fastest for its length (and whether it carries a suffix array).
+
+    Choices are remembered per power-of-two length bucket, so planning costs one dict
+    lookup per document.
+    """
+
+    __slots__ = ("planner", "matchers", "_suffix_array_key", "_choices")
+
+    def __init__(
+        self,
+        planner: QueryPlanner,
+        matchers: Dict["AlgorithmType", CompiledMatcher],
+        patterns: Sequence[str],
+        suffix_array_key: Optional[str] = None,
+    ):
+        # Searching is delegated to the chosen matcher, never to a single searcher
+        super().__init__(None, patterns)  # type: ignore[arg-type]
+        self.planner = planner
+        self.matchers = matchers
+        self._suffix_array_key = suffix_array_key
+        # (length bucket, indexed) -> matcher; filling it in from several threads is harmless
+        self._choices: Dict[Tuple[int, bool], CompiledMatcher] = {}
+
+    def matcher_for(self, text_length: int, indexed: bool = False) -> CompiledMatcher:
+        """
+        The compiled matcher for a document of the given length.
+
+        Args:
+            text_length (int): Length of the document
+            indexed (bool): Whether the document carries a suffix array for this case mode
+
+        Returns:
+            CompiledMatcher: Matcher of the chosen algorithm
+        """
+        bucket = (text_length.bit_length(), indexed)
+        matcher = self._choices.get(bucket)
+        if matcher is None:
+            algorithm = self.planner.choose(
+                self.matchers, self.patterns, 1 << bucket[0], indexed
+            )
+            matcher = self._choices[bucket] = self.matchers[algorithm]
+        return matcher
+
+    def _view_matcher(self, text: TextView, case_sensitive: bool) -> CompiledMatcher:
+        indexed = self._suffix_array_key is not None and text.has_cached(
+            (self._suffix_array_key, case_sensitive)
+        )
+        return self.matcher_for(len(text), indexed)
+
+    def search(self, text: str) -> List[SearchMatch]:
+        return self.matcher_for(len(text)).search(text)
+
+    def search_view(self, text: TextView, case_sensitive: bool) -> List[SearchMatch]:
+        return self._view_matcher(text, case_sensitive).search_view(text, case_sensitive)
+
+    def count(self, text: str) -> Dict[str, int]:
+        return self.matcher_for(len(text)).count(text)
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        return self._view_matcher(text, case_sensitive).count_view(text, case_sensitive)
+
+    def search_batch(self, text: str) -> MatchBatch:
+        return self.matcher_for(len(text)).search_batch(text)
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> MatchBatch:
+        return self._view_matcher(text, case_sensitive).search_view_batch(
+            text, case_sensitive
+        )
@@ -0,0 +1,227 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .match_batch import MatchBatch
+from .pattern_searcher import (
+    CompiledMatcher,
+    PatternSearcher,
+    SearchMatch,
+    matches_from_positions,
+)
+from .text_view import TextView
+
+# Hash base; odd, so it is invertible modulo 2**64 and window hashes can be normalized
+HASH_BASE = 0x100000001B3
+HASH_BASE_INVERSE = pow(HASH_BASE, -1, 1 << 64)
+
+_MASK = (1 << 64) - 1
+
+# Powers of the base and of its inverse, shared by all documents and grown on demand
+_powers = np.ones(1, dtype=np.uint64)
+_inverse_powers = np.ones(1, dtype=np.uint64)
+_powers_lock = threading.Lock()
+
+
+def _power_tables(count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """First count powers of HASH_BASE and of its inverse (uint64, wrapping modulo 2**64)."""
+    global _powers, _inverse_powers
+    powers, inverse_powers = _powers, _inverse_powers
+    if len(powers) < count:
+        with _powers_lock:
+            if len(_powers) < count:
+                size = max(count, 2 * len(_powers), 4096)
+                factors = np.full(size, HASH_BASE, dtype=np.uint64)
+                factors[0] = 1
+                inverse_factors = np.full(size, HASH_BASE_INVERSE, dtype=np.uint64)
+                inverse_factors[0] = 1
+                # Replaced, never resized, so readers holding the old arrays stay valid
+                _powers = np.cumprod(factors, dtype=np.uint64)
+                _inverse_powers = np.cumprod(inverse_factors, dtype=np.uint64)
+            powers, inverse_powers = _powers, _inverse_powers
+    return powers[:count], inverse_powers[:count]
+
+
+def pattern_hash(pattern: str) -> int:
+    """Hash of pattern: sum of code point j times HASH_BASE**j, modulo 2**64."""
+    value = 0
+    for char in reversed(pattern):
+        value = (value * HASH_BASE + ord(char)) & _MASK
+    return value
+
+
+class RollingHashes:
+    """
+    Prefix hashes of one document, from which the hashes of all windows of a given
+    length are two array operations.
+
+    prefix[i] is the sum of code point j times HASH_BASE**j over the first i characters,
+    so prefix[i + m] - prefix[i] is the hash of the window at i scaled by HASH_BASE**i;
+    multiplying by the inverse power normalizes it to pattern_hash of the window.
+    """
+
+    __slots__ = ("text", "prefix")
+
+    def __init__(self, text: str):
+        self.text = text
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        powers, _ = _power_tables(len(codes))
+        self.prefix = np.zeros(len(codes) + 1, dtype=np.uint64)
+        np.cumsum(codes * powers, out=self.prefix[1:])
+
+    def windows(self, length: int) -> np.ndarray:
+        """Hash of every window of the given length, indexed by start position."""
+        count = len(self.text) - length + 1
+        if count <= 0:
+            return np.empty(0, dtype=np.uint64)
+        _, inverse_powers = _power_tables(count)
+        return (self.prefix[length:] - self.prefix[:count]) * inverse_powers
+
+
+class CompiledRabinKarp(CompiledMatcher):
+    """Patterns hashed once and grouped by length."""
+
+    __slots__ = ("groups",)
+
+    def __init__(self, searcher: "RabinKarpSearcher", patterns: List[str]):
+        super().__init__(searcher, patterns)
+        # Length -> (sorted distinct hashes, hash -> pattern indices)
+        by_length: Dict[int, Dict[int, List[int]]] = {}
+        for index, pattern in enumerate(self.patterns):
+            by_length.setdefault(len(pattern), {}).setdefault(
+                pattern_hash(pattern), []
+            ).append(index)
+        self.groups: Tuple[Tuple[int, np.ndarray, Dict[int, List[int]]], ...] = tuple(
+            (length, np.array(sorted(by_hash), dtype=np.uint64), by_hash)
+            for length, by_hash in by_length.items()
+        )
+
+    def _positions(self, hashes: RollingHashes) -> List[List[int]]:
+        """Start positions of each pattern, in pattern order."""
+        positions: List[List[int]] = [[] for _ in self.patterns]
+        text = hashes.text
+        if not text:
+            return positions
+        startswith = text.startswith
+        for length, hash_array, by_hash in self.groups:
+            windows = hashes.windows(length)
+            hits = np.flatnonzero(np.isin(windows, hash_array))
+            if not len(hits):
+                continue
+            # Hashes only nominate windows; each one is confirmed against the text
+            for start, value in zip(hits.tolist(), windows[hits].tolist()):
+                for index in by_hash[value]:
+                    if startswith(self.patterns[index], start):
+                        positions[index].append(start)
+        return positions
+
+    def _counts(self, hashes: RollingHashes) -> Dict[str, int]:
+        """Occurrences of each pattern, the _positions loop without position lists."""
+        counts = [0] * len(self.patterns)
+        text = hashes.text
+        if text:
+            startswith = text.startswith
+            for length, hash_array, by_hash in self.groups:
+                windows = hashes.windows(length)
+                hits = np.flatnonzero(np.isin(windows, hash_array))
+                if not len(hits):
+                    continue
+                for start, value in zip(hits.tolist(), windows[hits].tolist()):
+                    for index in by_hash[value]:
+                        if startswith(self.patterns[index], start):
+                            counts[index] += 1
+        return dict(zip(self.patterns, counts))
+
+    def search(self, text: str) -> List[SearchMatch]:
+        if not text or not self.patterns:
+            return []
+        return matches_from_positions(
+            zip(self.patterns, self._positions(self.searcher.hashes_for(text)))
+        )
+
+    def search_view(self, text: TextView, case_sensitive: bool) -> List[SearchMatch]:
+        if not self.patterns:
+            return []
+        return matches_from_positions(
+            zip(
+                self.patterns,
+                self._positions(self.searcher.view_hashes(text, case_sensitive)),
+            )
+        )
+
+    def search_batch(self, text: str) -> MatchBatch:
+        if not text:
+            return MatchBatch(self.patterns)
+        return MatchBatch.from_positions(
+            self.patterns, self._positions(self.searcher.hashes_for(text))
+        )
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> MatchBatch:
+        return MatchBatch.from_positions(
+            self.patterns,
+            self._positions(self.searcher.view_hashes(text, case_sensitive)),
+        )
+
+    def count(self, text: str) -> Dict[str, int]:
+        if not text:
+            return dict.fromkeys(self.patterns, 0)
+        return self._counts(self.searcher.hashes_for(text))
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        return self._counts(self.searcher.view_hashes(text, case_sensitive))
+
+
+class RabinKarpSearcher(PatternSearcher):
+    """
+    Rabin-Karp matching with NumPy rolling hashes.
+
+    The document becomes a code point array once; the hashes of all its windows of one
+    length come from a cumulative sum, and all query patterns of that length are looked
+    up together with np.isin. Python only touches the windows whose hash matched, so
+    queries with many keywords of few distinct lengths cost a handful of array
+    operations per length.
+    """
+
+    # TextView cache key for the prefix hashes of each case view
+    CACHE_KEY = "rabin_karp"
+
+    def __init__(self):
+        # Hashes of the last text searched. They hold their own text, so checking and
+        # replacing the cache is one read and one assignment, safe across threads
+        self._cached: Optional[RollingHashes] = None
+
+    def hashes_for(self, text: str) -> RollingHashes:
+        """Prefix hashes of text, reusing the last ones when the same text is searched again."""
+        cached = self._cached
+        if cached is None or cached.text is not text:
+            cached = RollingHashes(text)
+            self._cached = cached
+        return cached
+
+    def view_hashes(self, text: TextView, case_sensitive: bool) -> RollingHashes:
+        """Prefix hashes of text.view(case_sensitive), cached on the TextView."""
+        view = text.view(case_sensitive)
+        return text.cached((self.CACHE_KEY, case_sensitive), lambda: RollingHashes(view))
+
+    def compile(self, patterns: List[str]) -> CompiledRabinKarp:
+        """Hash the patterns once, grouped by length."""
+        return CompiledRabinKarp(self, patterns)
+
+    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
+        """Search for multiple patterns using vectorized Rabin-Karp."""
+        return self.compile(patterns).search(text)
+
+    def search_view(
+        self, text: TextView, patterns: List[str], case_sensitive: bool
+    ) -> List[SearchMatch]:
+        """Search using the prefix hashes kept with the document, building them on first use."""
+        return self.compile(patterns).search_view(text, case_sensitive)
+
+    @property
+    def algorithm_name(self) -> str:
+        return "Rabin-Karp"
+
+    @property
+    def is_exact_match(self) -> bool:
+        return True
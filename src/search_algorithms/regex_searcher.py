@@ -0,0 +1,140 @@
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from .match_batch import MatchBatch
+from .pattern_searcher import (
+    CompiledMatcher,
+    PatternSearcher,
+    SearchMatch,
+    matches_from_positions,
+)
+from .text_view import TextView
+
+
+def build_alternation(patterns: List[str]) -> Pattern[str]:
+    """
+    One regex finding every position where any of patterns starts.
+
+    The escaped patterns are joined longest first, so the alternation matches the
+    longest pattern at each position. Wrapping it in a lookahead makes every match
+    zero-width, which lets finditer report overlapping occurrences like the other
+    engines instead of skipping past each match.
+
+    Args:
+        patterns (List[str]): Non-empty patterns
+
+    Returns:
+        Pattern[str]: Regex whose group 1 is the longest pattern starting at each match
+    """
+    ordered = sorted(patterns, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+
+
+class CompiledRegex(CompiledMatcher):
+    """Patterns compiled into one alternation regex once."""
+
+    __slots__ = ("regex", "prefixes")
+
+    def __init__(self, searcher: "RegexSearcher", patterns: List[str]):
+        super().__init__(searcher, patterns)
+        self.regex: Optional[Pattern[str]] = (
+            build_alternation(list(self.patterns)) if self.patterns else None
+        )
+        # Pattern -> indices of all patterns that are a prefix of it (itself included);
+        # where the longest pattern matches, exactly these match too
+        index_of = {pattern: i for i, pattern in enumerate(self.patterns)}
+        self.prefixes: Dict[str, Tuple[int, ...]] = {
+            pattern: tuple(
+                index_of[pattern[:length]]
+                for length in range(1, len(pattern) + 1)
+                if pattern[:length] in index_of
+            )
+            for pattern in self.patterns
+        }
+
+    def _positions(self, text: str) -> List[List[int]]:
+        """Start positions of each pattern, in pattern order."""
+        positions: List[List[int]] = [[] for _ in self.patterns]
+        if not text or self.regex is None:
+            return positions
+        prefixes = self.prefixes
+        for match in self.regex.finditer(text):
+            start = match.start()
+            for index in prefixes[match.group(1)]:
+                positions[index].append(start)
+        return positions
+
+    def search(self, text: str) -> List[SearchMatch]:
+        if not text or not self.patterns:
+            return []
+        return matches_from_positions(zip(self.patterns, self._positions(text)))
+
+    def search_view(self, text: TextView, case_sensitive: bool) -> List[SearchMatch]:
+        return self.search(text.view(case_sensitive))
+
+    def search_batch(self, text: str) -> MatchBatch:
+        if not text:
+            return MatchBatch(self.patterns)
+        return MatchBatch.from_positions(self.patterns, self._positions(text))
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> MatchBatch:
+        return self.search_batch(text.view(case_sensitive))
+
+    def count(self, text: str) -> Dict[str, int]:
+        counts = dict.fromkeys(self.patterns, 0)
+        if not text or self.regex is None:
+            return counts
+        # findall builds the list of longest matches in C; only distinct ones are expanded
+        for longest, occurrences in Counter(self.regex.findall(text)).items():
+            for index in self.prefixes[longest]:
+                counts[self.patterns[index]] += occurrences
+        return counts
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        return self.count(text.view(case_sensitive))
+
+
+class RegexSearcher(PatternSearcher):
+    """
+    Exact matching with one compiled alternation regex, run by the C `re` engine.
+
+    A production-speed baseline for the hand-written algorithms: the whole query is
+    a single escaped, longest-first alternation, so each document is scanned once in C.
+    `re` tries the alternatives in turn at each position rather than walking a trie,
+    so the cost still grows with the keyword count (Aho-Corasick or Wu-Manber win for
+    hundreds of keywords). The last compiled query is reused by search_multiple.
+    """
+
+    def __init__(self):
+        # (patterns, compiled regex) of the last query, replaced in one assignment so
+        # threads sharing the searcher never see a regex paired with other patterns
+        self._cached: Optional[Tuple[List[str], CompiledRegex]] = None
+
+    def compile(self, patterns: List[str]) -> CompiledRegex:
+        """Compile the patterns into one alternation regex."""
+        return CompiledRegex(self, patterns)
+
+    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
+        """Search for multiple patterns using a compiled alternation regex."""
+        if not text or not patterns:
+            return []
+
+        # Recompile only when the query changes
+        cached = self._cached
+        if cached is None or cached[0] != patterns:
+            cached = (list(patterns), self.compile(patterns))
+            self._cached = cached
+        return cached[1].search(text)
+
+    def clear_cache(self) -> None:
+        """Clear the cached regex."""
+        self._cached = None
+
+    @property
+    def algorithm_name(self) -> str:
+        return "Regex"
+
+    @property
+    def is_exact_match(self) -> bool:
+        return True
@@ -3,11 +3,26 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Union
 
+from . import jit_kernels
 from .aho_corasick import AhoCorasickSearcher
 from .boyer_moore import BoyerMooreSearcher
 from .fuzzy_searcher import FuzzySearcher
 from .kmp_searcher import KMPSearcher
-from .pattern_searcher import PatternSearcher, SearchMatch, SearchStrategy
+from .match_batch import MatchBatch
+from .native_searcher import NativeSearcher
+from .planner import AutoMatcher, QueryPlanner
+from .pattern_searcher import (
+    CompiledMatcher,
+    PatternSearcher,
+    SearchMatch,
+    SearchStrategy,
+)
+from .rabin_karp import RabinKarpSearcher
+from .regex_searcher import RegexSearcher
+from .shift_or import ShiftOrSearcher
+from .suffix_array import SuffixArraySearcher
+from .text_view import TextView
+from .wu_manber import WuManberSearcher
 
 
 class AlgorithmType(Enum):
@@ -17,6 +32,14 @@ class AlgorithmType(Enum):
     BOYER_MOORE_SIMPLE = "boyer_moore_simple"
     BOYER_MOORE_COMPLEX = "boyer_moore_complex"
     AHO_CORASICK = "aho_corasick"
+    NATIVE = "native"
+    SUFFIX_ARRAY = "suffix_array"
+    SHIFT_OR = "shift_or"
+    WU_MANBER = "wu_manber"
+    RABIN_KARP = "rabin_karp"
+    REGEX = "regex"
+    # Not an algorithm: the QueryPlanner picks one of the above per query and document
+    AUTO = "auto"
 
 
 @dataclass
@@ -28,6 +51,12 @@ class SearchConfig:
     exact_algorithm: AlgorithmType = AlgorithmType.AHO_CORASICK
     fuzzy_min_similarity: float = 0.6
     use_fuzzy_fallback: bool = True
+    # Fall back per pattern: fuzzy only for patterns without exact hits, even if others matched
+    per_pattern_fallback: bool = False
+    # Run KMP, Boyer-Moore and fuzzy (Levenshtein) inner loops as numba kernels when numba is installed
+    use_jit: bool = False
+    # Compile the kernels when the engine is created instead of on the first search
+    warm_up_jit: bool = False
 
 
 @dataclass
@@ -40,6 +69,8 @@ class SearchStats:
     strategy_used: SearchStrategy
     algorithm_used: str
     patterns_searched: int
+    # True when the time budget ran out and fuzzy matching was cut short
+    partial: bool = False
 
 
 class SearchEngine:
@@ -48,29 +79,53 @@ class SearchEngine:
     then falls back to fuzzy search if needed.
     """
 
-    def __init__(self, config: SearchConfig = SearchConfig()):
+    def __init__(
+        self,
+        config: SearchConfig = SearchConfig(),
+        planner: Optional[QueryPlanner] = None,
+    ):
         self.config = config
+        # Resolves AlgorithmType.AUTO, with default or calibrated cost coefficients
+        self.planner = planner or QueryPlanner()
         self._exact_searchers: Dict[AlgorithmType, PatternSearcher] = {
-            AlgorithmType.KMP: KMPSearcher(),
-            AlgorithmType.BOYER_MOORE_SIMPLE: BoyerMooreSearcher(use_complex=False),
-            AlgorithmType.BOYER_MOORE_COMPLEX: BoyerMooreSearcher(use_complex=True),
+            AlgorithmType.KMP: KMPSearcher(use_jit=config.use_jit),
+            AlgorithmType.BOYER_MOORE_SIMPLE: BoyerMooreSearcher(
+                use_complex=False, use_jit=config.use_jit
+            ),
+            AlgorithmType.BOYER_MOORE_COMPLEX: BoyerMooreSearcher(
+                use_complex=True, use_jit=config.use_jit
+            ),
             AlgorithmType.AHO_CORASICK: AhoCorasickSearcher(),
+            AlgorithmType.NATIVE: NativeSearcher(),
+            AlgorithmType.SUFFIX_ARRAY: SuffixArraySearcher(),
+            AlgorithmType.SHIFT_OR: ShiftOrSearcher(),
+            AlgorithmType.WU_MANBER: WuManberSearcher(),
+            AlgorithmType.RABIN_KARP: RabinKarpSearcher(),
+            AlgorithmType.REGEX: RegexSearcher(),
         }
-        self._fuzzy_searcher = FuzzySearcher(min_similarity=config.fuzzy_min_similarity)
+        self._fuzzy_searcher = FuzzySearcher(
+            min_similarity=config.fuzzy_min_similarity, use_jit=config.use_jit
+        )
+        if config.use_jit and config.warm_up_jit:
+            jit_kernels.warm_up()
 
     def search(
         self,
-        text: str,
+        text: Union[str, TextView],
         patterns: Union[str, List[str]],
         config: Optional[SearchConfig] = None,
+        time_budget: Optional[float] = None,
     ) -> tuple[List[SearchMatch], SearchStats]:
         """
         Unified search method with exact matching and fuzzy fallback.
 
         Args:
-            text: Text to search in
+            text: Text to search in; a TextView avoids lowercasing the document per call,
+                and its match positions always refer to the original text
             patterns: Pattern(s) to search for
             config: Optional search configuration (uses default if None)
+            time_budget: Optional limit in seconds; once it is spent, fuzzy matching stops and
+                the matches found so far are returned with stats.partial set
 
         Returns:
             Tuple of (matches, search statistics)
@@ -85,7 +140,10 @@ class SearchEngine:
             pattern_list = list(patterns)
 
         # Handle case sensitivity
-        search_text = text if search_config.case_sensitive else text.lower()
+        if isinstance(text, TextView):
+            search_text = text.view(search_config.case_sensitive)
+        else:
+            search_text = text if search_config.case_sensitive else text.lower()
         search_patterns = (
             pattern_list
             if search_config.case_sensitive
@@ -93,23 +151,48 @@ class SearchEngine:
         )
 
         start_time = time.perf_counter()
+        deadline = start_time + time_budget if time_budget is not None else None
 
         # Step 1: Try exact matching
-        exact_searcher = self._exact_searchers[search_config.exact_algorithm]
-        exact_matches = exact_searcher.search_multiple(search_text, search_patterns)
+        exact_searcher = self._exact_searchers[
+            self._resolve_algorithm(
+                search_config.exact_algorithm,
+                search_patterns,
+                text,
+                search_config.case_sensitive,
+            )
+        ]
+        if isinstance(text, TextView):
+            # Lets searchers use structures kept with the document (bytes view, suffix array)
+            exact_matches = exact_searcher.search_view(
+                text, search_patterns, search_config.case_sensitive
+            )
+        else:
+            exact_matches = exact_searcher.search_multiple(search_text, search_patterns)
 
-        # Step 2: Use fuzzy search if no exact matches and fallback is enabled
+        # Step 2: Use fuzzy search for the patterns exact matching missed, if fallback is enabled
         fuzzy_matches: List[SearchMatch] = []
         strategy_used = SearchStrategy.EXACT
-
-        if not exact_matches and search_config.use_fuzzy_fallback:
-            self._fuzzy_searcher.set_similarity_threshold(
-                search_config.fuzzy_min_similarity
-            )
-            fuzzy_matches = self._fuzzy_searcher.search_multiple(
-                search_text, search_patterns
-            )
-            strategy_used = SearchStrategy.FUZZY
+        partial = False
+
+        if search_config.use_fuzzy_fallback:
+            if search_config.per_pattern_fallback:
+                matched = {match.pattern for match in exact_matches}
+                fallback_patterns = [p for p in search_patterns if p not in matched]
+            else:
+                fallback_patterns = [] if exact_matches else search_patterns
+
+            if fallback_patterns:
+                self._fuzzy_searcher.set_similarity_threshold(
+                    search_config.fuzzy_min_similarity
+                )
+                fuzzy_matches, complete = self._fuzzy_searcher.search_multiple_until(
+                    search_text, fallback_patterns, deadline
+                )
+                partial = not complete
+                strategy_used = (
+                    SearchStrategy.HYBRID if exact_matches else SearchStrategy.FUZZY
+                )
 
         end_time = time.perf_counter()
 
@@ -121,6 +204,8 @@ class SearchEngine:
             all_matches = self._restore_original_patterns(
                 all_matches, pattern_list, search_patterns
             )
+            if isinstance(text, TextView):
+                all_matches = self._map_to_original(all_matches, text)
 
         # Limit results
         limited_matches = all_matches[: search_config.max_results]
@@ -133,10 +218,26 @@ class SearchEngine:
             strategy_used=strategy_used,
             algorithm_used=exact_searcher.algorithm_name,
             patterns_searched=len(pattern_list),
+            partial=partial,
         )
 
         return limited_matches, stats
 
+    def _resolve_algorithm(
+        self,
+        algorithm: AlgorithmType,
+        patterns: List[str],
+        text: Union[str, TextView],
+        case_sensitive: bool,
+    ) -> AlgorithmType:
+        """The algorithm to run: AUTO becomes the planner's choice for this text."""
+        if algorithm != AlgorithmType.AUTO:
+            return algorithm
+        indexed = isinstance(text, TextView) and text.has_cached(
+            (SuffixArraySearcher.CACHE_KEY, case_sensitive)
+        )
+        return self.planner.choose(self._exact_searchers, patterns, len(text), indexed)
+
     def _restore_original_patterns(
         self,
         matches: List[SearchMatch],
@@ -159,21 +260,187 @@ class SearchEngine:
 
         return restored_matches
 
+    def _map_to_original(
+        self, matches: List[SearchMatch], text: TextView
+    ) -> List[SearchMatch]:
+        """Translate positions in the lowercase view back to the original text."""
+        if text.is_identity:
+            return matches
+
+        mapped_matches = []
+        for match in matches:
+            start_pos, end_pos = text.to_original(match.start_pos, match.end_pos)
+            mapped_matches.append(
+                SearchMatch(
+                    pattern=match.pattern,
+                    start_pos=start_pos,
+                    end_pos=end_pos,
+                    similarity=match.similarity,
+                )
+            )
+
+        return mapped_matches
+
     def search_exact_only(
         self,
-        text: str,
+        text: Union[str, TextView],
         patterns: Union[str, List[str]],
         algorithm: AlgorithmType = AlgorithmType.AHO_CORASICK,
+        case_sensitive: bool = True,
     ) -> tuple[List[SearchMatch], SearchStats]:
         """Search using only exact matching algorithms."""
-        config = SearchConfig(exact_algorithm=algorithm, use_fuzzy_fallback=False)
+        config = SearchConfig(
+            case_sensitive=case_sensitive,
+            exact_algorithm=algorithm,
+            use_fuzzy_fallback=False,
+        )
         return self.search(text, patterns, config)
 
+    def compile_exact(
+        self,
+        patterns: Union[str, List[str]],
+        algorithm: AlgorithmType = AlgorithmType.AHO_CORASICK,
+        case_sensitive: bool = True,
+    ) -> CompiledMatcher:
+        """
+        Prepare patterns once for exact searches over many documents (see search_compiled).
+
+        Args:
+            patterns: Pattern(s) to search for
+            algorithm: Exact matching algorithm
+            case_sensitive: Whether the matcher will be used for case sensitive searches
+
+        Returns:
+            An immutable matcher that can be shared between threads
+        """
+        pattern_list = [patterns] if isinstance(patterns, str) else list(patterns)
+        if not case_sensitive:
+            pattern_list = [p.lower() for p in pattern_list]
+        if algorithm == AlgorithmType.AUTO:
+            # Compiling is cheap next to scanning, so every candidate is ready up front
+            return AutoMatcher(
+                self.planner,
+                {
+                    algo: searcher.compile(pattern_list)
+                    for algo, searcher in self._exact_searchers.items()
+                },
+                pattern_list,
+                SuffixArraySearcher.CACHE_KEY,
+            )
+        return self._exact_searchers[algorithm].compile(pattern_list)
+
+    def search_compiled(
+        self,
+        text: Union[str, TextView],
+        matcher: CompiledMatcher,
+        case_sensitive: bool = True,
+    ) -> List[SearchMatch]:
+        """
+        Exact search with a matcher from compile_exact, skipping per-call pattern preprocessing.
+
+        Args:
+            text: Text to search in; positions in a TextView refer to the original text
+            matcher: Matcher compiled with the same case_sensitive setting
+            case_sensitive: Whether the search is case sensitive
+
+        Returns:
+            Matches sorted by position, limited to config.max_results. For case insensitive
+            searches match.pattern is the lowercase pattern.
+        """
+        if isinstance(text, TextView):
+            matches = matcher.search_view(text, case_sensitive)
+            if not case_sensitive:
+                matches = self._map_to_original(matches, text)
+        else:
+            matches = matcher.search(text if case_sensitive else text.lower())
+        return matches[: self.config.max_results]
+
+    def search_batch(
+        self,
+        text: Union[str, TextView],
+        patterns: Union[str, List[str], CompiledMatcher],
+        algorithm: AlgorithmType = AlgorithmType.AHO_CORASICK,
+        case_sensitive: bool = True,
+    ) -> MatchBatch:
+        """
+        Exact search returning columnar results, for callers that handle many matches.
+
+        Unlike search(), the result isn't limited to config.max_results, and matches
+        are only turned into SearchMatch objects if the batch is iterated.
+
+        Args:
+            text: Text to search in; positions in a TextView refer to the original text
+            patterns: Pattern(s) to search for, or a matcher from compile_exact
+                (then algorithm is ignored)
+            algorithm: Exact matching algorithm
+            case_sensitive: Whether the search is case sensitive
+
+        Returns:
+            MatchBatch sorted by position; for case insensitive searches its
+            patterns are lowercase
+        """
+        if isinstance(patterns, CompiledMatcher):
+            matcher = patterns
+        else:
+            matcher = self.compile_exact(patterns, algorithm, case_sensitive)
+
+        if not isinstance(text, TextView):
+            return matcher.search_batch(text if case_sensitive else text.lower())
+        batch = matcher.search_view_batch(text, case_sensitive)
+        if not case_sensitive and not text.is_identity:
+            batch = batch.map_positions(text.offsets)
+        return batch
+
+    def count_compiled(
+        self,
+        text: Union[str, TextView],
+        matcher: CompiledMatcher,
+        case_sensitive: bool = True,
+    ) -> Dict[str, int]:
+        """
+        Occurrences of each pattern of a matcher from compile_exact, without building matches.
+
+        Args:
+            text: Text to search in
+            matcher: Matcher compiled with the same case_sensitive setting
+            case_sensitive: Whether the search is case sensitive
+
+        Returns:
+            Compiled pattern (lowercase for case insensitive searches) -> occurrence count.
+            Counts are not limited by config.max_results.
+        """
+        if isinstance(text, TextView):
+            return matcher.count_view(text, case_sensitive)
+        return matcher.count(text if case_sensitive else text.lower())
+
+    def count_exact_only(
+        self,
+        text: Union[str, TextView],
+        patterns: Union[str, List[str]],
+        algorithm: AlgorithmType = AlgorithmType.AHO_CORASICK,
+        case_sensitive: bool = True,
+    ) -> Dict[str, int]:
+        """Count exact occurrences of each pattern (keyed as given) without building matches."""
+        pattern_list = [patterns] if isinstance(patterns, str) else list(patterns)
+        matcher = self.compile_exact(pattern_list, algorithm, case_sensitive)
+        counts = self.count_compiled(text, matcher, case_sensitive)
+        return {
+            pattern: counts.get(pattern if case_sensitive else pattern.lower(), 0)
+            for pattern in pattern_list
+            if pattern and len(pattern.strip()) > 0
+        }
+
     def search_fuzzy_only(
-        self, text: str, patterns: Union[str, List[str]], min_similarity: float = 0.6
+        self,
+        text: Union[str, TextView],
+        patterns: Union[str, List[str]],
+        min_similarity: float = 0.6,
+        time_budget: Optional[float] = None,
+        case_sensitive: bool = True,
     ) -> tuple[List[SearchMatch], SearchStats]:
-        """Search using only fuzzy matching."""
+        """Search using only fuzzy matching, optionally within a time budget in seconds."""
         start_time = time.perf_counter()
+        deadline = start_time + time_budget if time_budget is not None else None
 
         # Normalize patterns
         if isinstance(patterns, str):
@@ -181,9 +448,26 @@ class SearchEngine:
         else:
             pattern_list = list(patterns)
 
+        # Handle case sensitivity
+        if isinstance(text, TextView):
+            search_text = text.view(case_sensitive)
+        else:
+            search_text = text if case_sensitive else text.lower()
+        search_patterns = (
+            pattern_list if case_sensitive else [p.lower() for p in pattern_list]
+        )
+
         # Set similarity and search
         self._fuzzy_searcher.set_similarity_threshold(min_similarity)
-        matches = self._fuzzy_searcher.search_multiple(text, pattern_list)
+        matches, complete = self._fuzzy_searcher.search_multiple_until(
+            search_text, search_patterns, deadline
+        )
+        if not case_sensitive:
+            matches = self._restore_original_patterns(
+                matches, pattern_list, search_patterns
+            )
+            if isinstance(text, TextView):
+                matches = self._map_to_original(matches, text)
 
         end_time = time.perf_counter()
 
@@ -194,6 +478,7 @@ class SearchEngine:
             strategy_used=SearchStrategy.FUZZY,
             algorithm_used=self._fuzzy_searcher.algorithm_name,
             patterns_searched=len(pattern_list),
+            partial=not complete,
         )
 
         return matches, stats
@@ -210,6 +495,24 @@ class SearchEngine:
 
         return results
 
+    def calibrate_planner(
+        self, samples: List[tuple[str, List[str]]], path: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        Fit the planner's cost model to this machine with benchmark_algorithms() runs.
+
+        Args:
+            samples: (text, patterns) pairs shaped like real queries
+            path: Optional JSON file to keep the calibration in (load with QueryPlanner.load)
+
+        Returns:
+            The fitted coefficients
+        """
+        coefficients = self.planner.calibrate(self, samples)
+        if path:
+            self.planner.save(path)
+        return coefficients
+
     def update_config(self, config: SearchConfig) -> None:
         """Update the search configuration."""
         self.config = config
@@ -0,0 +1,221 @@
+from typing import Dict, List, Tuple
+
+from .match_batch import MatchBatch
+from .pattern_searcher import (
+    CompiledMatcher,
+    PatternSearcher,
+    SearchMatch,
+    matches_from_positions,
+)
+from .text_view import TextView
+
+# Patterns are packed into state words of up to this many bits (one bit per pattern character)
+WORD_SIZE = 64
+
+
+class ShiftOrGroup:
+    """
+    Bit-parallel automaton for patterns packed into one state word.
+
+    Pattern j occupies bits offset_j .. offset_j + len_j - 1; bit offset_j + i is set
+    while the last i + 1 characters read equal the first i + 1 characters of pattern j.
+    """
+
+    __slots__ = ("patterns", "masks", "initial", "final", "final_bits")
+
+    def __init__(self, patterns: List[str]):
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        # Character -> bits of the pattern positions holding that character
+        self.masks: Dict[str, int] = {}
+        # First bit of every pattern: a match can start at any character
+        self.initial = 0
+        # Last bit of every pattern: reaching it means a full match
+        self.final = 0
+        # Final bit -> index of its pattern
+        self.final_bits: Dict[int, int] = {}
+
+        offset = 0
+        for index, pattern in enumerate(self.patterns):
+            for i, char in enumerate(pattern):
+                self.masks[char] = self.masks.get(char, 0) | (1 << (offset + i))
+            self.initial |= 1 << offset
+            last_bit = 1 << (offset + len(pattern) - 1)
+            self.final |= last_bit
+            self.final_bits[last_bit] = index
+            offset += len(pattern)
+
+    def scan(self, text: str) -> List[List[int]]:
+        """
+        Start positions of every pattern of the group in text, in one pass.
+
+        Args:
+            text (str): The text to search in
+
+        Returns:
+            List[List[int]]: Start positions per pattern, in group order
+        """
+        positions: List[List[int]] = [[] for _ in self.patterns]
+        masks_get = self.masks.get
+        initial = self.initial
+        final = self.final
+        state = 0
+
+        for index, char in enumerate(text):
+            # Extend every partial match by char and start a new one at each pattern
+            state = ((state << 1) | initial) & masks_get(char, 0)
+            if state & final:
+                hits = state & final
+                while hits:
+                    bit = hits & -hits
+                    pattern_index = self.final_bits[bit]
+                    positions[pattern_index].append(
+                        index - len(self.patterns[pattern_index]) + 1
+                    )
+                    hits ^= bit
+
+        return positions
+
+    def count(self, text: str) -> List[int]:
+        """
+        Occurrences of every pattern of the group in text, in one pass.
+
+        Args:
+            text (str): The text to search in
+
+        Returns:
+            List[int]: Occurrence count per pattern, in group order
+        """
+        counts = [0] * len(self.patterns)
+        masks_get = self.masks.get
+        initial = self.initial
+        final = self.final
+        state = 0
+
+        for char in text:
+            state = ((state << 1) | initial) & masks_get(char, 0)
+            if state & final:
+                hits = state & final
+                while hits:
+                    bit = hits & -hits
+                    counts[self.final_bits[bit]] += 1
+                    hits ^= bit
+
+        return counts
+
+
+def pack_lengths(lengths: List[int], word_size: int = WORD_SIZE) -> List[List[int]]:
+    """
+    Pack pattern lengths into state words, in order.
+
+    Args:
+        lengths (List[int]): Lengths of non-empty patterns
+        word_size (int): Bits per state word; a longer pattern gets a word of its own
+
+    Returns:
+        List[List[int]]: Indices of the patterns in each word
+    """
+    words: List[List[int]] = []
+    used = word_size
+    for index, length in enumerate(lengths):
+        if not words or used + length > word_size:
+            words.append([])
+            used = 0
+        words[-1].append(index)
+        used += length
+    return words
+
+
+def pack_patterns(patterns: List[str], word_size: int = WORD_SIZE) -> List[ShiftOrGroup]:
+    """
+    Pack patterns into as few state words as possible, in order.
+
+    Args:
+        patterns (List[str]): Non-empty patterns
+        word_size (int): Bits per state word; a longer pattern gets a word of its own
+
+    Returns:
+        List[ShiftOrGroup]: Automata covering all patterns
+    """
+    return [
+        ShiftOrGroup([patterns[i] for i in word])
+        for word in pack_lengths([len(p) for p in patterns], word_size)
+    ]
+
+
+class CompiledShiftOr(CompiledMatcher):
+    """Patterns packed into bit-parallel automata once."""
+
+    __slots__ = ("groups",)
+
+    def __init__(self, searcher: "ShiftOrSearcher", patterns: List[str]):
+        super().__init__(searcher, patterns)
+        self.groups = tuple(pack_patterns(list(self.patterns), searcher.word_size))
+
+    def _positions(self, text: str) -> List[List[int]]:
+        """Start positions of each pattern, in pattern order."""
+        positions: List[List[int]] = []
+        for group in self.groups:
+            positions.extend(group.scan(text))
+        return positions
+
+    def search(self, text: str) -> List[SearchMatch]:
+        if not text or not self.patterns:
+            return []
+        return matches_from_positions(zip(self.patterns, self._positions(text)))
+
+    def search_view(self, text: TextView, case_sensitive: bool) -> List[SearchMatch]:
+        return self.search(text.view(case_sensitive))
+
+    def search_batch(self, text: str) -> MatchBatch:
+        if not text:
+            return MatchBatch(self.patterns)
+        return MatchBatch.from_positions(self.patterns, self._positions(text))
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> MatchBatch:
+        return self.search_batch(text.view(case_sensitive))
+
+    def count(self, text: str) -> Dict[str, int]:
+        counts: List[int] = []
+        for group in self.groups:
+            counts.extend(group.count(text) if text else [0] * len(group.patterns))
+        return dict(zip(self.patterns, counts))
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        return self.count(text.view(case_sensitive))
+
+
+class ShiftOrSearcher(PatternSearcher):
+    """
+    Bit-parallel Shift-Or matching, several short patterns per pass.
+
+    Every pattern position is one bit of an integer state, so reading a character
+    updates all partial matches with a shift, an OR and an AND instead of a
+    character-by-character comparison loop. Patterns are packed into words of
+    word_size bits, so a query of a few skill keywords is matched in one pass.
+
+    This uses the positive-logic form (Shift-And): with Python's unbounded ints,
+    the complemented bits of classic Shift-Or would need extra masking.
+    """
+
+    def __init__(self, word_size: int = WORD_SIZE):
+        """
+        Args:
+            word_size (int): Bits per state word when packing patterns.
+        """
+        self.word_size = word_size
+
+    def compile(self, patterns: List[str]) -> CompiledShiftOr:
+        """Pack the patterns into bit-parallel automata once."""
+        return CompiledShiftOr(self, patterns)
+
+    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
+        """Search for multiple patterns using bit-parallel Shift-Or."""
+        return self.compile(patterns).search(text)
+
+    @property
+    def algorithm_name(self) -> str:
+        return "Shift-Or"
+
+    @property
+    def is_exact_match(self) -> bool:
+        return True
@@ -0,0 +1,255 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .match_batch import MatchBatch
+from .pattern_searcher import CompiledMatcher, PatternSearcher, SearchMatch
+from .text_view import TextView
+
+
+def build_suffix_array(text: str) -> np.ndarray:
+    """
+    Build the suffix array of text by prefix doubling.
+
+    Each round sorts suffixes by the ranks of their first 2k characters, combining
+    the rank pair into one int64 key so a single NumPy argsort does the work. Natural
+    text usually settles after a handful of rounds.
+
+    Args:
+        text (str): Text to index
+
+    Returns:
+        np.ndarray: int32 start positions of the suffixes of text in sorted order
+    """
+    n = len(text)
+    if n == 0:
+        return np.empty(0, dtype=np.int32)
+
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    _, rank = np.unique(codes, return_inverse=True)
+    rank = rank.astype(np.int64)
+
+    k = 1
+    while True:
+        # Rank of the suffix k characters further on, 0 past the end so shorter suffixes sort first
+        second = np.zeros(n, dtype=np.int64)
+        second[: n - k] = rank[k:] + 1
+        key = rank * (n + 1) + second
+        suffix_array = np.argsort(key, kind="stable")
+
+        sorted_keys = key[suffix_array]
+        new_rank = np.empty(n, dtype=np.int64)
+        new_rank[suffix_array] = np.cumsum(
+            np.concatenate(([0], sorted_keys[1:] != sorted_keys[:-1]))
+        )
+        rank = new_rank
+
+        # Done once every suffix has a distinct rank
+        if rank[suffix_array[-1]] == n - 1 or k >= n:
+            return suffix_array.astype(np.int32)
+        k *= 2
+
+
+class SuffixArrayIndex:
+    """
+    Suffix array over one document for counting and locating arbitrary substrings.
+
+    All occurrences of a pattern are one contiguous run of the suffix array, found
+    with two binary searches: O(m log n) per pattern, however often it occurs and
+    without scanning the text. The array is plain NumPy and can be saved to disk
+    and loaded back next to the text it was built from.
+    """
+
+    def __init__(self, text: str, suffix_array: Optional[np.ndarray] = None):
+        self.text = text
+        self.suffix_array = (
+            suffix_array if suffix_array is not None else build_suffix_array(text)
+        )
+
+    def _bounds(self, pattern: str) -> Tuple[int, int]:
+        """[lo, hi) range of suffixes that start with pattern."""
+        text = self.text
+        suffix_array = self.suffix_array
+        m = len(pattern)
+
+        lo, hi = 0, len(suffix_array)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = suffix_array[mid]
+            if text[start : start + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+
+        hi = len(suffix_array)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = suffix_array[mid]
+            if text[start : start + m] <= pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def count(self, pattern: str) -> int:
+        """
+        Number of (possibly overlapping) occurrences of pattern.
+
+        Args:
+            pattern (str): Substring to count
+
+        Returns:
+            int: Occurrence count
+        """
+        if not pattern:
+            return 0
+        lo, hi = self._bounds(pattern)
+        return hi - lo
+
+    def locate(self, pattern: str) -> np.ndarray:
+        """
+        Start positions of every occurrence of pattern.
+
+        Args:
+            pattern (str): Substring to find
+
+        Returns:
+            np.ndarray: Sorted start positions
+        """
+        if not pattern:
+            return np.empty(0, dtype=np.int32)
+        lo, hi = self._bounds(pattern)
+        return np.sort(self.suffix_array[lo:hi])
+
+    def save(self, path: str) -> None:
+        """
+        Write the suffix array to a .npy file.
+
+        Args:
+            path (str): Destination file
+        """
+        with open(path, "wb") as f:
+            np.save(f, self.suffix_array)
+
+    @classmethod
+    def load(cls, path: str, text: str) -> Optional["SuffixArrayIndex"]:
+        """
+        Load a suffix array saved for text.
+
+        Args:
+            path (str): File written by save()
+            text (str): The text the array was built from
+
+        Returns:
+            Optional[SuffixArrayIndex]: The index, or None if the file doesn't fit the text
+        """
+        suffix_array = np.load(path)
+        if suffix_array.ndim != 1 or len(suffix_array) != len(text):
+            return None
+        return cls(text, suffix_array.astype(np.int32, copy=False))
+
+
+class CompiledSuffixArray(CompiledMatcher):
+    """Patterns counted with two binary searches each instead of listing their positions."""
+
+    __slots__ = ()
+
+    def count(self, text: str) -> Dict[str, int]:
+        if not text:
+            return dict.fromkeys(self.patterns, 0)
+        return self._count(self.searcher.index_for(text))
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        return self._count(self.searcher.view_index(text, case_sensitive))
+
+    def search_batch(self, text: str) -> MatchBatch:
+        if not text:
+            return MatchBatch(self.patterns)
+        return self._batch(self.searcher.index_for(text))
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> MatchBatch:
+        return self._batch(self.searcher.view_index(text, case_sensitive))
+
+    def _batch(self, index: SuffixArrayIndex) -> MatchBatch:
+        return MatchBatch.from_positions(
+            self.patterns, (index.locate(pattern) for pattern in self.patterns)
+        )
+
+    def _count(self, index: SuffixArrayIndex) -> Dict[str, int]:
+        return {pattern: index.count(pattern) for pattern in self.patterns}
+
+
+class SuffixArraySearcher(PatternSearcher):
+    """Exact matching by suffix array lookups instead of scanning the text."""
+
+    # TextView cache key for the index of each case view
+    CACHE_KEY = "suffix_array"
+
+    def __init__(self):
+        # Index of the last text searched; it carries that text, so there is no separate
+        # key that another thread could update out of step with it
+        self._cached: Optional[SuffixArrayIndex] = None
+
+    def index_for(self, text: str) -> SuffixArrayIndex:
+        """Suffix array for text, reusing the last one when the same text is searched again."""
+        cached = self._cached
+        if cached is None or cached.text is not text:
+            cached = SuffixArrayIndex(text)
+            self._cached = cached
+        return cached
+
+    def _search(self, index: SuffixArrayIndex, patterns: List[str]) -> List[SearchMatch]:
+        if not index.text or not patterns:
+            return []
+
+        # Filter out empty and repeated patterns, a repeat would be reported twice
+        valid_patterns = list(dict.fromkeys(p for p in patterns if p and len(p.strip()) > 0))
+        if not valid_patterns:
+            return []
+
+        matches: List[SearchMatch] = []
+        for pattern in valid_patterns:
+            for start_pos in index.locate(pattern).tolist():
+                matches.append(
+                    SearchMatch(
+                        pattern=pattern,
+                        start_pos=start_pos,
+                        end_pos=start_pos + len(pattern) - 1,
+                        similarity=1.0,
+                    )
+                )
+
+        matches.sort(key=lambda x: (x.start_pos, x.pattern))
+        return matches
+
+    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
+        """Search for multiple patterns using a suffix array of text."""
+        if not text or not patterns:
+            return []
+        return self._search(self.index_for(text), patterns)
+
+    def search_view(
+        self, text: TextView, patterns: List[str], case_sensitive: bool
+    ) -> List[SearchMatch]:
+        """Search using the suffix array kept with the document, building it on first use."""
+        return self._search(self.view_index(text, case_sensitive), patterns)
+
+    def view_index(self, text: TextView, case_sensitive: bool) -> SuffixArrayIndex:
+        """Suffix array of text.view(case_sensitive), cached on the TextView."""
+        view = text.view(case_sensitive)
+        return text.cached(
+            (self.CACHE_KEY, case_sensitive), lambda: SuffixArrayIndex(view)
+        )
+
+    def compile(self, patterns: List[str]) -> CompiledSuffixArray:
+        """Patterns that are counted by suffix array range size."""
+        return CompiledSuffixArray(self, patterns)
+
+    @property
+    def algorithm_name(self) -> str:
+        return "Suffix Array"
+
+    @property
+    def is_exact_match(self) -> bool:
+        return True
@@ -0,0 +1,219 @@
+from typing import Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+
+from .fuzzy_searcher import prefix_distances
+
+# Character histograms fold code points into this many bins (a coarser histogram is
+# still a valid lower bound on the edit distance)
+HISTOGRAM_BINS = 32
+
+
+def _histograms(codes: np.ndarray) -> np.ndarray:
+    """Per-row character histograms of a (rows, length) code point matrix."""
+    rows = codes.shape[0]
+    offsets = np.arange(rows, dtype=np.intp)[:, None] * HISTOGRAM_BINS
+    bins = (codes % HISTOGRAM_BINS).astype(np.intp) + offsets
+    counts = np.bincount(bins.ravel(), minlength=rows * HISTOGRAM_BINS)
+    return counts.reshape(rows, HISTOGRAM_BINS).astype(np.int16)
+
+
+def bounded_levenshtein(str1: str, str2: str, max_distance: int) -> int:
+    """
+    Levenshtein distance that gives up once it must exceed max_distance.
+
+    Args:
+        str1 (str): First string
+        str2 (str): Second string
+        max_distance (int): Largest distance of interest
+
+    Returns:
+        int: The edit distance, or max_distance + 1 if it is larger than max_distance
+    """
+    if abs(len(str1) - len(str2)) > max_distance:
+        return max_distance + 1
+    if len(str1) > len(str2):
+        str1, str2 = str2, str1
+
+    prev_row: List[int] = list(range(len(str1) + 1))
+    for j in range(1, len(str2) + 1):
+        curr_row: List[int] = [j] + [0] * len(str1)
+        for i in range(1, len(str1) + 1):
+            if str1[i - 1] == str2[j - 1]:
+                curr_row[i] = prev_row[i - 1]
+            else:
+                curr_row[i] = 1 + min(prev_row[i], curr_row[i - 1], prev_row[i - 1])
+        # Every path to the final cell passes through this row
+        if min(curr_row) > max_distance:
+            return max_distance + 1
+        prev_row = curr_row
+
+    return min(prev_row[len(str1)], max_distance + 1)
+
+
+class SymSpellIndex:
+    """
+    Symmetric-delete (SymSpell) dictionary over a vocabulary of corpus tokens.
+
+    Every term is stored under all strings obtainable by deleting up to max_edit_distance
+    characters from it. Two words within distance d share such a delete, so a lookup only
+    generates the deletes of the query and verifies the few terms they point to, instead of
+    comparing the query against the whole vocabulary or sliding it over raw text.
+
+    Deletes grow combinatorially with the distance, so larger distances (long keywords at
+    a low similarity threshold) are answered from terms bucketed by length instead: in each
+    bucket within range, a character histogram bound drops most terms and the rest are
+    scored together by the batched NumPy DP.
+    """
+
+    def __init__(self, max_edit_distance: int = 2) -> None:
+        self.max_edit_distance = max_edit_distance
+        self._deletes: Dict[str, Set[str]] = {}
+        self._terms: Set[str] = set()
+        # Length -> terms of that length; their code points as a (terms, length) matrix
+        # and character histograms, built on first use
+        self._by_length: Dict[int, List[str]] = {}
+        self._matrices: Dict[int, Tuple[List[str], np.ndarray, np.ndarray]] = {}
+
+    def _generate_deletes(self, term: str, max_distance: int) -> Set[str]:
+        """All strings reachable from term by deleting up to max_distance characters."""
+        deletes: Set[str] = {term}
+        frontier: Set[str] = {term}
+        for _ in range(max_distance):
+            next_frontier: Set[str] = set()
+            for word in frontier:
+                for i in range(len(word)):
+                    next_frontier.add(word[:i] + word[i + 1 :])
+            next_frontier -= deletes
+            deletes |= next_frontier
+            frontier = next_frontier
+        return deletes
+
+    def _length_bucket(self, length: int) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Terms of one length, their code point matrix and histograms, built on first use."""
+        bucket = self._matrices.get(length)
+        if bucket is None:
+            terms = list(self._by_length.get(length, ()))
+            codes = np.frombuffer("".join(terms).encode("utf-32-le"), dtype=np.uint32)
+            codes = codes.reshape(len(terms), length)
+            bucket = (terms, codes, _histograms(codes))
+            self._matrices[length] = bucket
+        return bucket
+
+    def _scan_buckets(self, query: str, max_distance: int) -> List[Tuple[str, int]]:
+        """(term, distance) for every term within max_distance, one NumPy DP per term length."""
+        query_codes = np.frombuffer(query.encode("utf-32-le"), dtype=np.uint32)
+        query_histogram = _histograms(query_codes[None, :])
+        results: List[Tuple[str, int]] = []
+        low = max(1, len(query) - max_distance)
+        for length in range(low, len(query) + max_distance + 1):
+            if length not in self._by_length:
+                continue
+            terms, matrix, histograms = self._length_bucket(length)
+            # A substitution changes the histograms' L1 difference by at most 2, an insertion
+            # or deletion by 1, and at least |length difference| edits are insertions or deletions
+            difference = np.abs(histograms - query_histogram).sum(axis=1)
+            bound = (difference + abs(length - len(query))) // 2
+            rows = np.flatnonzero(bound <= max_distance)
+            if not len(rows):
+                continue
+            distances = prefix_distances(query_codes, matrix[rows])[:, length]
+            for row, distance in zip(rows.tolist(), distances.tolist()):
+                if distance <= max_distance:
+                    results.append((terms[row], distance))
+        return results
+
+    def add_term(self, term: str) -> None:
+        """
+        Add a single vocabulary term.
+
+        Args:
+            term (str): Token to index
+        """
+        if not term or term in self._terms:
+            return
+        self._terms.add(term)
+        self._by_length.setdefault(len(term), []).append(term)
+        # Rebuilt on the next lookup that needs this length
+        self._matrices.pop(len(term), None)
+        for delete in self._generate_deletes(term, self.max_edit_distance):
+            self._deletes.setdefault(delete, set()).add(term)
+
+    def build(self, terms: Iterable[str]) -> None:
+        """
+        Add every term of a vocabulary.
+
+        Args:
+            terms (Iterable[str]): Tokens to index
+        """
+        for term in terms:
+            self.add_term(term)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._terms
+
+    def lookup(self, query: str, max_distance: int) -> List[Tuple[str, int]]:
+        """
+        Find vocabulary terms within max_distance edits of query.
+
+        Distances up to the index's max_edit_distance use the delete dictionary; larger ones
+        score the length buckets within range with the batched DP (see class docstring).
+
+        Args:
+            query (str): Term to look up
+            max_distance (int): Maximum Levenshtein distance
+
+        Returns:
+            List[Tuple[str, int]]: (term, distance) pairs sorted by distance, then term
+        """
+        if not query or max_distance < 0:
+            return []
+
+        if max_distance <= self.max_edit_distance:
+            candidates: Set[str] = set()
+            for delete in self._generate_deletes(query, max_distance):
+                candidates |= self._deletes.get(delete, set())
+            results: List[Tuple[str, int]] = []
+            for term in candidates:
+                distance = bounded_levenshtein(query, term, max_distance)
+                if distance <= max_distance:
+                    results.append((term, distance))
+        else:
+            results = self._scan_buckets(query, max_distance)
+
+        results.sort(key=lambda x: (x[1], x[0]))
+        return results
+
+    def similar_terms(self, query: str, min_similarity: float) -> List[Tuple[str, float]]:
+        """
+        Find vocabulary terms whose similarity ratio to query is at least min_similarity.
+
+        Uses the same ratio as FuzzySearcher: 1 - distance / max(len(query), len(term)).
+        A term can be at most len(query) / min_similarity long, which bounds the distance
+        that has to be searched.
+
+        Args:
+            query (str): Term to look up
+            min_similarity (float): Minimum similarity ratio (0.0 to 1.0)
+
+        Returns:
+            List[Tuple[str, float]]: (term, similarity) pairs, most similar first
+        """
+        if not query:
+            return []
+        if min_similarity <= 0:
+            max_distance = max((len(term) for term in self._terms), default=0) + len(query)
+        else:
+            max_distance = int((1 - min_similarity) / min_similarity * len(query) + 1e-9)
+
+        results: List[Tuple[str, float]] = []
+        for term, distance in self.lookup(query, max_distance):
+            similarity = 1.0 - distance / max(len(query), len(term))
+            if similarity >= min_similarity:
+                results.append((term, similarity))
+
+        results.sort(key=lambda x: (-x[1], x[0]))
+        return results
@@ -0,0 +1,129 @@
+import re
+from array import array
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Characters outside ASCII, folded to NUL in the bytes views
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _fold_ascii(text: str) -> bytes:
+    """Encode text as ASCII, one NUL byte per non-ASCII character."""
+    if text.isascii():
+        return text.encode("ascii")
+    return _NON_ASCII.sub("\x00", text).encode("ascii")
+
+
+class TextView:
+    """
+    A document kept in original case alongside a lowercase view, both computed once.
+
+    Case-insensitive searches run on the lowercase view instead of lowercasing the whole
+    document on every call. Lowercasing can lengthen a string (e.g. "İ" becomes two code
+    points), so positions found in the lowercase view are mapped back through an offset
+    table; it is only materialized when the lengths actually differ.
+    """
+
+    __slots__ = ("original", "folded", "_offsets", "_ascii_original", "_ascii_folded", "_cache")
+
+    def __init__(self, original: str):
+        self.original: str = original
+        self.folded: str = original.lower()
+        # folded index -> original index, None while the mapping is the identity
+        self._offsets: Optional[array] = None
+        if len(self.folded) != len(original):
+            offsets = array("I")
+            for index, char in enumerate(original):
+                offsets.extend([index] * len(char.lower()))
+            self._offsets = offsets
+        # ASCII-folded bytes views, built on first use
+        self._ascii_original: Optional[bytes] = None
+        self._ascii_folded: Optional[bytes] = None
+        # Per-document structures searchers derive from the text (e.g. suffix arrays)
+        self._cache: Dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.original)
+
+    def view(self, case_sensitive: bool) -> str:
+        """
+        Text to search for the given case mode, without copying.
+
+        Args:
+            case_sensitive (bool): Whether the search is case sensitive
+
+        Returns:
+            str: The original text, or the lowercase view
+        """
+        return self.original if case_sensitive else self.folded
+
+    def ascii_view(self, case_sensitive: bool) -> bytes:
+        """
+        ASCII-folded bytes of view(case_sensitive), for C-speed bytes searches.
+
+        Every non-ASCII character becomes a single NUL byte, so byte offsets equal
+        character offsets in the view and an ASCII pattern matches exactly where it
+        matches in the str view.
+
+        Args:
+            case_sensitive (bool): Whether the search is case sensitive
+
+        Returns:
+            bytes: One byte per character of the selected view
+        """
+        if case_sensitive:
+            if self._ascii_original is None:
+                self._ascii_original = _fold_ascii(self.original)
+            return self._ascii_original
+        if self._ascii_folded is None:
+            self._ascii_folded = _fold_ascii(self.folded)
+        return self._ascii_folded
+
+    def cached(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        A structure derived from this document, built on first request and kept with it.
+
+        Args:
+            key (Hashable): Identifies the structure (and the view it was built from)
+            build (Callable[[], Any]): Builds the structure when it isn't cached yet
+
+        Returns:
+            Any: The cached structure
+        """
+        value = self._cache.get(key)
+        if value is None:
+            value = build()
+            self._cache[key] = value
+        return value
+
+    def has_cached(self, key: Hashable) -> bool:
+        """Whether a structure is already kept under key."""
+        return key in self._cache
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Attach a structure built elsewhere (e.g. loaded from disk) under key."""
+        self._cache[key] = value
+
+    @property
+    def is_identity(self) -> bool:
+        """True if positions in the lowercase view equal positions in the original."""
+        return self._offsets is None
+
+    @property
+    def offsets(self) -> Optional[array]:
+        """Lowercase view index -> original index table, None while the mapping is the identity."""
+        return self._offsets
+
+    def to_original(self, start: int, end: int) -> Tuple[int, int]:
+        """
+        Map an inclusive span of the lowercase view to the original text.
+
+        Args:
+            start (int): Start index in the lowercase view
+            end (int): End index (inclusive) in the lowercase view
+
+        Returns:
+            Tuple[int, int]: The corresponding inclusive span in the original text
+        """
+        if self._offsets is None:
+            return start, end
+        return self._offsets[start], self._offsets[end]
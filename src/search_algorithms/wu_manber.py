@@ -0,0 +1,209 @@
+from typing import Dict, List, Optional, Tuple
+
+from .match_batch import MatchBatch
+from .pattern_searcher import (
+    CompiledMatcher,
+    PatternSearcher,
+    SearchMatch,
+    matches_from_positions,
+)
+from .text_view import TextView
+
+
+def default_block_size(min_length: int, pattern_count: int) -> int:
+    """
+    Block size B for the shift table.
+
+    Two characters are enough to tell most blocks apart for a few dozen keywords; once
+    the patterns put more than ~150 two-character blocks in the table, most text blocks
+    hit one of them and shifts collapse, so three are used (measured on CV text).
+
+    Args:
+        min_length (int): Length of the shortest pattern
+        pattern_count (int): Number of patterns
+
+    Returns:
+        int: Block size, never larger than min_length
+    """
+    if min_length < 2:
+        return 1
+    if min_length >= 4 and pattern_count * (min_length - 1) > 150:
+        return 3
+    return 2
+
+
+class WuManberTables:
+    """
+    Shift and hash tables over the first min_length characters of every pattern.
+
+    shift[block] is how far the search window can move when its last B characters are
+    block without skipping a possible match; blocks absent from the table allow the
+    full default shift. Windows with shift 0 end on the last block of some patterns'
+    prefixes, listed in hash[block], which are then verified against the text.
+    """
+
+    __slots__ = ("patterns", "min_length", "block_size", "default_shift", "shift", "hash")
+
+    def __init__(self, patterns: List[str], block_size: Optional[int] = None):
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        self.min_length = min(len(p) for p in patterns)
+        self.block_size = block_size or default_block_size(self.min_length, len(patterns))
+        self.block_size = min(self.block_size, self.min_length)
+        self.default_shift = self.min_length - self.block_size + 1
+
+        m = self.min_length
+        block = self.block_size
+        self.shift: Dict[str, int] = {}
+        self.hash: Dict[str, List[int]] = {}
+        for index, pattern in enumerate(self.patterns):
+            for end in range(block - 1, m):
+                key = pattern[end - block + 1 : end + 1]
+                distance = m - 1 - end
+                if distance < self.shift.get(key, self.default_shift):
+                    self.shift[key] = distance
+            self.hash.setdefault(pattern[m - block : m], []).append(index)
+
+    def scan(self, text: str) -> List[List[int]]:
+        """
+        Start positions of every pattern in text, overlapping ones included.
+
+        Args:
+            text (str): The text to search in
+
+        Returns:
+            List[List[int]]: Start positions per pattern, in pattern order
+        """
+        positions: List[List[int]] = [[] for _ in self.patterns]
+        m = self.min_length
+        block = self.block_size
+        default_shift = self.default_shift
+        shift_get = self.shift.get
+        patterns = self.patterns
+        startswith = text.startswith
+        text_length = len(text)
+
+        # pos is the last character of the window holding the first m characters of a candidate
+        pos = m - 1
+        while pos < text_length:
+            key = text[pos - block + 1 : pos + 1]
+            distance = shift_get(key, default_shift)
+            if distance:
+                pos += distance
+                continue
+            start = pos - m + 1
+            for index in self.hash[key]:
+                if startswith(patterns[index], start):
+                    positions[index].append(start)
+            pos += 1
+
+        return positions
+
+    def count(self, text: str) -> List[int]:
+        """
+        Occurrences of every pattern in text, the scan loop without position lists.
+
+        Args:
+            text (str): The text to search in
+
+        Returns:
+            List[int]: Occurrence count per pattern, in pattern order
+        """
+        counts = [0] * len(self.patterns)
+        m = self.min_length
+        block = self.block_size
+        default_shift = self.default_shift
+        shift_get = self.shift.get
+        patterns = self.patterns
+        startswith = text.startswith
+        text_length = len(text)
+
+        pos = m - 1
+        while pos < text_length:
+            key = text[pos - block + 1 : pos + 1]
+            distance = shift_get(key, default_shift)
+            if distance:
+                pos += distance
+                continue
+            start = pos - m + 1
+            for index in self.hash[key]:
+                if startswith(patterns[index], start):
+                    counts[index] += 1
+            pos += 1
+
+        return counts
+
+
+class CompiledWuManber(CompiledMatcher):
+    """Patterns with their Wu-Manber tables built once."""
+
+    __slots__ = ("tables",)
+
+    def __init__(self, searcher: "WuManberSearcher", patterns: List[str]):
+        super().__init__(searcher, patterns)
+        self.tables = (
+            WuManberTables(list(self.patterns), searcher.block_size)
+            if self.patterns
+            else None
+        )
+
+    def _positions(self, text: str) -> List[List[int]]:
+        if not text or self.tables is None:
+            return [[] for _ in self.patterns]
+        return self.tables.scan(text)
+
+    def search(self, text: str) -> List[SearchMatch]:
+        if not text or not self.patterns:
+            return []
+        return matches_from_positions(zip(self.patterns, self._positions(text)))
+
+    def search_view(self, text: TextView, case_sensitive: bool) -> List[SearchMatch]:
+        return self.search(text.view(case_sensitive))
+
+    def search_batch(self, text: str) -> MatchBatch:
+        return MatchBatch.from_positions(self.patterns, self._positions(text))
+
+    def search_view_batch(self, text: TextView, case_sensitive: bool) -> MatchBatch:
+        return self.search_batch(text.view(case_sensitive))
+
+    def count(self, text: str) -> Dict[str, int]:
+        if not text or self.tables is None:
+            return dict.fromkeys(self.patterns, 0)
+        return dict(zip(self.patterns, self.tables.count(text)))
+
+    def count_view(self, text: TextView, case_sensitive: bool) -> Dict[str, int]:
+        return self.count(text.view(case_sensitive))
+
+
+class WuManberSearcher(PatternSearcher):
+    """
+    Wu-Manber multi-pattern matching.
+
+    Like Boyer-Moore for a whole keyword set: the window moves by a shift looked up
+    from its last block of characters, so most of the text is never inspected.
+    Shifts are bounded by the shortest pattern, which makes it best for large
+    keyword lists (e.g. skill taxonomies) whose entries are 4 or more characters.
+    """
+
+    def __init__(self, block_size: Optional[int] = None):
+        """
+        Args:
+            block_size (Optional[int]): Characters per shift table block, chosen from
+                the pattern set if not given.
+        """
+        self.block_size = block_size
+
+    def compile(self, patterns: List[str]) -> CompiledWuManber:
+        """Build the shift and hash tables once."""
+        return CompiledWuManber(self, patterns)
+
+    def search_multiple(self, text: str, patterns: List[str]) -> List[SearchMatch]:
+        """Search for multiple patterns using Wu-Manber algorithm."""
+        return self.compile(patterns).search(text)
+
+    @property
+    def algorithm_name(self) -> str:
+        return "Wu-Manber"
+
+    @property
+    def is_exact_match(self) -> bool:
+        return True
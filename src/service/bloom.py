@@ -0,0 +1,72 @@
+import hashlib
+import threading
+from typing import Iterable, List, Optional
+import numpy as np
+
+
+class BloomSignatures:
+    """
+    One fixed-size Bloom filter per document over its distinct tokens, stored as rows of a
+    single uint8 bit matrix indexed by document id.
+
+    A keyword is checked against every document at once: the bits its tokens map to form a
+    byte mask, and a document can only hold the keyword if its row has all of those bits set.
+    False positives just mean a CV gets scanned; a document is never wrongly ruled out.
+    """
+
+    def __init__(self, num_bits: int = 8192, num_hashes: int = 3):
+        # ~1 KB per CV; a few hundred distinct tokens keep the false positive rate around 1%
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self._rows = np.zeros((0, num_bits // 8), dtype=np.uint8)
+        # Rows that hold a signature; documents registered without tokens are never excluded
+        self._filled = np.zeros(0, dtype=bool)
+        self._lock = threading.Lock()
+
+    def _positions(self, tokens: Iterable[str]) -> List[int]:
+        """Bit positions of tokens, by double hashing one 64-bit digest per token"""
+        positions = []
+        for token in tokens:
+            digest = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+            h1, h2 = digest & 0xFFFFFFFF, (digest >> 32) | 1
+            positions.extend((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+        return positions
+
+    def _signature(self, tokens: Iterable[str]) -> np.ndarray:
+        bits = np.zeros(self.num_bits, dtype=bool)
+        bits[self._positions(tokens)] = True
+        return np.packbits(bits, bitorder='little')
+
+    def add(self, doc_id: int, tokens: Iterable[str]) -> None:
+        """Store the signature of a document's distinct tokens"""
+        signature = self._signature(tokens)
+        with self._lock:
+            if doc_id >= len(self._rows):
+                capacity = max(doc_id + 1, 2 * len(self._rows), 64)
+                rows = np.zeros((capacity, self._rows.shape[1]), dtype=np.uint8)
+                rows[:len(self._rows)] = self._rows
+                filled = np.zeros(capacity, dtype=bool)
+                filled[:len(self._filled)] = self._filled
+                self._rows, self._filled = rows, filled
+            self._rows[doc_id] = signature
+            self._filled[doc_id] = True
+
+    def candidate_mask(self, tokens: List[str], doc_count: int) -> Optional[np.ndarray]:
+        """
+        Boolean array over document ids, False where a document certainly lacks one of tokens.
+        None if there are no tokens to test.
+        """
+        if not tokens:
+            return None
+        needed = self._signature(tokens)
+        columns = np.flatnonzero(needed)
+        needed = needed[columns]
+        # Growing replaces the arrays instead of resizing them, so these stay valid without the lock;
+        # rows past either one's length are treated as unknown
+        rows, filled = self._rows, self._filled
+
+        mask = np.ones(doc_count, dtype=bool)
+        known = min(doc_count, len(rows), len(filled))
+        block = rows[:known, columns]
+        mask[:known] = ((block & needed) == needed).all(axis=1) | ~filled[:known]
+        return mask
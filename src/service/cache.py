@@ -0,0 +1,71 @@
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with hit/miss counters"""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "entries": len(self._entries),
+        }
+
+
+class Posting:
+    """Per-keyword match counts over the corpus, stored as parallel doc-id / count arrays"""
+
+    __slots__ = ("doc_ids", "counts")
+
+    def __init__(self, entries: Iterable[Tuple[int, int]]):
+        self.doc_ids = array('I')
+        self.counts = array('I')
+        for doc_id, count in sorted(entries):
+            if count:
+                self.doc_ids.append(doc_id)
+                self.counts.append(count)
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def as_dict(self) -> Dict[int, int]:
+        return dict(zip(self.doc_ids, self.counts))
@@ -0,0 +1,48 @@
+import threading
+import time
+from typing import Optional, Tuple
+
+
+class CancellationToken:
+    """Cooperative cancellation flag shared between the GUI and worker threads"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._deadline: Optional[float] = None
+        # (cancelled, timed_out) frozen when the work returned, see latch()
+        self._latched: Optional[Tuple[bool, bool]] = None
+
+    def cancel(self):
+        """Request cancellation; workers stop at their next checkpoint"""
+        self._event.set()
+
+    def set_deadline(self, seconds: float):
+        """Treat the token as cancelled once `seconds` have passed from now"""
+        self._deadline = time.monotonic() + seconds
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, None if there is none"""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def latch(self):
+        """
+        Freeze cancelled and timed_out at their current values. Called once the work has returned,
+        so a search that finished before its deadline isn't reported as timed out when read later.
+        """
+        self._latched = (self.cancelled, self.timed_out)
+
+    @property
+    def timed_out(self) -> bool:
+        """The deadline passed without anyone cancelling explicitly"""
+        if self._latched is not None:
+            return self._latched[1]
+        return (self._deadline is not None and not self._event.is_set()
+                and time.monotonic() >= self._deadline)
+
+    @property
+    def cancelled(self) -> bool:
+        if self._latched is not None:
+            return self._latched[0]
+        return self._event.is_set() or (self._deadline is not None and time.monotonic() >= self._deadline)
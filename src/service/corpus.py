@@ -0,0 +1,167 @@
+import math
+import re
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from ..search_algorithms.symspell import SymSpellIndex
+from .bloom import BloomSignatures
+from .trigram import TrigramIndex
+
+# Word tokens used for document lengths, document frequencies and whole-word matching
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> Tuple[List[str], array]:
+    """Tokens of an already lowercase text and the character offset where each one starts"""
+    tokens = []
+    starts = array('I')
+    for match in TOKEN_PATTERN.finditer(text):
+        tokens.append(match.group())
+        starts.append(match.start())
+    return tokens, starts
+
+
+class TokenizedDocument:
+    """A CV as a sequence of vocabulary ids, with each token's start offset in the lowercase view"""
+
+    __slots__ = ("ids", "starts")
+
+    def __init__(self, ids: np.ndarray, starts: np.ndarray):
+        self.ids = ids
+        self.starts = starts
+
+    def find_sequence(self, sequence: List[int]) -> np.ndarray:
+        """Token indices where the id sequence starts, compared a whole column of tokens at a time"""
+        n = len(sequence)
+        last = len(self.ids) - n + 1
+        if n == 0 or last <= 0:
+            return np.empty(0, dtype=np.intp)
+        mask = self.ids[:last] == sequence[0]
+        for offset in range(1, n):
+            mask &= self.ids[offset:offset + last] == sequence[offset]
+        return np.flatnonzero(mask)
+
+
+class CorpusStats:
+    """
+    Corpus-level statistics gathered once during preprocessing.
+
+    Documents get a dense integer id; lengths live in a flat array('I') indexed by that id
+    and document frequencies in a single token -> count dict.
+    """
+
+    def __init__(self):
+        self.doc_ids: Dict[str, int] = {}
+        self.doc_lengths = array('I')
+        self.doc_freq: Dict[str, int] = {}
+        self.total_length = 0
+        # Vocabulary ids and each CV's token-id sequence, for whole-word matching
+        self.term_ids: Dict[str, int] = {}
+        self.doc_tokens: Dict[str, TokenizedDocument] = {}
+        # Trigram -> document bitmaps for skipping CVs that can't contain a keyword
+        self.trigram_index = TrigramIndex()
+        # Per-CV Bloom filters over tokens, for ruling out whole-word keywords in one vectorized check
+        self.token_filters = BloomSignatures()
+        # Symmetric-delete index over the vocabulary (doc_freq keys), built after preprocessing
+        self.vocabulary_index: Optional[SymSpellIndex] = None
+        # Searches register CVs parsed on demand from worker threads
+        self._lock = threading.Lock()
+
+    def add_document(self, doc_key: str, length: int, terms: Iterable[str]) -> int:
+        """Register a document and return its id"""
+        with self._lock:
+            return self._add_document(doc_key, length, terms)
+
+    def _add_document(self, doc_key: str, length: int, terms: Iterable[str]) -> int:
+        if doc_key in self.doc_ids:
+            return self.doc_ids[doc_key]
+        doc_id = len(self.doc_lengths)
+        self.doc_ids[doc_key] = doc_id
+        self.doc_lengths.append(length)
+        self.total_length += length
+        for term in terms:
+            if term not in self.doc_freq and self.vocabulary_index is not None:
+                self.vocabulary_index.add_term(term)
+            self.doc_freq[term] = self.doc_freq.get(term, 0) + 1
+        return doc_id
+
+    def add_tokenized(self, doc_key: str, tokens: List[str], starts: array) -> int:
+        """Register a document from its tokens (see tokenize) and keep its token-id sequence"""
+        with self._lock:
+            distinct = set(tokens)
+            doc_id = self._add_document(doc_key, len(tokens), distinct)
+            if doc_key not in self.doc_tokens:
+                self.token_filters.add(doc_id, distinct)
+                term_ids = self.term_ids
+                ids = np.fromiter((term_ids.setdefault(token, len(term_ids)) for token in tokens),
+                                  dtype=np.uint32, count=len(tokens))
+                self.doc_tokens[doc_key] = TokenizedDocument(ids, np.frombuffer(starts, dtype=np.uint32))
+            return doc_id
+
+    def sequence_ids(self, tokens: List[str]) -> Optional[List[int]]:
+        """Vocabulary ids of a keyword's tokens, None if any token occurs nowhere in the corpus"""
+        ids = [self.term_ids.get(token) for token in tokens]
+        return None if None in ids else ids
+
+    def build_vocabulary_index(self, max_edit_distance: int = 2) -> SymSpellIndex:
+        """Index every distinct token for fuzzy keyword expansion; later documents are added as they come"""
+        index = SymSpellIndex(max_edit_distance)
+        with self._lock:
+            index.build(self.doc_freq)
+            self.vocabulary_index = index
+        return index
+
+    @property
+    def document_count(self) -> int:
+        return len(self.doc_lengths)
+
+    @property
+    def average_length(self) -> float:
+        return self.total_length / len(self.doc_lengths) if self.doc_lengths else 0.0
+
+    def document_length(self, doc_key: str) -> Optional[int]:
+        doc_id = self.doc_ids.get(doc_key)
+        return None if doc_id is None else self.doc_lengths[doc_id]
+
+    def keyword_frequency(self, keyword: str) -> int:
+        """
+        Document frequency of a keyword.
+        Multi-token keywords (e.g. "c++", "node.js") use their rarest token, an upper bound
+        on how many documents can contain the whole keyword.
+        """
+        tokens = TOKEN_PATTERN.findall(keyword.lower())
+        if not tokens:
+            return 0
+        return min(self.doc_freq.get(token, 0) for token in tokens)
+
+
+class BM25Scorer:
+    """Okapi BM25 over per-keyword occurrence counts for one query"""
+
+    def __init__(self, stats: CorpusStats, keywords: List[str], total_documents: int,
+                 k1: float = 1.2, b: float = 0.75):
+        self.stats = stats
+        self.k1 = k1
+        self.b = b
+        # Fall back to the caller's document count when nothing has been preprocessed yet
+        n = max(stats.document_count, total_documents, 1)
+        self.idf = []
+        for keyword in keywords:
+            df = min(stats.keyword_frequency(keyword), n)
+            self.idf.append(math.log(1 + (n - df + 0.5) / (df + 0.5)))
+        self.average_length = stats.average_length
+
+    def upper_bound(self, keyword_index: int) -> float:
+        """Largest contribution a keyword can make to any document (tf -> infinity)"""
+        return self.idf[keyword_index] * (self.k1 + 1)
+
+    def term_score(self, keyword_index: int, tf: int, doc_length: Optional[int]) -> float:
+        if tf <= 0:
+            return 0.0
+        # Documents without stats (parsed on demand) are treated as average length
+        if doc_length is None or self.average_length <= 0:
+            norm = 1.0
+        else:
+            norm = 1 - self.b + self.b * doc_length / self.average_length
+        return self.idf[keyword_index] * tf * (self.k1 + 1) / (tf + self.k1 * norm)
@@ -1,21 +1,49 @@
 import os
+import re
 import time
 import concurrent.futures
+import numpy as np
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, Dict
-from collections import Counter
 from ..database.models import SessionLocal, ApplicationDetail
 from ..database.pdf_utils import prepare_texts_from_pdf, save_extracted_texts
 from ..database.parser import SectionScraper
 from ..database.parser import SectionScraper
-from ..search_algorithms.search_engine import SearchEngine, AlgorithmType, SearchMatch
+from ..search_algorithms.search_engine import SearchEngine, SearchConfig, AlgorithmType, SearchMatch
+from ..search_algorithms.pattern_searcher import CompiledMatcher
+from ..search_algorithms.planner import QueryPlanner
+from ..search_algorithms.aho_corasick import AhoCorasick
+from ..search_algorithms.text_view import TextView
+from ..search_algorithms.suffix_array import SuffixArrayIndex, SuffixArraySearcher
 from ..config.config import CV_FOLDER
+from .cancellation import CancellationToken
+from .topk import TopKCollector
+from .corpus import CorpusStats, BM25Scorer, TOKEN_PATTERN, tokenize
+from .trigram import trigrams
+from .cache import LRUCache, Posting
+
+# Ranking modes: raw occurrence counts, or BM25 relevance over precomputed corpus statistics
+SCORING_COUNT = "count"
+SCORING_BM25 = "bm25"
+
+# Pattern text cache files; v2 keeps the original case (v1 files were lowercased)
+PATTERN_CACHE_SUFFIX = "_pattern_v2.txt"
+# Suffix array of the lowercase pattern text, saved next to it
+SUFFIX_ARRAY_CACHE_SUFFIX = "_pattern_v2.sa.npy"
+# Query planner cost model fitted on this machine, kept in the cache folder
+PLANNER_CALIBRATION_FILE = "planner_calibration.json"
+
+def normalize_algorithm(algorithm: str) -> str:
+    """Map GUI labels ("KMP (Knuth-Morris-Pratt)", "Fuzzy Search") and enum values to one name"""
+    name = re.sub(r"\(.*?\)", "", algorithm).strip().lower()
+    name = re.sub(r"[^a-z0-9]+", "_", name).strip("_")
+    return "fuzzy" if name.startswith("fuzzy") else name
 
 @dataclass
 class CVMatch:
     applicant_id: int
     resume_id: str
-    score: int
+    score: float  # occurrence count, or BM25 relevance when ranking by relevance
     cv_path: str
     occurrences: Dict[str, int]
 
@@ -26,16 +54,126 @@ class ApplicantResult:
     resumes: List[CVMatch]
 
 class SearchService:
-    def __init__(self, max_workers: int = None):
+    def __init__(self, max_workers: int = None, build_suffix_arrays: bool = False, use_jit: bool = False,
+                 warm_up_jit: bool = False):
         self.max_workers = max_workers
-        self.engine = SearchEngine()
+        # use_jit runs KMP, Boyer-Moore and fuzzy matching as numba kernels when numba is installed,
+        # warm_up_jit compiles them here instead of during the first search
+        self.engine = SearchEngine(SearchConfig(use_jit=use_jit, warm_up_jit=warm_up_jit))
         # Keep both caches
-        self.text_cache_pattern = {}  # For searching
+        self.text_cache_pattern: Dict[str, TextView] = {}  # For searching, original case plus lowercase view
         self.text_cache_regex = {}
+        self.corpus = CorpusStats()  # Lengths and document frequencies for relevance ranking
+        self.fuzzy_min_similarity = 0.6
+        # Resolve single-word fuzzy keywords through the corpus vocabulary instead of sliding a window over text
+        self.use_vocabulary_fuzzy = True
+        # Opt-in: build (or load) and save each CV's suffix array while preprocessing, at 4 bytes per
+        # character on disk. Off, the Suffix Array and Auto algorithms build it in memory on first use
+        self.build_suffix_arrays = build_suffix_arrays
+        # Skip CVs whose trigrams rule out an exact keyword before scanning them
+        self.use_trigram_prefilter = True
+        # Skip CVs whose token Bloom filter rules out a whole-word keyword before scanning them
+        self.use_bloom_prefilter = True
+        # Whole-query results, valid for one corpus generation
+        self.corpus_generation = 0
+        self.result_cache = LRUCache(max_entries=128)
+        # Per-keyword postings, shared by overlapping queries ("python sql" -> "python sql aws")
+        self.posting_cache = LRUCache(max_entries=1024)
         self.section = SectionScraper()    # For structured data extraction
         self.decryptor = None
+
+    def invalidate_caches(self):
+        """Bump the corpus generation after preprocessing or ingestion so cached results are dropped"""
+        self.corpus_generation += 1
+        self.result_cache.clear()
+        self.posting_cache.clear()
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Hit-rate metrics for the query result cache"""
+        return self.result_cache.stats()
+
+    def posting_cache_stats(self) -> Dict[str, float]:
+        """Hit-rate metrics for the per-keyword posting cache"""
+        return self.posting_cache.stats()
+
+    def _fuzzy_settings(self) -> tuple:
+        """Everything that changes what a fuzzy keyword matches, for cache keys"""
+        vocabulary = self.use_vocabulary_fuzzy and self.corpus.vocabulary_index is not None
+        return self.fuzzy_min_similarity, vocabulary
+
+    def _exact_algorithm(self, name: str) -> AlgorithmType:
+        """The exact algorithm a keyword_plan entry stands for, the engine default for unknown names"""
+        try:
+            return AlgorithmType(name)
+        except ValueError:
+            return self.engine.config.exact_algorithm
+
+    def _prepare_suffix_array(self, text: TextView, cache_path: str, source_mtime: float):
+        """Attach the lowercase view's suffix array to text, from disk if it's up to date, else built and saved"""
+        key = (SuffixArraySearcher.CACHE_KEY, False)
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) > source_mtime:
+            try:
+                index = SuffixArrayIndex.load(cache_path, text.folded)
+            except (OSError, ValueError) as e:
+                print(f"Error loading suffix array {cache_path}: {e}")
+                index = None
+            if index is not None:
+                text.store(key, index)
+                return
+
+        index = SuffixArrayIndex(text.folded)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            index.save(cache_path)
+        except OSError as e:
+            print(f"Error saving suffix array {cache_path}: {e}")
+        text.store(key, index)
+
+    def _load_planner(self, calibration_path: str):
+        """Use the stored planner calibration, or benchmark a few CVs once to create it"""
+        if os.path.exists(calibration_path):
+            try:
+                self.engine.planner = QueryPlanner.load(calibration_path)
+                return
+            except (OSError, ValueError):
+                pass
+        texts = [text.folded for text in list(self.text_cache_pattern.values())[:5] if text.folded]
+        # Queries shaped like real ones: one, three and five common corpus words
+        common = sorted(self.corpus.doc_freq, key=self.corpus.doc_freq.get, reverse=True)[:5]
+        if not texts or not common:
+            return
+        samples = [(text, common[:count]) for text in texts for count in (1, 3, 5)]
+        self.engine.calibrate_planner(samples, calibration_path)
+
+    def _run_cancellable(self, func, items, cancel_token: Optional[CancellationToken] = None):
+        """
+        Run func over items in the worker pool, yielding (index, result) as work completes.
+        Once the token is cancelled, items that haven't started are dropped; the ones in flight
+        stop at their next checkpoint and their (partial) results are still yielded.
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {executor.submit(func, item): index for index, item in enumerate(items)}
+            pending = set(futures)
+            draining = False
+            while pending:
+                if not draining and cancel_token and cancel_token.cancelled:
+                    draining = True
+                    # cancel() only succeeds for futures that haven't started
+                    pending = {future for future in pending if not future.cancel()}
+                    if not pending:
+                        break
+                # Short timeout so a cancel request is noticed even while a long document is in flight
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield futures[future], future.result()
+        finally:
+            # Everything has finished unless the caller stopped iterating early, don't block on that
+            executor.shutdown(wait=False, cancel_futures=True)
         
-    def preprocess_cvs(self, progress_callback=None):
+    def preprocess_cvs(self, progress_callback=None, cancel_token: Optional[CancellationToken] = None):
         """Use pdf_utils functions directly to avoid redundant processing"""
         try:
             db = SessionLocal()
@@ -58,13 +196,17 @@ class SearchService:
         os.makedirs(cache_dir, exist_ok=True)
 
         def process_cv(resume):
+            if cancel_token and cancel_token.cancelled:
+                return None
+
             pdf_path = resume.cv_path
             if not os.path.exists(pdf_path):
                 return None
             
             # Define cache files for both formats
             cache_regex = os.path.join(cache_dir, f"{resume.cv_path}_regex.txt")
-            cache_pattern = os.path.join(cache_dir, f"{resume.cv_path}_pattern.txt")
+            cache_pattern = os.path.join(cache_dir, f"{resume.cv_path}{PATTERN_CACHE_SUFFIX}")
+            cache_suffix_array = os.path.join(cache_dir, f"{resume.cv_path}{SUFFIX_ARRAY_CACHE_SUFFIX}")
             
             # Check if we need to parse the PDF
             need_parsing = True
@@ -79,8 +221,11 @@ class SearchService:
                     with open(cache_regex, 'r', encoding='utf-8') as f:
                         text_regex = f.read()
                     with open(cache_pattern, 'r', encoding='utf-8') as f:
-                        text_pattern = f.read()
-                    return resume.cv_path, (text_regex, text_pattern)
+                        text_pattern = TextView(f.read())
+                    if self.build_suffix_arrays:
+                        self._prepare_suffix_array(text_pattern, cache_suffix_array, pdf_mtime)
+                    return (resume.cv_path, (text_regex, text_pattern), tokenize(text_pattern.folded),
+                            trigrams(text_pattern.folded))
             
             # Parse PDF if needed
             if need_parsing:
@@ -90,44 +235,96 @@ class SearchService:
                     return None
                     
                 text_regex, text_pattern = result
+                text_pattern = TextView(text_pattern)
                 
                 # Save both formats to cache
                 save_extracted_texts(pdf_path, cache_regex, cache_pattern)
+                if self.build_suffix_arrays:
+                    self._prepare_suffix_array(text_pattern, cache_suffix_array, os.path.getmtime(pdf_path))
                 
-                return resume.cv_path, (text_regex, text_pattern)
+                return (resume.cv_path, (text_regex, text_pattern), tokenize(text_pattern.folded),
+                        trigrams(text_pattern.folded))
                 
             return None
 
-        # Process CVs in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            for result in executor.map(process_cv, resumes):
-                if result:
-                    cv_id, (text_regex, text_pattern) = result
-                    self.text_cache_regex[cv_id] = text_regex
-                    self.text_cache_pattern[cv_id] = text_pattern
-                    
-                processed += 1
-                if progress_callback:
-                    progress = min(100, int((processed / total) * 100))
-                    progress_callback(progress)
+        # Statistics are rebuilt from scratch and swapped in once preprocessing is done
+        corpus = CorpusStats()
+        # Trigram sets are indexed in batches, holding them all at once would take a lot of memory
+        pending_trigrams = []
+
+        # Process CVs in parallel, stopping early if the user cancels
+        for _, result in self._run_cancellable(process_cv, resumes, cancel_token):
+            if result:
+                cv_id, (text_regex, text_pattern), (tokens, starts), grams = result
+                self.text_cache_regex[cv_id] = text_regex
+                self.text_cache_pattern[cv_id] = text_pattern
+                pending_trigrams.append((corpus.add_tokenized(cv_id, tokens, starts), grams))
+                if len(pending_trigrams) >= 256:
+                    corpus.trigram_index.build(pending_trigrams)
+                    pending_trigrams = []
+                
+            processed += 1
+            if progress_callback:
+                progress = min(100, int((processed / total) * 100))
+                progress_callback(progress)
 
-        if progress_callback:
+        corpus.trigram_index.build(pending_trigrams)
+        corpus.build_vocabulary_index()
+        self.corpus = corpus
+        self.invalidate_caches()
+
+        if not (cancel_token and cancel_token.cancelled):
+            self._load_planner(os.path.join(cache_dir, PLANNER_CALIBRATION_FILE))
+
+        if progress_callback and not (cancel_token and cancel_token.cancelled):
             progress_callback(100)
 
         elapsed = time.time() - start
         return elapsed, len(self.text_cache_pattern)
 
-    def search(self, keywords: str, algorithm: str, top_k: int, case: bool, progress_callback=None) -> Tuple[int, float, List[CVMatch]]:
+    def search(self, keywords: str, algorithm: str, top_k: int, case: bool, progress_callback=None,
+               cancel_token: Optional[CancellationToken] = None,
+               scoring: str = SCORING_COUNT,
+               time_budget: Optional[float] = None,
+               whole_words: bool = False) -> Tuple[int, float, List[CVMatch]]:
         """
         :param keywords: pattern(s) to search, space-separated
-        :param algorithm: 'fuzzy' or one of exact algorithm names
+        :param algorithm: 'fuzzy', 'hybrid' or one of exact algorithm names
         :param top_k: number of top CVs to return
+        :param cancel_token: optional token; when cancelled the search stops and returns partial results
+        :param scoring: 'count' ranks by total occurrences, 'bm25' by relevance using corpus statistics
+        :param time_budget: optional limit in seconds; when it runs out the best results so far are
+            returned and cancel_token.timed_out is set (a token is created if none is given). The token is
+            latched when the search returns, so it keeps reporting whether this search was cut short
+        :param whole_words: exact keywords only match whole words ("java" doesn't count inside "javascript")
         :return: total_scanned, search_time, list of CVMatch
         """
         # Split keywords by spaces
         keyword_list = [kw.strip() if case else kw.strip().lower() for kw in keywords.replace(',', ' ').split() if kw.strip()]
         if not keyword_list:
             return 0, 0.0, []
+
+        algorithm_name = normalize_algorithm(algorithm)
+        start_time = time.time()
+
+        # The deadline rides on the cancellation token, so every cancel checkpoint also enforces it
+        if time_budget is not None:
+            cancel_token = cancel_token or CancellationToken()
+            cancel_token.set_deadline(time_budget)
+
+        # Repeat queries are answered from the cache without touching the database.
+        # Keyword order doesn't change the ranking, repeats do (they double the count).
+        generation = self.corpus_generation
+        cache_key = (tuple(sorted(keyword_list)), algorithm_name, case, whole_words, self._fuzzy_settings(), scoring,
+                     generation)
+        cached = self.result_cache.get(cache_key)
+        # An entry computed for a larger top_k also answers smaller ones
+        if cached is not None and cached[0] >= top_k:
+            if cancel_token:
+                cancel_token.latch()
+            if progress_callback:
+                progress_callback(100)
+            return len(self.text_cache_pattern), time.time() - start_time, cached[1][:top_k]
             
         # Load resumes
         try:
@@ -139,13 +336,137 @@ class SearchService:
             db.close()
 
         total_scanned = len(self.text_cache_pattern)
-        start_time = time.time()
-        all_matches: List[CVMatch] = []
-        
-        # Initialize the processed variable before using it
-        processed = 0  # Add this line
-    
-        def process(resume) -> Optional[CVMatch]:
+
+        if algorithm_name == 'hybrid':
+            # Cheap exact pass over the whole corpus first; its postings are cached, so the ranking
+            # pass below only pays fuzzy cost for the keywords nobody's CV contains verbatim
+            exact_name = self.engine.config.exact_algorithm.value
+            exact_plan = [exact_name] * len(keyword_list)
+            self._rank(resumes, keyword_list, exact_plan, case, whole_words, 0, SCORING_COUNT, generation,
+                       progress_callback, (0, 50), cancel_token)
+            keyword_plan = []
+            for keyword in keyword_list:
+                posting = self.posting_cache.get(self._posting_key(keyword, exact_name, case, whole_words, generation))
+                # A missing posting means the exact pass didn't finish; stay exact rather than guess
+                keyword_plan.append('fuzzy' if posting is not None and len(posting) == 0 else exact_name)
+            progress_range = (50, 100)
+        else:
+            keyword_plan = [algorithm_name] * len(keyword_list)
+            progress_range = (0, 100)
+
+        top_matches = self._rank(resumes, keyword_list, keyword_plan, case, whole_words, top_k, scoring, generation,
+                                 progress_callback, progress_range, cancel_token)
+        elapsed = time.time() - start_time
+        # From here on cancelled / timed_out tell whether this search was cut short, not the current time
+        if cancel_token:
+            cancel_token.latch()
+
+        # Partial results, or results computed while the corpus changed underneath, aren't reusable
+        if not (cancel_token and cancel_token.cancelled) and generation == self.corpus_generation:
+            self.result_cache.put(cache_key, (top_k, top_matches))
+
+        return total_scanned, elapsed, list(top_matches)
+
+    def _posting_key(self, keyword: str, algorithm_name: str, case: bool, whole_words: bool, generation: int) -> tuple:
+        if algorithm_name == 'fuzzy':
+            # Fuzzy matching ignores the whole-word setting
+            return keyword, algorithm_name, case, self._fuzzy_settings(), generation
+        return keyword, algorithm_name, case, whole_words, generation
+
+    def _rank(self, resumes, keyword_list: List[str], keyword_plan: List[str], case: bool, whole_words: bool, top_k: int,
+              scoring: str, generation: int, progress_callback, progress_range: Tuple[int, int],
+              cancel_token: Optional[CancellationToken]) -> List[CVMatch]:
+        """
+        Scan resumes and return the top_k CVMatch objects.
+        keyword_plan holds the algorithm name used for each keyword ('fuzzy' or an exact algorithm).
+        """
+        processed = 0
+        scorer = BM25Scorer(self.corpus, keyword_list, len(resumes)) if scoring == SCORING_BM25 else None
+        corpus = self.corpus
+
+        # Keywords seen by earlier queries come straight from their postings, only the rest are scanned
+        posting_keys = [self._posting_key(keyword, name, case, whole_words, generation)
+                        for keyword, name in zip(keyword_list, keyword_plan)]
+        cached_counts: Dict[tuple, Dict[int, int]] = {}
+        for posting_key in posting_keys:
+            if posting_key not in cached_counts:
+                posting = self.posting_cache.get(posting_key)
+                if posting is not None:
+                    cached_counts[posting_key] = posting.as_dict()
+
+        # MaxScore: scan the keywords that can contribute most first, and keep the bound on
+        # what the not-yet-scanned keywords could still add (remaining_bound[i] covers scan_order[i:]).
+        # Cached keywords cost nothing, so they always go first.
+        scan_order = list(range(len(keyword_list)))
+        remaining_bound = [0.0] * (len(keyword_list) + 1)
+        if scorer:
+            scan_order.sort(key=lambda i: (posting_keys[i] not in cached_counts, -scorer.upper_bound(i)))
+            for position in range(len(scan_order) - 1, -1, -1):
+                remaining_bound[position] = remaining_bound[position + 1] + scorer.upper_bound(scan_order[position])
+
+        # Single-word fuzzy keywords resolve to the similar corpus words once per query; each document
+        # then only needs one exact multi-pattern pass for them instead of a sliding Levenshtein window
+        expansions: Dict[int, AhoCorasick] = {}
+        # The vocabulary is lowercase, so only case-insensitive searches can use it
+        vocabulary = corpus.vocabulary_index if self.use_vocabulary_fuzzy and not case else None
+        if vocabulary is not None:
+            for keyword_index, (keyword, name) in enumerate(zip(keyword_list, keyword_plan)):
+                if name != 'fuzzy' or posting_keys[keyword_index] in cached_counts:
+                    continue
+                if not TOKEN_PATTERN.fullmatch(keyword):
+                    continue
+                automaton = AhoCorasick()
+                for term, _ in vocabulary.similar_terms(keyword, self.fuzzy_min_similarity):
+                    automaton.add_pattern(term)
+                # Built here so the worker threads only ever read it
+                automaton.build()
+                expansions[keyword_index] = automaton
+
+        # Exact keywords only need to be scanned in CVs holding all of their trigrams
+        candidate_masks: Dict[int, np.ndarray] = {}
+        doc_count = corpus.document_count
+        if self.use_trigram_prefilter:
+            for keyword_index, (keyword, name) in enumerate(zip(keyword_list, keyword_plan)):
+                if name == 'fuzzy' or posting_keys[keyword_index] in cached_counts:
+                    continue
+                mask = corpus.trigram_index.candidate_mask(keyword.lower(), doc_count)
+                if mask is not None:
+                    candidate_masks[keyword_index] = mask
+        # Whole-word keywords also need every one of their tokens in the CV, which the Bloom filters
+        # answer for all CVs at once (and for keywords too short or non-ASCII for trigrams)
+        if whole_words and self.use_bloom_prefilter:
+            for keyword_index, (keyword, name) in enumerate(zip(keyword_list, keyword_plan)):
+                if name == 'fuzzy' or posting_keys[keyword_index] in cached_counts:
+                    continue
+                mask = corpus.token_filters.candidate_mask(TOKEN_PATTERN.findall(keyword.lower()), doc_count)
+                if mask is None:
+                    continue
+                if keyword_index in candidate_masks:
+                    mask &= candidate_masks[keyword_index]
+                candidate_masks[keyword_index] = mask
+
+        # Exact keywords are compiled (KMP / Boyer-Moore tables, automata) once per query, and the matchers
+        # are shared by every worker thread. Keywords using the same algorithm go into one matcher, so
+        # multi-pattern engines (Aho-Corasick, Wu-Manber, Shift-Or, ...) count them all in one pass.
+        # Whole-word matching keeps one matcher per keyword, only for keywords that don't map onto tokens
+        group_matchers: Dict[str, CompiledMatcher] = {}
+        keyword_groups: Dict[int, Tuple[str, str]] = {}  # keyword index -> (algorithm name, compiled pattern)
+        matchers: Dict[int, CompiledMatcher] = {}
+        group_keywords: Dict[str, List[str]] = {}
+        for keyword_index, (keyword, name) in enumerate(zip(keyword_list, keyword_plan)):
+            if name == 'fuzzy' or posting_keys[keyword_index] in cached_counts:
+                continue
+            if whole_words:
+                matchers[keyword_index] = self.engine.compile_exact(keyword, self._exact_algorithm(name),
+                                                                    case_sensitive=case)
+                continue
+            group_keywords.setdefault(name, []).append(keyword)
+            keyword_groups[keyword_index] = (name, keyword if case else keyword.lower())
+        for name, keywords in group_keywords.items():
+            group_matchers[name] = self.engine.compile_exact(keywords, self._exact_algorithm(name),
+                                                             case_sensitive=case)
+
+        def load_text(resume) -> Optional[TextView]:
             pdf_path = resume.cv_path
             if not os.path.exists(pdf_path):
                 return None
@@ -160,60 +481,213 @@ class SearchService:
                     return None
                     
                 # Get the pattern text (second item)
-                _, text = result
+                text = TextView(result[1])
                 self.text_cache_pattern[resume.cv_path] = text
-                
-            all_matches = []
+                # The corpus grew, results cached before this point are stale
+                self.invalidate_caches()
+
+            # Every scanned CV needs a document id for the postings and tokens for whole-word matching
+            if resume.cv_path not in corpus.doc_tokens:
+                doc_id = corpus.add_tokenized(resume.cv_path, *tokenize(text.folded))
+                corpus.trigram_index.add(doc_id, trigrams(text.folded))
+            return text
+
+        def count_expansion(text: TextView, automaton: AhoCorasick) -> int:
+            # Similar terms can overlap ("python" contains "pytho"), count each stretch of text once
+            count = 0
+            last_end = -1
+            for start, end, _ in sorted(automaton.search(text.folded), key=lambda m: (m[0], -m[1])):
+                if start > last_end:
+                    count += 1
+                    last_end = end
+            return min(count, self.engine.config.max_results)
+
+        def is_word_char(char: str) -> bool:
+            return bool(TOKEN_PATTERN.match(char))
+
+        def count_whole_word(text: TextView, doc_key: str, keyword: str, matcher: CompiledMatcher) -> int:
+            tokens = TOKEN_PATTERN.findall(keyword.lower())
+            document = corpus.doc_tokens.get(doc_key)
+            if tokens and document is not None and is_word_char(keyword[0]) and is_word_char(keyword[-1]):
+                # Match the keyword's token-id sequence, then check the text between the tokens
+                # (and the case) with one slice compare per hit
+                sequence = corpus.sequence_ids(tokens)
+                if sequence is None:
+                    return 0
+                hits = document.find_sequence(sequence)
+                if len(tokens) == 1 and not case:
+                    return min(len(hits), self.engine.config.max_results)
+                count = 0
+                for hit in hits.tolist():
+                    start = int(document.starts[hit])
+                    end = int(document.starts[hit + len(tokens) - 1]) + len(tokens[-1])
+                    if case:
+                        start, last = text.to_original(start, end - 1)
+                        matched = text.original[start:last + 1] == keyword
+                    else:
+                        matched = text.folded[start:end] == keyword
+                    count += matched
+                return min(count, self.engine.config.max_results)
+
+            # Keywords like "c++" don't map onto tokens, match them as text and check the boundaries.
+            # Every hit is needed before filtering (search_compiled stops at max_results), and the checks
+            # run on the searched view itself, so positions needn't be mapped back to the original text
+            view = text.view(case)
+            count = 0
+            for match in matcher.search_view(text, case):
+                if is_word_char(keyword[0]) and match.start_pos > 0 and is_word_char(view[match.start_pos - 1]):
+                    continue
+                if (is_word_char(keyword[-1]) and match.end_pos + 1 < len(view)
+                        and is_word_char(view[match.end_pos + 1])):
+                    continue
+                count += 1
+            return min(count, self.engine.config.max_results)
+
+        def count_keyword(text: TextView, keyword_index: int, doc_key: str,
+                          group_counts: Dict[str, Dict[str, int]]) -> int:
+            keyword = keyword_list[keyword_index]
+            algorithm_name = keyword_plan[keyword_index]
+            # Choose search mode
+            if keyword_index in expansions:
+                return count_expansion(text, expansions[keyword_index])
+            if algorithm_name == 'fuzzy':
+                # A long fuzzy scan stops mid-document at the deadline instead of holding the worker
+                time_left = cancel_token.remaining() if cancel_token else None
+                matches, _ = self.engine.search_fuzzy_only(text, keyword, self.fuzzy_min_similarity, time_left,
+                                                           case_sensitive=case)
+            else:
+                if whole_words:
+                    return count_whole_word(text, doc_key, keyword, matchers[keyword_index])
+                # Only the number of occurrences matters here, so skip building match objects. The first
+                # keyword of a group scanned in this document counts the whole group
+                name, pattern = keyword_groups[keyword_index]
+                counts = group_counts.get(name)
+                if counts is None:
+                    counts = self.engine.count_compiled(text, group_matchers[name], case_sensitive=case)
+                    group_counts[name] = counts
+                return min(counts.get(pattern, 0), self.engine.config.max_results)
+            return len(matches)
+
+        def score_resume(resume, partial: TopKCollector, scanned: Dict[tuple, list],
+                         incomplete: set) -> Optional[Tuple[float, List[int]]]:
+            """
+            Score and per-keyword occurrence counts for one resume.
+            None if it can't be read or provably can't make the top-k. When cancelled midway, the score
+            covers the keywords counted so far.
+            Fresh scan results go into scanned; keywords this resume was never scanned for go into incomplete.
+            """
+            text = None
+            doc_id = corpus.doc_ids.get(resume.cv_path)
+            counts = [0] * len(keyword_list)
+            doc_counts: Dict[tuple, int] = {}
+            group_counts: Dict[str, Dict[str, int]] = {}
+            score = 0
             
             # Search for each keyword separately
-            for keyword in keyword_list:
-                # Choose search mode
-                if algorithm.lower() == 'fuzzy':
-                    matches, _ = self.engine.search_fuzzy_only(text, keyword)
+            for position, keyword_index in enumerate(scan_order):
+                posting_key = posting_keys[keyword_index]
+                if cancel_token and cancel_token.cancelled:
+                    # Keep what this document already has, it still competes with a partial score
+                    incomplete.update(posting_keys[i] for i in scan_order[position:]
+                                      if posting_keys[i] not in cached_counts)
+                    break
+
+                if scorer:
+                    # Any worker's full heap is a valid bar, use the highest one available
+                    thresholds = [t for t in (partial.threshold(), collector.threshold()) if t is not None]
+                    if thresholds and score + remaining_bound[position] < max(thresholds):
+                        incomplete.update(posting_keys[i] for i in scan_order[position:]
+                                          if posting_keys[i] not in cached_counts)
+                        return None
+
+                if posting_key in cached_counts:
+                    count = cached_counts[posting_key].get(doc_id, 0) if doc_id is not None else 0
+                elif posting_key in doc_counts:
+                    count = doc_counts[posting_key]
+                elif (keyword_index in candidate_masks and doc_id is not None
+                      and doc_id < len(candidate_masks[keyword_index])
+                      and not candidate_masks[keyword_index][doc_id]):
+                    # Missing trigrams or tokens prove the keyword isn't there, no need to read the CV
+                    count = 0
+                    doc_counts[posting_key] = count
+                    scanned.setdefault(posting_key, []).append((doc_id, count))
                 else:
-                    try:
-                        algo = AlgorithmType(algorithm.lower())
-                    except ValueError:
-                        algo = self.engine.config.exact_algorithm
-                    matches, _ = self.engine.search_exact_only(text, keyword, algo)
-                    
-                all_matches.extend(matches)
-                
-            if not all_matches:
-                return None
+                    if text is None:
+                        text = load_text(resume)
+                        if text is None:
+                            return None
+                        doc_id = corpus.doc_ids.get(resume.cv_path)
+                    count = count_keyword(text, keyword_index, resume.cv_path, group_counts)
+                    doc_counts[posting_key] = count
+                    scanned.setdefault(posting_key, []).append((doc_id, count))
+                counts[keyword_index] = count
+                score += scorer.term_score(keyword_index, count, corpus.document_length(resume.cv_path)) if scorer else count
                 
-            # Count occurrences of each matched pattern
-            counts = Counter(match.pattern for match in all_matches)
-            score = sum(counts.values())
+            return score, counts
+
+        def process_chunk(chunk):
+            """Scan a slice of resumes into a partial top-k heap owned by this worker, plus its fresh postings"""
+            partial = TopKCollector(top_k)
+            scanned: Dict[tuple, list] = {}
+            incomplete: set = set()
+            for order, resume in chunk:
+                if cancel_token and cancel_token.cancelled:
+                    break
+                scored = score_resume(resume, partial, scanned, incomplete)
+                if scored and scored[0] > 0:
+                    # Only the counts are kept, CVMatch objects are built for the winners alone
+                    partial.offer(scored[0], order, (resume, scored[1]))
+            return partial, scanned, incomplete
+
+        # A few chunks per worker keeps the pool busy and the progress bar moving
+        workers = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+        chunk_size = max(1, -(-len(resumes) // (workers * 4)))
+        indexed = list(enumerate(resumes))
+        chunks = [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+        collector = TopKCollector(top_k)
+        scanned_postings: Dict[tuple, list] = {}
+        incomplete_keys: set = set()
+        progress_start, progress_end = progress_range
+
+        for index, (partial, scanned, incomplete) in self._run_cancellable(process_chunk, chunks, cancel_token):
+            collector.merge(partial)
+            for posting_key, entries in scanned.items():
+                scanned_postings.setdefault(posting_key, []).extend(entries)
+            incomplete_keys |= incomplete
             
-            return CVMatch(
-                applicant_id=resume.applicant_id,
-                resume_id=resume.cv_path,
-                score=score,
-                cv_path=pdf_path,
-                occurrences=dict(counts)
-            )
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            for match in executor.map(process, resumes):
-                if match:
-                    all_matches.append(match)
-                
-                # Move this outside the if condition so it counts all processed items
-                processed += 1
-                if progress_callback and total_scanned > 0:
-                    # Calculate percentage progress (0-100)
-                    progress = min(100, int((processed / len(resumes)) * 100))
-                    progress_callback(progress)
-
-        # Sort CVs directly by score
-        if progress_callback:
-            progress_callback(100)
+            # Move this outside the if condition so it counts all processed items
+            processed += len(chunks[index])
+            if progress_callback and resumes:
+                # Calculate percentage progress within this pass's share of the bar
+                progress = progress_start + int((processed / len(resumes)) * (progress_end - progress_start))
+                progress_callback(min(progress_end, progress))
 
-        all_matches.sort(key=lambda m: m.score, reverse=True)
-        elapsed = time.time() - start_time
+        if progress_callback and not (cancel_token and cancel_token.cancelled):
+            progress_callback(progress_end)
+
+        # A posting is only reusable if every CV was scanned for that keyword in this generation
+        if not (cancel_token and cancel_token.cancelled) and generation == self.corpus_generation:
+            for posting_key in set(posting_keys):
+                if posting_key not in cached_counts and posting_key not in incomplete_keys:
+                    self.posting_cache.put(posting_key, Posting(scanned_postings.get(posting_key, [])))
+
+        return [self._build_match(resume, keyword_list, counts, score)
+                for score, _, (resume, counts) in collector.results()]
 
-        return total_scanned, elapsed, all_matches[:top_k]
+    def _build_match(self, resume, keyword_list: List[str], counts: List[int], score) -> CVMatch:
+        """Materialize a CVMatch for a winning resume"""
+        occurrences: Dict[str, int] = {}
+        for keyword, count in zip(keyword_list, counts):
+            if count:
+                # Repeated keywords add up, same as counting matches by pattern
+                occurrences[keyword] = occurrences.get(keyword, 0) + count
+        return CVMatch(
+            applicant_id=resume.applicant_id,
+            resume_id=resume.cv_path,
+            score=score,
+            cv_path=resume.cv_path,
+            occurrences=occurrences
+        )
 
     def get_cv_details(self, cv_id: str) -> Dict:
         """Get structured information from a CV using regex text"""
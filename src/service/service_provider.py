@@ -19,6 +19,11 @@ def get_encrypt_service():
         _encrypt_service = EncryptService()
     return _encrypt_service
 
+def notify_corpus_changed():
+    """Tell the search service the CV corpus changed so its cached results are dropped"""
+    if _search_service is not None:
+        _search_service.invalidate_caches()
+
 def set_search_service(service):
     """Set the global search service instance"""
     global _search_service
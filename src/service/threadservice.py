@@ -1,5 +1,6 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 from typing import Callable, Any, Optional
+from .cancellation import CancellationToken
 
 class PreprocessThread(QThread):
     """Thread for preprocessing CVs in background"""
@@ -9,9 +10,20 @@ class PreprocessThread(QThread):
     def __init__(self, service):
         super().__init__()
         self.service = service
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """Stop preprocessing; CVs already extracted stay cached"""
+        self.cancel_token.cancel()
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_token.cancelled
         
     def run(self):
-        elapsed, count = self.service.preprocess_cvs(progress_callback=self.progress.emit)
+        elapsed, count = self.service.preprocess_cvs(
+            progress_callback=self.progress.emit,
+            cancel_token=self.cancel_token
+        )
         self.finished.emit(count, elapsed)
 
 class SearchThread(QThread):
@@ -19,13 +31,29 @@ class SearchThread(QThread):
     progress = pyqtSignal(int)
     results_ready = pyqtSignal(int, float, list)  # total_docs, elapsed_time, results
     
-    def __init__(self, service, keywords, algorithm, top_k, case_sensitive):
+    def __init__(self, service, keywords, algorithm, top_k, case_sensitive, scoring="count", time_budget=None,
+                 whole_words=False):
         super().__init__()
         self.service = service
         self.keywords = keywords
         self.algorithm = algorithm
         self.top_k = top_k
         self.case_sensitive = case_sensitive
+        self.scoring = scoring
+        self.time_budget = time_budget
+        self.whole_words = whole_words
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """Abandon the search; results_ready still fires with whatever was found so far"""
+        self.cancel_token.cancel()
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_token.cancelled
+
+    def timed_out(self) -> bool:
+        """The time budget ran out before the search returned, results are partial (latched by the service)"""
+        return self.cancel_token.timed_out
         
     def run(self):
         total, elapsed, results = self.service.search(
@@ -33,6 +61,10 @@ class SearchThread(QThread):
             self.algorithm,
             self.top_k,
             self.case_sensitive,
-            progress_callback=self.progress.emit
+            progress_callback=self.progress.emit,
+            cancel_token=self.cancel_token,
+            scoring=self.scoring,
+            time_budget=self.time_budget,
+            whole_words=self.whole_words
         )
-        self.results_ready.emit(total, elapsed, results)
\ No newline at end of file
+        self.results_ready.emit(total, elapsed, results)
@@ -0,0 +1,49 @@
+import heapq
+from typing import Any, List, Optional, Tuple
+
+
+class TopKCollector:
+    """
+    Bounded min-heap that keeps the k best (score, order) entries.
+
+    Ties on score go to the lower order (the resume that comes first in the database),
+    so results are deterministic no matter which worker finished first.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        # Entries are (score, -order, payload); order is unique so payloads are never compared
+        self._heap: List[Tuple[float, int, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def offer(self, score: float, order: int, payload: Any = None) -> bool:
+        """Add an entry if it beats the current k-th best; returns True if it was kept"""
+        if self.k <= 0:
+            return False
+        entry = (score, -order, payload)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def threshold(self) -> Optional[float]:
+        """Score a new entry has to beat once the heap is full, None while it still has room"""
+        if len(self._heap) < self.k:
+            return None
+        return self._heap[0][0]
+
+    def merge(self, other: "TopKCollector") -> None:
+        """Fold another (per-worker) collector into this one"""
+        for score, neg_order, payload in other._heap:
+            self.offer(score, -neg_order, payload)
+
+    def results(self) -> List[Tuple[float, int, Any]]:
+        """(score, order, payload) entries, best first"""
+        ranked = sorted(self._heap, key=lambda entry: (-entry[0], -entry[1]))
+        return [(score, -neg_order, payload) for score, neg_order, payload in ranked]
+
@@ -0,0 +1,71 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+
+
+def trigrams(text: str) -> Set[str]:
+    """Distinct 3-character substrings of a text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """
+    Trigram -> document bitmap over the lowercase pattern texts.
+
+    A document can only contain a keyword if it contains every trigram of the keyword, so
+    AND-ing the keyword's bitmaps gives a candidate set that is guaranteed to hold every real
+    match. Bitmaps are Python ints (bit i = document id i), which AND in C.
+    """
+
+    def __init__(self):
+        self._bitmaps: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def build(self, documents: Iterable[Tuple[int, Set[str]]]) -> None:
+        """Bulk-index (doc_id, trigrams) pairs; much cheaper than calling add() per document"""
+        postings: Dict[str, List[int]] = {}
+        doc_count = 0
+        for doc_id, grams in documents:
+            doc_count = max(doc_count, doc_id + 1)
+            for gram in grams:
+                postings.setdefault(gram, []).append(doc_id)
+
+        bits = np.zeros(doc_count, dtype=bool)
+        with self._lock:
+            for gram, doc_ids in postings.items():
+                bits[doc_ids] = True
+                bitmap = int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+                bits[doc_ids] = False
+                self._bitmaps[gram] = self._bitmaps.get(gram, 0) | bitmap
+
+    def add(self, doc_id: int, grams: Iterable[str]) -> None:
+        """Index one document (e.g. a CV parsed on demand)"""
+        bit = 1 << doc_id
+        with self._lock:
+            for gram in grams:
+                self._bitmaps[gram] = self._bitmaps.get(gram, 0) | bit
+
+    def candidate_mask(self, keyword: str, doc_count: int) -> Optional[np.ndarray]:
+        """candidates() as a boolean array indexed by document id, None if the index can't tell"""
+        bitmap = self.candidates(keyword)
+        if bitmap is None:
+            return None
+        # Documents registered after doc_count was read are left out (and get scanned)
+        bitmap &= (1 << doc_count) - 1
+        packed = np.frombuffer(bitmap.to_bytes((doc_count + 7) // 8, 'little'), dtype=np.uint8)
+        return np.unpackbits(packed, count=doc_count, bitorder='little').astype(bool)
+
+    def candidates(self, keyword: str) -> Optional[int]:
+        """
+        Bitmap of documents that may contain keyword (lowercase), or None if the index can't tell
+        (keywords shorter than a trigram, or non-ASCII ones whose lowercasing depends on context).
+        """
+        if len(keyword) < 3 or not keyword.isascii():
+            return None
+        bitmap = -1
+        # Rarest trigrams first, so the AND collapses to zero as early as possible
+        for gram in sorted(trigrams(keyword), key=lambda g: self._bitmaps.get(g, 0).bit_count()):
+            bitmap &= self._bitmaps.get(gram, 0)
+            if not bitmap:
+                break
+        return bitmap